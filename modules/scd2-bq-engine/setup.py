@@ -34,8 +34,13 @@ setup(
         "pyyaml>=6.0",
         "pydantic>=2.0.0",
         "click>=8.0.0",
+        "pandas>=2.0.0",
+        "numpy>=1.24.0",
     ],
     extras_require={
+        "arrow": [
+            "pyarrow>=14.0.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -3,7 +3,8 @@
 __version__ = "0.1.0"
 
 from scd2_bq_engine.config import SCD2Config
+from scd2_bq_engine.engine import SCD2Engine
 from scd2_bq_engine.generator import SCD2Generator
 
-__all__ = ["SCD2Config", "SCD2Generator", "__version__"]
+__all__ = ["SCD2Config", "SCD2Engine", "SCD2Generator", "__version__"]
 
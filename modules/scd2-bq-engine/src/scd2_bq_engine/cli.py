@@ -4,9 +4,10 @@ import sys
 from pathlib import Path
 
 import click
+import pandas as pd
 import yaml
 
-from scd2_bq_engine import SCD2Generator, __version__
+from scd2_bq_engine import SCD2Engine, SCD2Generator, __version__
 
 
 @click.group()
@@ -186,6 +187,76 @@ def init(dimension_name, source_table, business_keys, tracked_columns, output_fi
     click.echo()
 
 
+def _read_table(path):
+    """Read a Parquet or CSV file by its extension."""
+    if Path(path).suffix.lower() == '.parquet':
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+@main.command()
+@click.option(
+    '--config',
+    type=click.Path(exists=True),
+    required=True,
+    help='Path to YAML configuration file'
+)
+@click.option(
+    '--source',
+    type=click.Path(exists=True),
+    required=True,
+    help='Source snapshot file (.parquet or .csv)'
+)
+@click.option(
+    '--current',
+    type=click.Path(exists=True),
+    help='Existing dimension file (omit for the initial load)'
+)
+@click.option(
+    '--output-file',
+    type=click.Path(),
+    required=True,
+    help='Output dimension file (.parquet or .csv)'
+)
+@click.option(
+    '--as-of',
+    help='Load timestamp of the snapshot (default: now)'
+)
+def merge(config, source, current, output_file, as_of):
+    """Merge a source snapshot into a dimension locally, without BigQuery.
+    
+    Example:
+        scd2-bq merge --config dim_employee.yaml --source stg_employees.parquet \\
+            --current dim_employee.parquet --output-file dim_employee_new.parquet
+    """
+    try:
+        engine = SCD2Engine(SCD2Generator.from_yaml(config).config)
+        
+        click.echo(f"🔧 Merging {source} into {engine.config.dimension_name}...")
+        result = engine.merge(
+            _read_table(current) if current else None,
+            _read_table(source),
+            as_of=as_of
+        )
+        
+        dimension = result["dimension"]
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if output_path.suffix.lower() == '.parquet':
+            dimension.to_parquet(output_path, index=False)
+        else:
+            dimension.to_csv(output_path, index=False)
+        
+        click.echo(f"   • inserted: {len(result['inserted']):,} versions")
+        click.echo(f"   • closed: {len(result['closed']):,} versions")
+        click.echo(f"   • deleted: {len(result['deleted']):,} versions")
+        click.echo(f"📁 Output: {output_file} ({len(dimension):,} rows)")
+    
+    except Exception as e:
+        click.echo(f"❌ Error: {e}", err=True)
+        sys.exit(1)
+
+
 @main.command()
 def version():
     """Show version information."""
@@ -0,0 +1,296 @@
+"""In-process SCD2 merge engine.
+
+Applies the same SCD Type 2 logic as the generated SQLX to pandas
+DataFrames (or Arrow tables), so dimension builds can be run and verified
+locally without BigQuery.
+"""
+
+import hashlib
+import uuid
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from scd2_bq_engine.config import SCD2Config
+from scd2_bq_engine.generator import SCD2Generator
+
+
+# Effective-to timestamp of current versions, as in the SQLX template
+OPEN_END_TIMESTAMP = pd.Timestamp("9999-12-31 23:59:59")
+
+# Separator between tracked column values in the hashed string
+HASH_SEPARATOR = "|"
+
+# Load timestamp column appended by the SQLX template
+LOADED_AT_COL = "_loaded_at"
+
+
+def _cast_to_string(values: pd.Series) -> pd.Series:
+    """Format values like BigQuery's ``CAST(value AS STRING)``.
+    
+    Booleans become ``true``/``false``, floats drop a trailing ``.0``,
+    naive datetimes format as DATETIME and timezone-aware ones as UTC
+    TIMESTAMP (``+00`` suffix), with fractional seconds only when present.
+    Other values use their Python string form; nulls are left as nulls.
+    """
+    if pd.api.types.is_bool_dtype(values):
+        text = values.map({True: "true", False: "false"})
+    elif pd.api.types.is_float_dtype(values):
+        text = values.astype(str).str.removesuffix(".0")
+    elif pd.api.types.is_datetime64_any_dtype(values):
+        aware = getattr(values.dt, "tz", None) is not None
+        if aware:
+            values = values.dt.tz_convert("UTC")
+        fraction = values.dt.strftime(".%f").str.rstrip("0").str.rstrip(".")
+        text = values.dt.strftime("%Y-%m-%d %H:%M:%S") + fraction
+        if aware:
+            text = text + "+00"
+    else:
+        text = values.astype(str)
+    return text.where(values.notna(), None)
+
+
+def row_hashes(df: pd.DataFrame, columns: List[str], algorithm: str = "md5") -> np.ndarray:
+    """Hex digest of the tracked columns of every row.
+    
+    Matches the template's ``TO_HEX(MD5(CONCAT(COALESCE(CAST(col AS
+    STRING), ''), '|', ...)))``: values are cast to BigQuery's string
+    formatting for booleans, floats and timestamps, nulls hash as empty
+    strings and values are joined with ``|``. Other types (e.g. NUMERIC,
+    or Python objects in object columns) use their Python string form and
+    may hash differently from BigQuery. The string is built one column at
+    a time for all rows at once; only the digest itself runs per row.
+    
+    Args:
+        df: Rows to hash
+        columns: Tracked columns, in configuration order
+        algorithm: Hash algorithm ('md5' or 'sha256')
+    
+    Returns:
+        Object array of hex digests, one per row
+    """
+    text = None
+    for column in columns:
+        part = _cast_to_string(df[column]).fillna("")
+        text = part if text is None else text + HASH_SEPARATOR + part
+    
+    digest = getattr(hashlib, algorithm.lower())
+    return np.array([digest(value.encode("utf-8")).hexdigest() for value in text], dtype=object)
+
+
+def _to_pandas(table) -> pd.DataFrame:
+    """Convert a DataFrame or Arrow table to a DataFrame."""
+    if isinstance(table, pd.DataFrame):
+        return table
+    if hasattr(table, "to_pandas"):
+        return table.to_pandas()
+    raise TypeError(f"Expected a pandas DataFrame or pyarrow Table, got {type(table).__name__}")
+
+
+def _as_datetimes(values: pd.Series) -> pd.Series:
+    """Parse timestamp strings (e.g. from a CSV dimension) to datetimes.
+    
+    Parses at microsecond precision so the 9999-12-31 open end, which is
+    outside the nanosecond range, round-trips; nulls become NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    parsed = values.where(values.notna(), None).to_numpy().astype("datetime64[us]")
+    return pd.Series(parsed, index=values.index, name=values.name)
+
+
+def _as_bools(values: pd.Series) -> pd.Series:
+    """Parse ``True``/``False`` flags (e.g. from a CSV dimension) to booleans."""
+    if pd.api.types.is_bool_dtype(values):
+        return values.fillna(False).astype(bool)
+    return values.astype(str).str.lower().eq("true")
+
+
+def _key_index(df: pd.DataFrame, business_keys: List[str]) -> pd.Index:
+    """Hash index over the business key columns."""
+    if len(business_keys) == 1:
+        return pd.Index(df[business_keys[0]])
+    return pd.MultiIndex.from_frame(df[business_keys])
+
+
+class SCD2Engine:
+    """Merge a source snapshot into an SCD Type 2 dimension in memory.
+    
+    Uses the column conventions of SCD2Config: the surrogate key is kept
+    across versions of a business key (as in the SQLX template), and a
+    version is current between ``effective_from`` and ``effective_to``
+    9999-12-31 23:59:59. New business keys get the next integer keys when
+    the dimension is empty or integer-keyed, and UUID strings (like the
+    template's ``GENERATE_UUID()``) otherwise.
+    
+    Example:
+        >>> engine = SCD2Engine(config)
+        >>> result = engine.merge(dim_df, snapshot_df, as_of="2024-06-01")
+        >>> result["dimension"]
+    
+    Attributes:
+        config: SCD2 configuration object
+    """
+    
+    def __init__(self, config: SCD2Config):
+        """Initialize engine with configuration.
+        
+        Args:
+            config: SCD2Config object with dimension specification
+        
+        Raises:
+            ValueError: If the configuration is invalid
+        """
+        errors = SCD2Generator(config).validate_config()
+        if errors:
+            raise ValueError(f"Invalid SCD2 configuration: {'; '.join(errors)}")
+        self.config = config
+    
+    @property
+    def columns(self) -> List[str]:
+        """Dimension columns, in the order of the generated SQLX output."""
+        config = self.config
+        return (
+            [config.surrogate_key_name]
+            + config.business_keys
+            + config.tracked_columns
+            + [config.hash_col, config.effective_from_col, config.effective_to_col]
+            + [config.is_current_col]
+            + config.meta_columns
+            + [LOADED_AT_COL]
+        )
+    
+    def merge(
+        self,
+        current: Optional[Union[pd.DataFrame, "pyarrow.Table"]],
+        source: Union[pd.DataFrame, "pyarrow.Table"],
+        as_of: Optional[Union[str, pd.Timestamp]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """Apply one source snapshot to the dimension.
+        
+        Source rows are hash-joined to the current versions on the
+        business keys. New keys are inserted; keys whose tracked-column
+        hash changed have their current version closed out at ``as_of``
+        and a new version inserted. With ``soft_delete``, current versions
+        whose key is missing from the source are closed out as well.
+        Historical (non-current) versions pass through unchanged; emitted
+        versions get ``_loaded_at`` = ``as_of``. Effective-date, load and
+        current-flag columns stored as text (e.g. a CSV dimension) are
+        parsed back to timestamps and booleans.
+        
+        Args:
+            current: Existing dimension (None or empty for the initial load)
+            source: Source snapshot with the business keys, tracked and
+                meta columns (one row per business key)
+            as_of: Load timestamp of the snapshot (defaults to now)
+        
+        Returns:
+            Dictionary with the new ``dimension`` and the ``inserted``,
+            ``closed`` and ``deleted`` versions it contains
+        
+        Raises:
+            ValueError: If columns are missing or business keys repeat
+        """
+        config = self.config
+        columns = self.columns
+        as_of = pd.Timestamp.now() if as_of is None else pd.Timestamp(as_of)
+        
+        source = _to_pandas(source)
+        missing = [
+            column for column in config.business_keys + config.tracked_columns + config.meta_columns
+            if column not in source.columns
+        ]
+        if missing:
+            raise ValueError(f"Source is missing columns: {missing}")
+        
+        if current is None:
+            current = pd.DataFrame(columns=columns)
+        current = _to_pandas(current)
+        missing = [
+            column for column in columns
+            if column not in current.columns and column != LOADED_AT_COL
+        ]
+        if missing and len(current):
+            raise ValueError(f"Dimension is missing columns: {missing}")
+        current = current.reindex(columns=columns).reset_index(drop=True)
+        for column in (config.effective_from_col, config.effective_to_col, LOADED_AT_COL):
+            current[column] = _as_datetimes(current[column])
+        current[config.is_current_col] = _as_bools(current[config.is_current_col])
+        
+        is_open = current[config.is_current_col].to_numpy()
+        history = current[~is_open]
+        open_rows = current[is_open].reset_index(drop=True)
+        
+        # Hash-join source keys to current versions
+        target = _key_index(open_rows, config.business_keys)
+        if not target.is_unique:
+            raise ValueError("Dimension has more than one current version of a business key")
+        keys = _key_index(source, config.business_keys)
+        if not keys.is_unique:
+            raise ValueError("Source has more than one row per business key")
+        position = target.get_indexer(keys)
+        matched = position >= 0
+        
+        source_hash = row_hashes(source, config.tracked_columns, config.hash_algorithm)
+        open_hash = open_rows[config.hash_col].to_numpy(dtype=object)
+        changed = matched.copy()
+        changed[matched] = open_hash[position[matched]] != source_hash[matched]
+        
+        close = np.zeros(len(open_rows), dtype=bool)
+        close[position[changed]] = True
+        delete = np.zeros(len(open_rows), dtype=bool)
+        if config.soft_delete:
+            delete[:] = True
+            delete[position[matched]] = False
+        
+        # New versions keep the surrogate key of the version they replace
+        surrogate = open_rows[config.surrogate_key_name].to_numpy()
+        new_count = int((~matched).sum())
+        existing = current[config.surrogate_key_name]
+        integer_keys = not len(existing) or pd.api.types.is_integer_dtype(existing)
+        if integer_keys:
+            next_key = int(existing.max()) + 1 if len(existing) else 1
+            new_keys = np.arange(next_key, next_key + new_count, dtype=np.int64)
+        else:
+            new_keys = [str(uuid.uuid4()) for _ in range(new_count)]
+        insert = ~matched | changed
+        keys_out = np.empty(len(source), dtype=object)
+        keys_out[~matched] = new_keys
+        keys_out[changed] = surrogate[position[changed]]
+        keys_out = keys_out[insert]
+        
+        carried = config.business_keys + config.tracked_columns + config.meta_columns
+        inserted = source.loc[insert, carried].reset_index(drop=True)
+        if integer_keys:
+            keys_out = keys_out.astype(np.int64)
+        inserted[config.surrogate_key_name] = keys_out
+        inserted[config.hash_col] = source_hash[insert]
+        inserted[config.effective_from_col] = as_of
+        inserted[config.effective_to_col] = OPEN_END_TIMESTAMP
+        inserted[config.is_current_col] = True
+        inserted[LOADED_AT_COL] = as_of
+        inserted = inserted[columns]
+        
+        closed = self._close(open_rows[close], as_of)
+        deleted = self._close(open_rows[delete], as_of)
+        
+        parts = [
+            frame for frame in (history, open_rows[~(close | delete)], closed, deleted, inserted)
+            if len(frame)
+        ]
+        dimension = pd.concat(parts, ignore_index=True) if parts else current.iloc[:0]
+        return {
+            "dimension": dimension,
+            "inserted": inserted,
+            "closed": closed,
+            "deleted": deleted,
+        }
+    
+    def _close(self, versions: pd.DataFrame, as_of: pd.Timestamp) -> pd.DataFrame:
+        """Copy of versions ending at as_of and no longer current."""
+        versions = versions.reset_index(drop=True)
+        versions[self.config.effective_to_col] = as_of
+        versions[self.config.is_current_col] = False
+        versions[LOADED_AT_COL] = as_of
+        return versions
@@ -0,0 +1,251 @@
+"""Tests for SCD2Engine."""
+
+import hashlib
+import uuid
+
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+from scd2_bq_engine import SCD2Config, SCD2Engine
+from scd2_bq_engine.cli import main
+from scd2_bq_engine.engine import OPEN_END_TIMESTAMP, row_hashes
+
+
+@pytest.fixture
+def config():
+    """Employee dimension configuration."""
+    return SCD2Config(
+        dimension_name="dim_employee",
+        source_table="project.dataset.stg_employees",
+        business_keys=["employee_number"],
+        tracked_columns=["last_name", "department"],
+        meta_columns=["updated_at"]
+    )
+
+
+@pytest.fixture
+def snapshot():
+    """Initial source snapshot."""
+    return pd.DataFrame({
+        "employee_number": ["E1", "E2", "E3"],
+        "last_name": ["Smith", "Jones", None],
+        "department": ["HR", "IT", "IT"],
+        "updated_at": ["2024-01-01"] * 3,
+    })
+
+
+class TestRowHashes:
+    """Test row_hashes."""
+    
+    def test_matches_sqlx_concat(self, snapshot):
+        """Test hash of tracked values joined with '|', nulls as ''."""
+        hashes = row_hashes(snapshot, ["last_name", "department"])
+        
+        assert hashes[0] == hashlib.md5(b"Smith|HR").hexdigest()
+        assert hashes[2] == hashlib.md5(b"|IT").hexdigest()
+    
+    def test_sha256(self, snapshot):
+        """Test sha256 hashing."""
+        hashes = row_hashes(snapshot, ["department"], algorithm="SHA256")
+        
+        assert hashes[1] == hashlib.sha256(b"IT").hexdigest()
+    
+    def test_bigquery_cast_formatting(self):
+        """Test bools, floats and timestamps are cast like BigQuery."""
+        df = pd.DataFrame({
+            "flag": [True],
+            "rate": [20.0],
+            "seen_at": pd.to_datetime(["2024-01-01 08:30:00.250"]).tz_localize("UTC"),
+        })
+        hashes = row_hashes(df, ["flag", "rate", "seen_at"])
+        
+        assert hashes[0] == hashlib.md5(b"true|20|2024-01-01 08:30:00.25+00").hexdigest()
+
+
+class TestSCD2Engine:
+    """Test SCD2Engine class."""
+    
+    def test_invalid_config(self):
+        """Test engine rejects an invalid configuration."""
+        config = SCD2Config(
+            dimension_name="dim_test",
+            source_table="project.dataset.stg_test",
+            business_keys=["test_id"],
+            tracked_columns=["name"],
+            hash_algorithm="sha1"
+        )
+        
+        with pytest.raises(ValueError, match="Invalid hash algorithm"):
+            SCD2Engine(config)
+    
+    def test_initial_load(self, config, snapshot):
+        """Test initial load inserts one current version per key."""
+        result = SCD2Engine(config).merge(None, snapshot, as_of="2024-01-01")
+        dimension = result["dimension"]
+        
+        assert list(dimension.columns) == SCD2Engine(config).columns
+        assert dimension.columns[-1] == "_loaded_at"
+        assert list(dimension["dimension_key"]) == [1, 2, 3]
+        assert dimension["is_current"].all()
+        assert (dimension["effective_from"] == pd.Timestamp("2024-01-01")).all()
+        assert (dimension["effective_to"] == OPEN_END_TIMESTAMP).all()
+        assert len(result["inserted"]) == 3
+        assert len(result["closed"]) == 0
+        assert len(result["deleted"]) == 0
+    
+    def test_merge_changes(self, config, snapshot):
+        """Test changed keys are closed out, new keys inserted, missing keys deleted."""
+        engine = SCD2Engine(config)
+        dimension = engine.merge(None, snapshot, as_of="2024-01-01")["dimension"]
+        
+        update = pd.DataFrame({
+            "employee_number": ["E1", "E2", "E4"],
+            "last_name": ["Smith", "Brown", "Lee"],
+            "department": ["HR", "IT", "OPS"],
+            "updated_at": ["2024-02-01"] * 3,
+        })
+        result = engine.merge(dimension, update, as_of="2024-02-01")
+        dimension = result["dimension"]
+        
+        assert list(result["closed"]["employee_number"]) == ["E2"]
+        assert list(result["deleted"]["employee_number"]) == ["E3"]
+        assert sorted(result["inserted"]["employee_number"]) == ["E2", "E4"]
+        assert len(dimension) == 5
+        
+        current = dimension[dimension["is_current"]].set_index("employee_number")
+        assert sorted(current.index) == ["E1", "E2", "E4"]
+        assert current.loc["E1", "effective_from"] == pd.Timestamp("2024-01-01")
+        assert current.loc["E2", "last_name"] == "Brown"
+        assert current.loc["E2", "dimension_key"] == 2
+        assert current.loc["E4", "dimension_key"] == 4
+        
+        closed = dimension[~dimension["is_current"]]
+        assert (closed["effective_to"] == pd.Timestamp("2024-02-01")).all()
+    
+    def test_history_passes_through(self, config, snapshot):
+        """Test closed versions are kept on later merges."""
+        engine = SCD2Engine(config)
+        dimension = engine.merge(None, snapshot, as_of="2024-01-01")["dimension"]
+        dimension = engine.merge(dimension, snapshot.iloc[:2], as_of="2024-02-01")["dimension"]
+        result = engine.merge(dimension, snapshot.iloc[:2], as_of="2024-03-01")
+        
+        def ordered(frame):
+            return frame.sort_values(["dimension_key", "effective_from"]).reset_index(drop=True)
+        
+        pd.testing.assert_frame_equal(ordered(result["dimension"]), ordered(dimension))
+        assert len(result["inserted"]) == 0
+    
+    def test_without_soft_delete(self, config, snapshot):
+        """Test missing keys stay current when soft_delete is off."""
+        config.soft_delete = False
+        engine = SCD2Engine(config)
+        dimension = engine.merge(None, snapshot, as_of="2024-01-01")["dimension"]
+        result = engine.merge(dimension, snapshot.iloc[:1], as_of="2024-02-01")
+        
+        assert len(result["deleted"]) == 0
+        assert result["dimension"]["is_current"].all()
+    
+    def test_composite_business_keys(self, config):
+        """Test joining on more than one business key."""
+        config.business_keys = ["company", "employee_number"]
+        engine = SCD2Engine(config)
+        snapshot = pd.DataFrame({
+            "company": ["A", "B"],
+            "employee_number": ["E1", "E1"],
+            "last_name": ["Smith", "Jones"],
+            "department": ["HR", "IT"],
+            "updated_at": ["2024-01-01"] * 2,
+        })
+        dimension = engine.merge(None, snapshot, as_of="2024-01-01")["dimension"]
+        snapshot.loc[1, "department"] = "OPS"
+        result = engine.merge(dimension, snapshot, as_of="2024-02-01")
+        
+        assert list(result["closed"]["company"]) == ["B"]
+        assert list(result["inserted"]["dimension_key"]) == [2]
+    
+    def test_uuid_surrogate_keys(self, config, snapshot):
+        """Test merging into a dimension keyed by GENERATE_UUID()."""
+        engine = SCD2Engine(config)
+        dimension = engine.merge(None, snapshot, as_of="2024-01-01")["dimension"]
+        dimension["dimension_key"] = [str(uuid.uuid4()) for _ in range(len(dimension))]
+        
+        update = snapshot.copy()
+        update.loc[1, "department"] = "OPS"
+        update.loc[3] = ["E4", "Lee", "HR", "2024-02-01"]
+        result = engine.merge(dimension, update, as_of="2024-02-01")
+        
+        keys = dict(zip(dimension["employee_number"], dimension["dimension_key"]))
+        inserted = result["inserted"].set_index("employee_number")["dimension_key"]
+        assert inserted["E2"] == keys["E2"]
+        assert str(uuid.UUID(inserted["E4"])) == inserted["E4"]
+        assert inserted["E4"] not in keys.values()
+    
+    def test_duplicate_source_keys(self, config, snapshot):
+        """Test source with repeated business keys is rejected."""
+        with pytest.raises(ValueError, match="more than one row"):
+            SCD2Engine(config).merge(None, pd.concat([snapshot, snapshot]))
+    
+    def test_missing_source_columns(self, config, snapshot):
+        """Test source without a tracked column is rejected."""
+        with pytest.raises(ValueError, match="department"):
+            SCD2Engine(config).merge(None, snapshot.drop(columns=["department"]))
+    
+    def test_arrow_input(self, config, snapshot):
+        """Test Arrow tables are accepted."""
+        pa = pytest.importorskip("pyarrow")
+        result = SCD2Engine(config).merge(None, pa.Table.from_pandas(snapshot))
+        
+        assert len(result["dimension"]) == 3
+
+
+class TestMergeCommand:
+    """Test the merge CLI command."""
+    
+    def test_merge_files(self, tmp_path, config, snapshot):
+        """Test merging a CSV snapshot into a new dimension file."""
+        config_file = tmp_path / "dim_employee.yaml"
+        config_file.write_text(config.model_dump_json())
+        source_file = tmp_path / "stg_employees.csv"
+        snapshot.to_csv(source_file, index=False)
+        output_file = tmp_path / "dim_employee.csv"
+        
+        result = CliRunner().invoke(main, [
+            "merge", "--config", str(config_file), "--source", str(source_file),
+            "--output-file", str(output_file), "--as-of", "2024-01-01",
+        ])
+        
+        assert result.exit_code == 0, result.output
+        assert "inserted: 3 versions" in result.output
+        assert len(pd.read_csv(output_file)) == 3
+    
+    def test_csv_dimension_to_parquet(self, tmp_path, config, snapshot):
+        """Test a CSV dimension merges into a Parquet dimension."""
+        pytest.importorskip("pyarrow")
+        config_file = tmp_path / "dim_employee.yaml"
+        config_file.write_text(config.model_dump_json())
+        source_file = tmp_path / "stg_employees.csv"
+        snapshot.to_csv(source_file, index=False)
+        current_file = tmp_path / "dim_employee.csv"
+        SCD2Engine(config).merge(None, snapshot, as_of="2024-01-01")["dimension"].to_csv(
+            current_file, index=False
+        )
+        snapshot.loc[1, "department"] = "OPS"
+        snapshot.to_csv(source_file, index=False)
+        output_file = tmp_path / "dim_employee.parquet"
+        
+        result = CliRunner().invoke(main, [
+            "merge", "--config", str(config_file), "--source", str(source_file),
+            "--current", str(current_file), "--output-file", str(output_file),
+            "--as-of", "2024-02-01",
+        ])
+        
+        assert result.exit_code == 0, result.output
+        dimension = pd.read_parquet(output_file)
+        assert len(dimension) == 4
+        assert pd.api.types.is_datetime64_any_dtype(dimension["effective_to"])
+        assert (dimension.loc[dimension["is_current"], "effective_to"] == OPEN_END_TIMESTAMP).all()
+        assert list(dimension.loc[~dimension["is_current"], "employee_number"]) == ["E2"]
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
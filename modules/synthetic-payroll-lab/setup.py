@@ -30,11 +30,18 @@ setup(
         "faker>=20.0.0",
         "mimesis>=11.0.0",
         "pandas>=2.0.0",
+        "numpy>=1.24.0",
         "pydantic>=2.0.0",
         "pyyaml>=6.0",
         "click>=8.0.0",
     ],
     extras_require={
+        "arrow": [
+            "pyarrow>=14.0.0",
+        ],
+        "avro": [
+            "fastavro>=1.7.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -0,0 +1,238 @@
+"""Scale-factor benchmark suite for PayrollGenerator."""
+
+import contextlib
+import io
+import json
+import platform
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from typing import Any, Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from synthetic_payroll_lab import __version__
+from synthetic_payroll_lab.generator import PayrollGenerator
+from synthetic_payroll_lab.instrumentation import peak_rss_mb
+
+# Scale factors run by default: employees x months of history
+SCALE_EMPLOYEES = (1000, 10000, 50000, 200000)
+SCALE_MONTHS = (1, 3, 12)
+
+# Time-series domains generated per case, in dependency order
+BENCHMARK_DOMAINS = ("jobs", "cost_centers", "employees", "schedules", "timecards", "payroll_runs")
+
+# Timings shorter than this are too noisy to flag as regressions
+MIN_COMPARABLE_SECONDS = 0.05
+
+
+def run_case(
+    employees: int,
+    months: int,
+    engine: str = "numpy",
+    seed: int = 42,
+    format: str = "csv",
+    start_date: str = "2024-01-01"
+) -> Dict[str, Any]:
+    """Generate, apply chaos to and write one scale-factor case.
+
+    Domains are resolved in dependency order, so each is generated once and
+    timed on its own, followed by chaos and writing (to a temporary directory).
+
+    Args:
+        employees: Number of employees
+        months: Months of schedule/timecard/payroll history
+        engine: Generation engine ('python' or 'numpy')
+        seed: Random seed
+        format: Output format written
+        start_date: First day of the generated history
+
+    Returns:
+        Case result with rows, per-domain seconds, rows/sec and peak RSS
+    """
+    start = pd.Timestamp(start_date)
+    end = start + pd.DateOffset(months=months) - pd.Timedelta(days=1)
+    gen = PayrollGenerator(
+        employees=employees,
+        start_date=start.strftime("%Y-%m-%d"),
+        end_date=end.strftime("%Y-%m-%d"),
+        seed=seed,
+        engine=engine
+    )
+
+    domain_seconds: Dict[str, float] = {}
+    rows: Dict[str, int] = {}
+    with contextlib.redirect_stdout(io.StringIO()), tempfile.TemporaryDirectory() as output_dir:
+        for domain_name in BENCHMARK_DOMAINS:
+            started = time.perf_counter()
+            df = gen.get_domain(domain_name)
+            domain_seconds[domain_name] = time.perf_counter() - started
+            rows[domain_name] = len(df)
+
+        started = time.perf_counter()
+        domains = gen._apply_chaos(dict(gen._data_cache))
+        chaos_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        gen._write_domains(domains, output_dir, format)
+        write_seconds = time.perf_counter() - started
+
+    generate_seconds = sum(domain_seconds.values())
+    total_rows = sum(rows.values())
+    return {
+        "employees": employees,
+        "months": months,
+        "engine": engine,
+        "format": format,
+        "rows": rows,
+        "total_rows": total_rows,
+        "domain_seconds": domain_seconds,
+        "generate_seconds": generate_seconds,
+        "chaos_seconds": chaos_seconds,
+        "write_seconds": write_seconds,
+        "total_seconds": generate_seconds + chaos_seconds + write_seconds,
+        "rows_per_sec": total_rows / generate_seconds if generate_seconds else None,
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+
+def _run_case_task(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Process-pool entry point for run_case."""
+    return run_case(**kwargs)
+
+
+def run_suite(
+    employees: Iterable[int] = SCALE_EMPLOYEES,
+    months: Iterable[int] = SCALE_MONTHS,
+    engine: str = "numpy",
+    seed: int = 42,
+    format: str = "csv"
+) -> Dict[str, Any]:
+    """Run every employees x months case, each in a fresh process.
+
+    A fresh process per case keeps peak RSS attributable to that case.
+
+    Args:
+        employees: Employee counts to run
+        months: History lengths in months to run
+        engine: Generation engine ('python' or 'numpy')
+        seed: Random seed
+        format: Output format written
+
+    Returns:
+        Results document with environment metadata and one entry per case
+    """
+    cases = []
+    for num_employees in employees:
+        for num_months in months:
+            print(f"⏱️  {num_employees:,} employees × {num_months} month(s) [{engine}]...")
+            kwargs = {
+                "employees": num_employees,
+                "months": num_months,
+                "engine": engine,
+                "seed": seed,
+                "format": format
+            }
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+                case = executor.submit(_run_case_task, kwargs).result()
+            print(
+                f"   {case['total_rows']:,} rows, {case['rows_per_sec'] or 0:,.0f} rows/sec, "
+                f"{case['total_seconds']:.2f}s total, peak RSS {case['peak_rss_mb'] or 0:,.0f} MB"
+            )
+            cases.append(case)
+
+    return {
+        "metadata": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "synthetic_payroll_lab": __version__,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "platform": platform.platform()
+        },
+        "cases": cases
+    }
+
+
+def _case_key(case: Dict[str, Any]) -> tuple:
+    return (case["employees"], case["months"], case["engine"], case["format"])
+
+
+def compare(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = 0.10
+) -> List[Dict[str, Any]]:
+    """Flag cases that regressed against a baseline results document.
+
+    A case regresses when rows/sec drops, or peak RSS, a domain's wall
+    time, chaos time or write time grows, by more than ``tolerance``.
+    Timings under MIN_COMPARABLE_SECONDS in both runs are ignored.
+
+    Args:
+        results: Current results from ``run_suite``
+        baseline: Saved results to compare against
+        tolerance: Allowed relative change (0.10 = 10%)
+
+    Returns:
+        One entry per regressed metric with the baseline and current values
+    """
+    baseline_cases = {_case_key(case): case for case in baseline.get("cases", [])}
+    regressions = []
+
+    def check(case, metric, current, previous, higher_is_better=False):
+        if current is None or not previous:
+            return
+        change = (current - previous) / previous
+        regressed = change < -tolerance if higher_is_better else change > tolerance
+        if regressed:
+            regressions.append({
+                "employees": case["employees"],
+                "months": case["months"],
+                "engine": case["engine"],
+                "metric": metric,
+                "baseline": previous,
+                "current": current,
+                "change": change
+            })
+
+    for case in results.get("cases", []):
+        previous = baseline_cases.get(_case_key(case))
+        if previous is None:
+            continue
+
+        check(case, "rows_per_sec", case["rows_per_sec"], previous["rows_per_sec"], True)
+        check(case, "peak_rss_mb", case["peak_rss_mb"], previous["peak_rss_mb"])
+
+        timings = {f"domain_seconds.{name}": seconds for name, seconds in case["domain_seconds"].items()}
+        timings["chaos_seconds"] = case["chaos_seconds"]
+        timings["write_seconds"] = case["write_seconds"]
+        previous_timings = {
+            f"domain_seconds.{name}": seconds for name, seconds in previous["domain_seconds"].items()
+        }
+        previous_timings["chaos_seconds"] = previous["chaos_seconds"]
+        previous_timings["write_seconds"] = previous["write_seconds"]
+        for metric, seconds in timings.items():
+            previous_seconds = previous_timings.get(metric)
+            if previous_seconds is None:
+                continue
+            if max(seconds, previous_seconds) < MIN_COMPARABLE_SECONDS:
+                continue
+            check(case, metric, seconds, previous_seconds)
+
+    return regressions
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    """Write a results document as JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Read a results document written by ``save_results``."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
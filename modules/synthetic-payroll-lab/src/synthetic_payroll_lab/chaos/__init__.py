@@ -5,12 +5,16 @@ from synthetic_payroll_lab.chaos.nulls import NullInjector
 from synthetic_payroll_lab.chaos.late_arrivals import LateArrivalInjector
 from synthetic_payroll_lab.chaos.schema_drift import SchemaDriftInjector
 from synthetic_payroll_lab.chaos.fk_orphans import FKOrphanInjector
+from synthetic_payroll_lab.chaos.timezones import TimezoneErrorInjector
+from synthetic_payroll_lab.chaos.pipeline import ChaosPipeline
 
 __all__ = [
     "DuplicateInjector",
     "NullInjector",
     "LateArrivalInjector",
     "SchemaDriftInjector",
-    "FKOrphanInjector"
+    "FKOrphanInjector",
+    "TimezoneErrorInjector",
+    "ChaosPipeline"
 ]
 
@@ -1,15 +1,18 @@
 """Duplicate row injector."""
 
-import random
+from typing import Optional
+
+import numpy as np
 import pandas as pd
 
+from synthetic_payroll_lab.random_state import SeedLike, make_rng
+
 
 class DuplicateInjector:
     """Inject duplicate rows to simulate data quality issues."""
     
-    def __init__(self, seed: int = None):
-        if seed:
-            random.seed(seed)
+    def __init__(self, seed: SeedLike = None):
+        self.rng = make_rng(seed)
     
     def inject(self, df: pd.DataFrame, rate: float = 0.02) -> pd.DataFrame:
         """Inject duplicate rows into DataFrame.
@@ -21,24 +24,32 @@ class DuplicateInjector:
         Returns:
             DataFrame with duplicates injected
         """
-        if rate <= 0 or df.empty:
+        order = self.plan(len(df), rate)
+        if order is None:
             return df
+        return df.take(order).reset_index(drop=True)
+    
+    def plan(self, num_rows: int, rate: float = 0.02) -> Optional[np.ndarray]:
+        """Plan duplicate injection as a row order over the input.
         
-        # Calculate number of duplicates to inject
-        num_duplicates = int(len(df) * rate)
-        
-        if num_duplicates == 0:
-            return df
+        Each duplicated row is inserted again at a random position, so the
+        copies are mixed throughout without reshuffling every row.
         
-        # Randomly select rows to duplicate
-        duplicate_indices = random.sample(range(len(df)), min(num_duplicates, len(df)))
-        duplicates = df.iloc[duplicate_indices].copy()
+        Args:
+            num_rows: Number of input rows
+            rate: Percentage of rows to duplicate (0.0-1.0)
         
-        # Append duplicates
-        result = pd.concat([df, duplicates], ignore_index=True)
+        Returns:
+            Input row positions in output order, or None when nothing is duplicated
+        """
+        # Calculate number of duplicates to inject
+        num_duplicates = min(int(num_rows * rate), num_rows)
         
-        # Shuffle to mix duplicates throughout
-        result = result.sample(frac=1.0).reset_index(drop=True)
+        if rate <= 0 or num_duplicates == 0:
+            return None
         
-        return result
+        # Randomly select rows to duplicate and where their copies go
+        duplicate_positions = self.rng.choice(num_rows, num_duplicates, replace=False)
+        insert_at = np.sort(self.rng.integers(0, num_rows + 1, size=num_duplicates))
+        return np.insert(np.arange(num_rows), insert_at, duplicate_positions)
 
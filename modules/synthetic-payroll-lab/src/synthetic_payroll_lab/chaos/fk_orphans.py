@@ -1,15 +1,17 @@
 """Foreign key orphan injector."""
 
-import random
+import numpy as np
 import pandas as pd
 
+from synthetic_payroll_lab.compact import COMPACT_ATTR, ID_FORMATS
+from synthetic_payroll_lab.random_state import SeedLike, make_rng
+
 
 class FKOrphanInjector:
     """Create orphaned foreign key references."""
     
-    def __init__(self, seed: int = None):
-        if seed:
-            random.seed(seed)
+    def __init__(self, seed: SeedLike = None):
+        self.rng = make_rng(seed)
     
     def inject(
         self, 
@@ -31,38 +33,7 @@ class FKOrphanInjector:
             return df
         
         result = df.copy()
-        
-        # Calculate number of orphans to create
-        num_orphans = int(len(result) * rate)
-        
-        if num_orphans == 0:
-            return result
-        
-        # Select random rows to orphan
-        orphan_indices = random.sample(range(len(result)), num_orphans)
-        
-        # Generate fake FK values that don't exist
-        for idx in orphan_indices:
-            current_value = result.loc[idx, fk_column]
-            
-            if pd.isna(current_value):
-                continue
-            
-            # Generate an orphaned value
-            if isinstance(current_value, str):
-                if current_value.startswith('EMP'):
-                    # Employee ID - generate non-existent one
-                    result.loc[idx, fk_column] = f'EMP{random.randint(900000, 999999):06d}'
-                elif current_value.startswith('CC'):
-                    # Cost center - generate non-existent one
-                    result.loc[idx, fk_column] = f'CC{random.randint(9000, 9999):04d}'
-                else:
-                    # Generic - append '_INVALID'
-                    result.loc[idx, fk_column] = f'{current_value}_INVALID'
-            else:
-                # Numeric FK - use very large number
-                result.loc[idx, fk_column] = 999999
-        
+        self.inject_in_place(result, fk_column, rate)
         return result
     
     def inject_multiple(
@@ -81,11 +52,79 @@ class FKOrphanInjector:
         Returns:
             DataFrame with orphaned FKs
         """
+        if rate <= 0 or df.empty:
+            return df.copy()
+        
+        # One copy shared by all columns
         result = df.copy()
         
         for fk_col in fk_columns:
             if fk_col in result.columns:
-                result = self.inject(result, fk_col, rate)
+                self.inject_in_place(result, fk_col, rate)
         
         return result
-
+    
+    def inject_in_place(self, df: pd.DataFrame, fk_column: str, rate: float = 0.01) -> None:
+        """Orphan a sample of fk_column without copying df.
+        
+        Sampled non-null values are classified as employee IDs (``EMP``),
+        cost centers (``CC``), other strings or numbers, and each class is
+        written with a single positional assignment.
+        """
+        if rate <= 0 or df.empty or fk_column not in df.columns:
+            return
+        
+        result = df
+        
+        # Select random rows to orphan
+        num_orphans = int(len(result) * rate)
+        if num_orphans == 0:
+            return
+        positions = np.sort(self.rng.choice(len(result), num_orphans, replace=False))
+        col = result.columns.get_loc(fk_column)
+        
+        values = result[fk_column].iloc[positions]
+        present = values.notna().to_numpy()
+        positions, values = positions[present], values[present]
+        
+        if pd.api.types.is_numeric_dtype(values):
+            compacted = result.attrs.get(COMPACT_ATTR) or {}
+            prefix = ID_FORMATS[fk_column][0] if fk_column in compacted.get("ids", ()) else None
+            if prefix == 'EMP':
+                # Compact employee ID - same draws as the string form
+                result.iloc[positions, col] = self.rng.integers(900000, 1000000, size=len(positions))
+            elif prefix == 'CC':
+                # Compact cost center - same draws as the string form
+                result.iloc[positions, col] = self.rng.integers(9000, 10000, size=len(positions))
+            else:
+                # Numeric FK - use very large number
+                result.iloc[positions, col] = 999999
+            return
+        
+        is_str = np.array([isinstance(value, str) for value in values], dtype=bool)
+        text = values.astype(object).where(is_str, '')
+        is_emp = is_str & text.str.startswith('EMP').to_numpy()
+        is_cc = is_str & ~is_emp & text.str.startswith('CC').to_numpy()
+        is_other = is_str & ~is_emp & ~is_cc
+        
+        orphans = np.empty(len(positions), dtype=object)
+        # Employee ID - generate non-existent one
+        if is_emp.any():
+            numbers = self.rng.integers(900000, 1000000, size=is_emp.sum()).astype(str)
+            orphans[is_emp] = np.char.add('EMP', np.char.zfill(numbers, 6))
+        # Cost center - generate non-existent one
+        if is_cc.any():
+            numbers = self.rng.integers(9000, 10000, size=is_cc.sum()).astype(str)
+            orphans[is_cc] = np.char.add('CC', np.char.zfill(numbers, 4))
+        # Generic - append '_INVALID'
+        if is_other.any():
+            orphans[is_other] = (text[is_other] + '_INVALID').to_numpy()
+        # Non-string values in an object column - use very large number
+        orphans[~is_str] = 999999
+        
+        if isinstance(result[fk_column].dtype, pd.CategoricalDtype):
+            # Compact enumerations need the orphan values as categories first
+            categories = result[fk_column].cat.categories
+            new_categories = pd.unique(orphans[~pd.Index(orphans).isin(categories)])
+            result[fk_column] = result[fk_column].cat.add_categories(new_categories)
+        result.iloc[positions, col] = orphans
@@ -1,66 +1,119 @@
 """Late arrival fact injector."""
 
-import random
-from datetime import timedelta
+from typing import Optional, Sequence
+
+import numpy as np
 import pandas as pd
 
+from synthetic_payroll_lab.random_state import SeedLike, make_rng
+
+
+# Supported lag day distributions
+LAG_DISTRIBUTIONS = ("uniform", "geometric", "empirical")
+
 
 class LateArrivalInjector:
     """Mark records as late-arriving to simulate delayed data."""
     
-    def __init__(self, seed: int = None):
-        if seed:
-            random.seed(seed)
+    def __init__(self, seed: SeedLike = None):
+        self.rng = make_rng(seed)
     
     def inject(
-        self, 
-        df: pd.DataFrame, 
+        self,
+        df: pd.DataFrame,
         rate: float = 0.15,
         date_column: str = 'work_date',
-        max_lag_days: int = 3
+        max_lag_days: int = 3,
+        lag_distribution: str = 'uniform',
+        lag_p: float = 0.5,
+        lag_weights: Optional[Sequence[float]] = None
     ) -> pd.DataFrame:
         """Mark records as late-arriving.
         
+        Late rows are picked with one sample, their lags are drawn as one
+        integer array and load dates are computed with a single datetime64
+        addition; on-time rows load on their own date.
+        
         Args:
             df: Input DataFrame
             rate: Percentage of records that arrive late (0.0-1.0)
             date_column: Name of the date column
             max_lag_days: Maximum days late (1-7)
+            lag_distribution: 'uniform' over 1..max_lag_days, 'geometric'
+                (capped at max_lag_days) or 'empirical' (from lag_weights)
+            lag_p: Success probability of the geometric distribution
+            lag_weights: Relative frequency of lags of 1, 2, ... days for the
+                empirical distribution
         
         Returns:
             DataFrame with late_arrival_flag and simulated load dates
         """
+        if lag_distribution not in LAG_DISTRIBUTIONS:
+            raise ValueError(
+                f"lag_distribution must be one of {LAG_DISTRIBUTIONS}: {lag_distribution}"
+            )
         if rate <= 0 or df.empty or date_column not in df.columns:
             return df
         
         result = df.copy()
+        self.inject_in_place(
+            result, rate, date_column, max_lag_days, lag_distribution, lag_p, lag_weights
+        )
+        return result
+    
+    def inject_in_place(
+        self,
+        df: pd.DataFrame,
+        rate: float = 0.15,
+        date_column: str = 'work_date',
+        max_lag_days: int = 3,
+        lag_distribution: str = 'uniform',
+        lag_p: float = 0.5,
+        lag_weights: Optional[Sequence[float]] = None
+    ) -> None:
+        """Add late_arrival_flag and _simulated_load_date to df without copying it.
+        
+        Takes the same arguments as ``inject``.
+        """
+        if lag_distribution not in LAG_DISTRIBUTIONS:
+            raise ValueError(
+                f"lag_distribution must be one of {LAG_DISTRIBUTIONS}: {lag_distribution}"
+            )
+        if rate <= 0 or df.empty or date_column not in df.columns:
+            return
         
-        # Add late arrival tracking columns
-        result['late_arrival_flag'] = False
-        result['_simulated_load_date'] = pd.NaT
+        result = df
         
         # Select random records to mark as late
+        late = np.zeros(len(result), dtype=bool)
         num_late = int(len(result) * rate)
         if num_late > 0:
-            late_indices = random.sample(range(len(result)), num_late)
-            
-            for idx in late_indices:
-                result.loc[idx, 'late_arrival_flag'] = True
-                
-                # Calculate late load date
-                work_date_val = result.loc[idx, date_column]
-                if pd.notna(work_date_val):
-                    work_date = pd.to_datetime(work_date_val)
-                    lag_days = random.randint(1, max_lag_days)
-                    load_date = work_date + timedelta(days=lag_days)
-                    result.loc[idx, '_simulated_load_date'] = load_date
+            late[self.rng.choice(len(result), num_late, replace=False)] = True
         
-        # For non-late records, load date is same as work date
-        non_late_mask = ~result['late_arrival_flag']
-        non_late_valid_dates = non_late_mask & result[date_column].notna()
-        result.loc[non_late_valid_dates, '_simulated_load_date'] = pd.to_datetime(
-            result.loc[non_late_valid_dates, date_column]
+        lag_days = np.zeros(len(result), dtype=np.int64)
+        lag_days[late] = self._draw_lags(
+            num_late, max_lag_days, lag_distribution, lag_p, lag_weights
         )
         
-        return result
-
+        # Null dates stay NaT; on-time records load on their own date
+        dates = pd.to_datetime(result[date_column]).to_numpy().astype('datetime64[ns]')
+        result['late_arrival_flag'] = late
+        result['_simulated_load_date'] = dates + lag_days.astype('timedelta64[D]')
+    
+    def _draw_lags(
+        self,
+        size: int,
+        max_lag_days: int,
+        lag_distribution: str,
+        lag_p: float,
+        lag_weights: Optional[Sequence[float]]
+    ) -> np.ndarray:
+        """Draw size lag day counts (all >= 1) from the configured distribution."""
+        if lag_distribution == 'geometric':
+            return np.minimum(self.rng.geometric(lag_p, size=size), max_lag_days)
+        if lag_distribution == 'empirical':
+            if not lag_weights:
+                raise ValueError("lag_weights are required for the empirical lag distribution")
+            weights = np.asarray(lag_weights, dtype=float)
+            return self.rng.choice(len(weights), size=size, p=weights / weights.sum()) + 1
+        return self.rng.integers(1, max_lag_days + 1, size=size)
@@ -1,17 +1,17 @@
 """Null value spike injector."""
 
-import random
 import pandas as pd
 import numpy as np
 
+from synthetic_payroll_lab.compact import COMPACT_ATTR
+from synthetic_payroll_lab.random_state import SeedLike, make_rng
+
 
 class NullInjector:
     """Inject random null values to simulate data quality spikes."""
     
-    def __init__(self, seed: int = None):
-        if seed:
-            random.seed(seed)
-            np.random.seed(seed)
+    def __init__(self, seed: SeedLike = None):
+        self.rng = make_rng(seed)
     
     def inject(
         self, 
@@ -33,6 +33,26 @@ class NullInjector:
             return df
         
         result = df.copy()
+        self.inject_in_place(result, rate, exclude_columns)
+        return result
+    
+    def inject_in_place(
+        self,
+        df: pd.DataFrame,
+        rate: float = 0.01,
+        exclude_columns: list = None
+    ) -> None:
+        """Inject null values into df without copying it.
+        
+        Args:
+            df: DataFrame to modify
+            rate: Percentage of values to null (0.0-1.0)
+            exclude_columns: List of columns to exclude from null injection
+        """
+        if rate <= 0 or df.empty:
+            return
+        
+        result = df
         exclude_columns = exclude_columns or []
         
         # Get eligible columns (excluding specified and key columns)
@@ -44,15 +64,26 @@ class NullInjector:
         ]
         
         if not eligible_columns:
-            return result
+            return
+        
+        # Compact ID, money and date columns are nullable as well (bool
+        # columns become nullable booleans)
+        compacted = result.attrs.get(COMPACT_ATTR) or {}
+        compact_ints = set(compacted.get("ids", ())) | set(compacted.get("money", ()))
+        compact_dates = set(compacted.get("dates", ()))
         
         # Inject nulls randomly
         for col in eligible_columns:
-            # Skip if column already has nulls
-            if result[col].dtype == object or pd.api.types.is_numeric_dtype(result[col]):
+            dtype = result[col].dtype
+            if (
+                dtype == object or pd.api.types.is_numeric_dtype(dtype) or
+                isinstance(dtype, pd.CategoricalDtype) or col in compact_dates
+            ):
                 # Randomly null out values
-                mask = np.random.random(len(result)) < rate
+                mask = self.rng.random(len(result)) < rate
+                if col in compact_ints and pd.api.types.is_integer_dtype(dtype) and mask.any():
+                    result[col] = result[col].astype("Int64")
+                elif dtype == bool:
+                    result[col] = result[col].astype("boolean")
                 result.loc[mask, col] = None
-        
-        return result
 
@@ -0,0 +1,96 @@
+"""Single-pass chaos pipeline."""
+
+from contextlib import nullcontext
+from typing import Callable, ContextManager, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# Plans a row order (input positions) for a frame of the given length, or None
+RowPlan = Callable[[int], Optional[np.ndarray]]
+
+# Mutates the working frame in place
+ChaosStep = Callable[[pd.DataFrame], None]
+
+# Opens an instrumentation span for a named stage (see RunMetrics.span)
+StageSpan = Callable[[str], ContextManager]
+
+
+def _step_name(step: Callable) -> str:
+    """Default stage name: the injector class of a bound (or partial) method."""
+    func = getattr(step, 'func', step)
+    owner = getattr(func, '__self__', None)
+    return type(owner).__name__ if owner is not None else getattr(func, '__name__', 'step')
+
+
+class ChaosPipeline:
+    """Compose chaos injections for one domain and apply them in one pass.
+    
+    Row-level injections (duplicates) are planned up front as row-position
+    arrays, the domain is materialized once with a single ``take`` (or
+    copy), and column-level injections then modify that working frame in
+    place. Steps run in the order they were added. Each row plan and step
+    has a name, used to time it when ``apply`` is given a span factory.
+    
+    Example:
+        >>> pipeline = ChaosPipeline()
+        >>> pipeline.add_row_plan(partial(DuplicateInjector(seed).plan, rate=0.02))
+        >>> pipeline.add_step(partial(NullInjector(seed).inject_in_place, rate=0.01))
+        >>> result = pipeline.apply(df)
+    """
+    
+    def __init__(self):
+        self.row_plans: List[RowPlan] = []
+        self.steps: List[ChaosStep] = []
+        self.row_plan_names: List[str] = []
+        self.step_names: List[str] = []
+    
+    def add_row_plan(self, plan: RowPlan, name: Optional[str] = None) -> "ChaosPipeline":
+        """Add a row-level injection, planned before the frame is materialized."""
+        self.row_plans.append(plan)
+        self.row_plan_names.append(name or _step_name(plan))
+        return self
+    
+    def add_step(self, step: ChaosStep, name: Optional[str] = None) -> "ChaosPipeline":
+        """Add an in-place column-level injection."""
+        self.steps.append(step)
+        self.step_names.append(name or _step_name(step))
+        return self
+    
+    def apply(self, df: pd.DataFrame, span: Optional[StageSpan] = None) -> pd.DataFrame:
+        """Apply every planned injection to df (which is left unmodified).
+        
+        Args:
+            df: Input DataFrame
+            span: Optional span factory called with each stage name; row
+                plans and the materializing take are timed together
+        
+        Returns:
+            DataFrame with chaos applied
+        """
+        if not self.row_plans and not self.steps:
+            return df
+        if span is None:
+            span = lambda name: nullcontext()
+        
+        # Compose row plans into one index over the input and materialize once
+        with span("+".join(self.row_plan_names) or "copy"):
+            order = None
+            for plan in self.row_plans:
+                num_rows = len(df) if order is None else len(order)
+                step_order = plan(num_rows)
+                if step_order is not None:
+                    order = step_order if order is None else order[step_order]
+            
+            if order is None:
+                working = df.copy()
+            else:
+                working = df.take(order)
+                working.reset_index(drop=True, inplace=True)
+        
+        for step, name in zip(self.steps, self.step_names):
+            with span(name):
+                step(working)
+        
+        return working
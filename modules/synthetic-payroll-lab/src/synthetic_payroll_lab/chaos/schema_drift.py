@@ -1,17 +1,95 @@
 """Schema drift injector."""
 
-import random
+from typing import Any, Dict, List, Optional, Sequence
+
 import pandas as pd
 import numpy as np
 
+from synthetic_payroll_lab.random_state import SeedLike, make_rng
+
+
+# DataFrame.attrs key holding a frame's SchemaVersions
+SCHEMA_VERSIONS_ATTR = "schema_versions"
+
+
+class SchemaVersions:
+    """Date-driven schema versions of a domain, applied when it is written.
+    
+    Version ``n`` takes effect ``n * interval_days`` after ``anchor_date``
+    and adds ``drift_field_n`` (value ``Value_n``) to the columns of
+    version ``n - 1``. Rows dated before the first interval, or undated,
+    are version 0. Writers add only the drift columns a file's rows have,
+    so nothing is stored for them in memory.
+    
+    Args:
+        date_column: Column that decides each row's version
+        anchor_date: Date version 0 takes effect
+        interval_days: Days between schema versions
+        base_columns: Columns of version 0
+    """
+    
+    def __init__(
+        self,
+        date_column: str,
+        anchor_date: Any,
+        interval_days: int,
+        base_columns: Sequence[str]
+    ):
+        self.date_column = date_column
+        self.anchor_date = pd.Timestamp(anchor_date)
+        self.interval_days = interval_days
+        self.base_columns = list(base_columns)
+    
+    def version_of(self, dates: pd.Series) -> np.ndarray:
+        """Schema version of each date (0 for nulls and dates before the anchor)."""
+        days = (pd.to_datetime(dates) - self.anchor_date).dt.days.to_numpy(dtype=float, na_value=np.nan)
+        versions = np.floor_divide(np.nan_to_num(days, nan=0.0), self.interval_days)
+        return np.maximum(versions, 0).astype(np.int64)
+    
+    @staticmethod
+    def drift_columns(version: int) -> List[str]:
+        """Drift columns added up to and including version."""
+        return [f'drift_field_{n}' for n in range(1, version + 1)]
+    
+    def materialize(self, df: pd.DataFrame, versions: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """Add the drift columns up to the newest version among df's rows.
+        
+        Args:
+            df: Rows to write
+            versions: Precomputed row versions (defaults to ``version_of`` the date column)
+        
+        Returns:
+            df with ``drift_field_N`` columns, None where a row predates version N
+        """
+        if versions is None:
+            versions = self.version_of(df[self.date_column])
+        max_version = int(versions.max()) if len(versions) else 0
+        if max_version == 0:
+            return df
+        return df.assign(**{
+            column: np.where(versions >= n, f'Value_{n}', None)
+            for n, column in enumerate(self.drift_columns(max_version), start=1)
+        })
+    
+    def describe(self, max_version: int) -> List[Dict[str, Any]]:
+        """Schema-version manifest entries for versions 0..max_version."""
+        return [
+            {
+                "version": n,
+                "effective_from": (
+                    self.anchor_date + pd.Timedelta(days=n * self.interval_days)
+                ).strftime("%Y-%m-%d"),
+                "columns": self.base_columns + self.drift_columns(n)
+            }
+            for n in range(max_version + 1)
+        ]
+
 
 class SchemaDriftInjector:
     """Inject schema changes to simulate evolving schemas."""
     
-    def __init__(self, seed: int = None):
-        if seed:
-            random.seed(seed)
-            np.random.seed(seed)
+    def __init__(self, seed: SeedLike = None):
+        self.rng = make_rng(seed)
     
     def inject(
         self, 
@@ -36,8 +114,8 @@ class SchemaDriftInjector:
         
         if drift_type == 'add_column':
             # Add a new column with random data
-            col_name = column_name or f'new_column_{random.randint(1000, 9999)}'
-            result[col_name] = np.random.choice(
+            col_name = column_name or f'new_column_{int(self.rng.integers(1000, 10000))}'
+            result[col_name] = self.rng.choice(
                 ['Value_A', 'Value_B', 'Value_C', None],
                 size=len(result),
                 p=[0.4, 0.3, 0.2, 0.1]
@@ -50,7 +128,7 @@ class SchemaDriftInjector:
                 if '_id' not in col.lower() and 'key' not in col.lower()
             ]
             if eligible_columns:
-                old_col = random.choice(eligible_columns)
+                old_col = eligible_columns[self.rng.integers(len(eligible_columns))]
                 new_col = column_name or f'{old_col}_renamed'
                 result = result.rename(columns={old_col: new_col})
         
@@ -58,7 +136,7 @@ class SchemaDriftInjector:
             # Change data type of a column (e.g., numeric to string)
             numeric_columns = result.select_dtypes(include=[np.number]).columns.tolist()
             if numeric_columns:
-                col = random.choice(numeric_columns)
+                col = numeric_columns[self.rng.integers(len(numeric_columns))]
                 result[col] = result[col].astype(str)
         
         return result
@@ -106,4 +184,33 @@ class SchemaDriftInjector:
             drift_num += 1
         
         return result
-
+    
+    def attach_progressive(
+        self,
+        df: pd.DataFrame,
+        date_column: str,
+        drift_interval_days: int = 90,
+        anchor_date: Any = None
+    ) -> None:
+        """Record progressive drift as schema versions in ``df.attrs``.
+        
+        Unlike ``inject_progressive`` no columns are added; writers apply
+        the versions per file (see ``SchemaVersions``).
+        
+        Args:
+            df: DataFrame to tag
+            date_column: Column to use for date-based drift
+            drift_interval_days: Add new column every N days
+            anchor_date: Date version 0 starts (defaults to the earliest date)
+        """
+        if df.empty or date_column not in df.columns:
+            return
+        
+        if anchor_date is None:
+            anchor_date = pd.to_datetime(df[date_column]).min()
+            if pd.isna(anchor_date):
+                return
+        
+        df.attrs[SCHEMA_VERSIONS_ATTR] = SchemaVersions(
+            date_column, anchor_date, drift_interval_days, df.columns
+        )
@@ -0,0 +1,101 @@
+"""Timezone error injector."""
+
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from synthetic_payroll_lab.random_state import SeedLike, make_rng
+
+
+# Timestamp columns shifted together when a record gets a timezone error
+TIMEZONE_ERROR_COLUMNS = ('punch_in', 'punch_out', 'shift_start', 'shift_end')
+
+# Wrong-zone offsets in hours (e.g. Eastern time read as Pacific)
+DEFAULT_OFFSET_ERRORS = (-3, -2, -1, 1, 2, 3)
+
+
+class TimezoneErrorInjector:
+    """Shift timestamps by wrong UTC offsets to simulate timezone bugs."""
+    
+    def __init__(self, seed: SeedLike = None):
+        self.rng = make_rng(seed)
+    
+    def inject(
+        self,
+        df: pd.DataFrame,
+        rate: float = 0.03,
+        columns: Optional[Sequence[str]] = None,
+        timezone_column: str = 'timezone',
+        utc_share: float = 0.5,
+        offset_errors: Sequence[int] = DEFAULT_OFFSET_ERRORS
+    ) -> pd.DataFrame:
+        """Shift a fraction of records' timestamps by a wrong UTC offset.
+        
+        Each affected record has all of its timestamp columns shifted by the
+        same amount. Where the record's IANA zone is known, ``utc_share`` of
+        the errors write the UTC wall-clock time instead of local time (DST
+        aware); the rest are off by a whole-hour wrong-zone offset. The
+        applied shift is recorded in ``_timezone_error_hours``.
+        
+        Args:
+            df: Input DataFrame
+            rate: Percentage of records with a timezone error (0.0-1.0)
+            columns: Timestamp columns to shift (defaults to TIMEZONE_ERROR_COLUMNS)
+            timezone_column: Column holding each record's IANA timezone
+            utc_share: Share of errors that write UTC as local time
+            offset_errors: Wrong-zone offsets in hours to draw from
+        
+        Returns:
+            DataFrame with timezone errors injected
+        """
+        if rate <= 0 or df.empty:
+            return df
+        
+        result = df.copy()
+        self.inject_in_place(result, rate, columns, timezone_column, utc_share, offset_errors)
+        return result
+    
+    def inject_in_place(
+        self,
+        df: pd.DataFrame,
+        rate: float = 0.03,
+        columns: Optional[Sequence[str]] = None,
+        timezone_column: str = 'timezone',
+        utc_share: float = 0.5,
+        offset_errors: Sequence[int] = DEFAULT_OFFSET_ERRORS
+    ) -> None:
+        """Inject timezone errors into df without copying it.
+        
+        Takes the same arguments as ``inject``.
+        """
+        columns = [col for col in (columns or TIMEZONE_ERROR_COLUMNS) if col in df.columns]
+        num_errors = int(len(df) * rate)
+        if rate <= 0 or not columns or num_errors == 0:
+            return
+        
+        # Select random records and a wrong-zone shift for each
+        positions = np.sort(self.rng.choice(len(df), num_errors, replace=False))
+        shift = self.rng.choice(np.asarray(offset_errors, dtype=np.int64), size=num_errors)
+        shift = shift.astype('timedelta64[h]').astype('timedelta64[ns]')
+        
+        # Write UTC wall-clock time for a share of records with a known zone
+        if timezone_column in df.columns:
+            zones = df[timezone_column].to_numpy()[positions]
+            local = pd.to_datetime(df[columns[0]]).to_numpy()[positions]
+            as_utc = (self.rng.random(num_errors) < utc_share) & pd.notna(zones)
+            for zone in pd.unique(zones[as_utc]):
+                rows = as_utc & (zones == zone)
+                stamps = pd.DatetimeIndex(local[rows])
+                utc = stamps.tz_localize(zone, ambiguous='NaT', nonexistent='NaT')
+                offset = (utc.tz_convert('UTC').tz_localize(None) - stamps).to_numpy()
+                shift[rows] = np.where(np.isnat(offset), shift[rows], offset)
+        
+        for col in columns:
+            values = pd.to_datetime(df[col]).to_numpy(copy=True)
+            values[positions] += shift
+            df[col] = values
+        
+        error_hours = np.zeros(len(df))
+        error_hours[positions] = shift / np.timedelta64(1, 'h')
+        df['_timezone_error_hours'] = error_hours
@@ -7,6 +7,10 @@ import click
 import yaml
 
 from synthetic_payroll_lab import PayrollGenerator, ChaosConfig, __version__
+from synthetic_payroll_lab.config import (
+    AssignmentHistoryConfig, OrgTreeConfig, OutputConfig, OvertimeConfig, RetroConfig
+)
+from synthetic_payroll_lab.writers import DEFAULT_PARTITION_COLUMNS
 
 
 @click.group()
@@ -45,15 +49,83 @@ def main():
 )
 @click.option(
     '--format',
-    type=click.Choice(['csv', 'json'], case_sensitive=False),
+    type=click.Choice(['csv', 'json', 'parquet', 'feather', 'avro', 'ndjson'], case_sensitive=False),
     default='csv',
     help='Output format (default: csv)'
 )
+@click.option(
+    '--compression',
+    type=click.Choice(['snappy', 'gzip', 'zstd', 'lz4', 'brotli', 'none'], case_sensitive=False),
+    help='Parquet/Feather/Avro codec (default: snappy for parquet, lz4 for feather, deflate for avro)'
+)
+@click.option(
+    '--row-group-size',
+    type=int,
+    help='Maximum rows per Parquet row group'
+)
+@click.option(
+    '--partitioned',
+    is_flag=True,
+    help='Hive-partition schedules, timecards and payroll runs by date'
+)
+@click.option(
+    '--partition-by',
+    multiple=True,
+    help='Partition a domain by a column, as DOMAIN=COLUMN (repeatable)'
+)
 @click.option(
     '--seed',
     type=int,
     help='Random seed for reproducibility'
 )
+@click.option(
+    '--engine',
+    type=click.Choice(['python', 'numpy'], case_sensitive=False),
+    default='python',
+    help='Generation engine: row-wise python or columnar numpy (default: python)'
+)
+@click.option(
+    '--pii-pool-size',
+    type=int,
+    default=1000,
+    help='Distinct Faker values per PII field with --engine numpy (default: 1000)'
+)
+@click.option(
+    '--compact',
+    is_flag=True,
+    help='Hold domains in memory-compact dtypes (requires --engine numpy)'
+)
+@click.option(
+    '--workers',
+    type=int,
+    help='Generate employee shards in a pool of N processes'
+)
+@click.option(
+    '--shard-size',
+    type=int,
+    default=10000,
+    help='Employees per shard when --workers is set (default: 10000)'
+)
+@click.option(
+    '--chunk-size',
+    type=int,
+    help='Stream generation in chunks of N employees, writing each chunk as it completes'
+)
+@click.option(
+    '--incremental-days',
+    type=int,
+    help='Append the next N days to the landing zone, resuming from its saved state'
+)
+@click.option(
+    '--trace',
+    is_flag=True,
+    help='Write per-stage timings as a Chrome trace to OUTPUT_DIR/_trace.json'
+)
+@click.option(
+    '--trace-memory',
+    is_flag=True,
+    help='Also trace Python allocations per stage with tracemalloc (slower)'
+)
 @click.option(
     '--no-chaos',
     is_flag=True,
@@ -84,7 +156,20 @@ def generate(
     end_date,
     output_dir,
     format,
+    compression,
+    row_group_size,
+    partitioned,
+    partition_by,
     seed,
+    engine,
+    pii_pool_size,
+    compact,
+    workers,
+    shard_size,
+    chunk_size,
+    incremental_days,
+    trace,
+    trace_memory,
     no_chaos,
     duplicate_rate,
     null_rate,
@@ -102,6 +187,10 @@ def generate(
     click.echo()
     
     # Load config file if provided
+    overtime = None
+    retro = None
+    history = None
+    org = None
     if config:
         click.echo(f"📄 Loading configuration from: {config}")
         with open(config, 'r') as f:
@@ -111,7 +200,20 @@ def generate(
         employees = config_data.get('employees', {}).get('count', employees)
         start_date = config_data.get('start_date', start_date)
         end_date = config_data.get('end_date', end_date)
-        output_format = config_data.get('output_format', format)
+        format = config_data.get('output_format', format)
+        compression = config_data.get('output', {}).get('compression', compression)
+        row_group_size = config_data.get('output', {}).get('row_group_size', row_group_size)
+        partition_by = config_data.get('output', {}).get('partition_by', partition_by)
+        engine = config_data.get('engine', engine)
+        pii_pool_size = config_data.get('employees', {}).get('pii_pool_size', pii_pool_size)
+        compact = config_data.get('compact', compact)
+        overtime = OvertimeConfig(**config_data.get('overtime', {}))
+        if config_data.get('retro') is not None:
+            retro = RetroConfig(**config_data['retro'])
+        if config_data.get('history') is not None:
+            history = AssignmentHistoryConfig(**config_data['history'])
+        if config_data.get('org') is not None:
+            org = OrgTreeConfig(**config_data['org'])
         
         # Chaos config from file
         chaos_config = config_data.get('chaos', {})
@@ -119,6 +221,19 @@ def generate(
         null_rate = chaos_config.get('nulls', {}).get('spike_rate', null_rate)
         late_arrival_pct = chaos_config.get('late_arrivals', {}).get('pct', late_arrival_pct)
     
+    # Resolve partition columns (flag defaults, then explicit overrides)
+    partition_columns = dict(DEFAULT_PARTITION_COLUMNS) if partitioned else {}
+    if isinstance(partition_by, dict):
+        partition_columns.update(partition_by)
+    else:
+        for spec in partition_by:
+            domain_name, sep, column = spec.partition('=')
+            if not sep or not column:
+                raise click.BadParameter(
+                    f"Expected DOMAIN=COLUMN, got: {spec}", param_hint='--partition-by'
+                )
+            partition_columns[domain_name] = column
+    
     # Create chaos config
     chaos = None if no_chaos else ChaosConfig(
         duplicate_rate=duplicate_rate,
@@ -133,14 +248,44 @@ def generate(
             start_date=start_date,
             end_date=end_date,
             chaos=chaos,
-            seed=seed
+            seed=seed,
+            engine=engine,
+            pii_pool_size=pii_pool_size,
+            compact=compact,
+            overtime=overtime,
+            retro=retro,
+            history=history,
+            org=org,
+            workers=workers,
+            shard_size=shard_size,
+            trace_memory=trace_memory,
+            output=OutputConfig(
+                compression=compression,
+                row_group_size=row_group_size,
+                partition_by=partition_columns
+            )
         )
         
         # Generate data
-        domains = generator.generate_all_domains(
-            output_path=output_dir,
-            format=format
-        )
+        if incremental_days:
+            row_counts = generator.generate_incremental(
+                output_path=output_dir,
+                format=format,
+                days=incremental_days
+            )
+        elif chunk_size:
+            row_counts = generator.generate_streaming(
+                output_path=output_dir,
+                format=format,
+                chunk_size=chunk_size
+            )
+        else:
+            domains = generator.generate_all_domains(
+                output_path=output_dir,
+                format=format,
+                trace=trace
+            )
+            row_counts = {name: len(df) for name, df in domains.items()}
         
         # Summary
         click.echo()
@@ -148,21 +293,116 @@ def generate(
         click.echo("✅ Generation Complete!")
         click.echo("=" * 60)
         click.echo()
-        click.echo(f"📊 Generated {len(domains)} domains:")
+        click.echo(f"📊 Generated {len(row_counts)} domains:")
         total_rows = 0
-        for domain_name, df in domains.items():
-            click.echo(f"   • {domain_name}: {len(df):,} rows")
-            total_rows += len(df)
+        for domain_name, rows in row_counts.items():
+            click.echo(f"   • {domain_name}: {rows:,} rows")
+            total_rows += rows
         click.echo()
         click.echo(f"📁 Output: {output_dir}/")
         click.echo(f"📝 Total rows: {total_rows:,}")
         click.echo()
         
+        if generator.metrics.spans:
+            click.echo("⏱️  Stage timings:")
+            for category in ('generate', 'chaos', 'write'):
+                stages = generator.metrics.durations(category)
+                top_level = {
+                    name: seconds for name, seconds in stages.items() if name.count('.') == 1
+                }
+                click.echo(f"   • {category}: {sum(top_level.values()):.2f}s")
+            click.echo(f"   • peak RSS: {generator.metrics.peak_rss_mb or 0:,.0f} MB")
+            click.echo()
+        
     except Exception as e:
         click.echo(f"❌ Error: {e}", err=True)
         sys.exit(1)
 
 
+@main.command()
+@click.option(
+    '--employees',
+    type=int,
+    multiple=True,
+    help='Employee count to benchmark (repeatable, default: 1000 10000 50000 200000)'
+)
+@click.option(
+    '--months',
+    type=int,
+    multiple=True,
+    help='Months of history to benchmark (repeatable, default: 1 3 12)'
+)
+@click.option(
+    '--engine',
+    type=click.Choice(['python', 'numpy'], case_sensitive=False),
+    default='numpy',
+    help='Generation engine (default: numpy)'
+)
+@click.option(
+    '--format',
+    type=click.Choice(['csv', 'json', 'parquet', 'feather', 'avro', 'ndjson'], case_sensitive=False),
+    default='csv',
+    help='Output format written by each case (default: csv)'
+)
+@click.option(
+    '--seed',
+    type=int,
+    default=42,
+    help='Random seed (default: 42)'
+)
+@click.option(
+    '--output',
+    default='benchmark-results.json',
+    help='Path to write the results JSON (default: benchmark-results.json)'
+)
+@click.option(
+    '--baseline',
+    type=click.Path(exists=True),
+    help='Saved results JSON to compare against'
+)
+@click.option(
+    '--tolerance',
+    type=float,
+    default=0.10,
+    help='Relative change flagged as a regression (default: 0.10)'
+)
+def benchmark(employees, months, engine, format, seed, output, baseline, tolerance):
+    """Benchmark generation across scale factors.
+
+    Exits with status 1 when --baseline is given and a case regressed.
+
+    Example:
+        synthetic-payroll benchmark --employees 1000 --months 1 --baseline baseline.json
+    """
+    from synthetic_payroll_lab.benchmark import (
+        SCALE_EMPLOYEES, SCALE_MONTHS, compare, load_results, run_suite, save_results
+    )
+
+    results = run_suite(
+        employees=employees or SCALE_EMPLOYEES,
+        months=months or SCALE_MONTHS,
+        engine=engine,
+        seed=seed,
+        format=format
+    )
+    save_results(results, output)
+    click.echo(f"📁 Results: {output}")
+
+    if baseline:
+        regressions = compare(results, load_results(baseline), tolerance=tolerance)
+        if regressions:
+            click.echo(f"❌ {len(regressions)} regression(s) against {baseline}:", err=True)
+            for item in regressions:
+                click.echo(
+                    f"   • {item['employees']:,} employees × {item['months']} month(s) "
+                    f"{item['metric']}: {item['baseline']:,.3f} → {item['current']:,.3f} "
+                    f"({item['change']:+.1%})",
+                    err=True
+                )
+            sys.exit(1)
+        click.echo(f"✅ No regressions against {baseline}")
+
+
 @main.command()
 def version():
     """Show version information."""
@@ -0,0 +1,163 @@
+"""Memory-compact column representations for generated domains.
+
+In compact mode enumerations are stored as ``category``, prefixed IDs such
+as ``EMP000123`` as ``int64``, calendar dates as ``datetime64[s]`` and fractional money
+as ``int64`` cents. The frame's ``attrs`` record which columns were
+compacted, so writers can format them back (or write them natively) without
+guessing from column names and dtypes.
+"""
+
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+# Key in df.attrs holding {"ids": [...], "money": [...], "dates": [...]}
+COMPACT_ATTR = "compact"
+
+# Prefixed identifier columns: column -> (prefix, minimum digits)
+ID_FORMATS = {
+    "employee_number": ("EMP", 6),
+    "employee_id": ("EMP", 6),
+    "manager_id": ("EMP", 6),
+    "ancestor_id": ("EMP", 6),
+    "descendant_id": ("EMP", 6),
+    "schedule_id": ("SCH", 8),
+    "timecard_id": ("TC", 8),
+    "cost_center": ("CC", 4),
+    "cost_center_code": ("CC", 4),
+}
+
+# Low-cardinality enumeration columns
+CATEGORY_COLUMNS = {
+    "job_code", "job_title", "job_family", "pay_grade", "union_eligible",
+    "department", "location", "active_flag", "state",
+    "employment_status", "employment_category", "union_flag",
+    "shift_type", "timezone", "schedule_type", "approval_status", "run_type",
+    "change_type",
+}
+
+# Columns holding calendar dates
+DATE_COLUMNS = {
+    "date_of_birth", "hire_date", "termination_date",
+    "effective_start_date", "effective_end_date",
+    "shift_date", "work_date",
+    "run_date", "period_start", "period_end", "snapshot_date",
+}
+
+# Currency columns
+MONEY_COLUMNS = {
+    "gross_pay", "net_pay", "tax_federal", "tax_state", "tax_fica",
+    "deduction_401k", "deduction_health", "deduction_dental",
+    "hourly_rate", "annual_salary", "min_salary", "max_salary", "budget_annual",
+}
+
+# Smallest currency unit per unit of money (cents)
+MONEY_SCALE_FACTOR = 100
+
+
+def _parse_ids(values: pd.Series, prefix: str) -> pd.Series:
+    """Strip an ID prefix and parse the sequence numbers as int64."""
+    if pd.api.types.is_integer_dtype(values):
+        return values
+    present = values.dropna()
+    if present.empty or not isinstance(present.iloc[0], str):
+        # Upstream compact IDs carried through an object column
+        parsed = pd.to_numeric(values)
+    else:
+        parsed = pd.to_numeric(values.str.slice(len(prefix)))
+    return parsed.astype("Int64" if parsed.isna().any() else np.int64)
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert a domain frame to its compact representation.
+
+    Only columns named in ``ID_FORMATS``, ``CATEGORY_COLUMNS``,
+    ``DATE_COLUMNS`` and ``MONEY_COLUMNS`` are converted; other columns
+    are shared with df, which is left unmodified.
+
+    Args:
+        df: Domain DataFrame as generated
+
+    Returns:
+        Compact DataFrame with the converted columns recorded in ``attrs``
+    """
+    if COMPACT_ATTR in df.attrs:
+        return df
+
+    result = df.copy(deep=False)
+    compacted: Dict[str, List[str]] = {"ids": [], "money": [], "dates": []}
+
+    for col in df.columns:
+        values = df[col]
+        if col in ID_FORMATS:
+            result[col] = _parse_ids(values, ID_FORMATS[col][0])
+            compacted["ids"].append(col)
+        elif col in CATEGORY_COLUMNS:
+            if not isinstance(values.dtype, pd.CategoricalDtype):
+                result[col] = values.astype("category")
+        elif col in DATE_COLUMNS:
+            if not pd.api.types.is_datetime64_dtype(values):
+                # Via numpy: sentinel dates like 9999-12-31 overflow nanoseconds
+                result[col] = np.asarray(values.to_numpy(), dtype="datetime64[s]")
+            compacted["dates"].append(col)
+        elif col in MONEY_COLUMNS and pd.api.types.is_float_dtype(values):
+            cents = np.round(values.to_numpy(dtype=np.float64) * MONEY_SCALE_FACTOR)
+            if np.isnan(cents).any():
+                result[col] = pd.array(cents, dtype="Int64")
+            else:
+                result[col] = cents.astype(np.int64)
+            compacted["money"].append(col)
+
+    result.attrs[COMPACT_ATTR] = compacted
+    return result
+
+
+def format_ids(values: pd.Series, prefix: str, digits: int) -> np.ndarray:
+    """Format integer IDs as zero-padded prefixed strings (nulls stay None)."""
+    missing = values.isna().to_numpy()
+    numbers = values.to_numpy(dtype=np.int64, na_value=0).astype(str)
+    formatted = np.char.add(prefix, np.char.zfill(numbers, digits)).astype(object)
+    formatted[missing] = None
+    return formatted
+
+
+def cents_to_units(values: pd.Series) -> np.ndarray:
+    """Money in cents as float64 currency units (nulls become NaN)."""
+    return values.to_numpy(dtype=np.float64, na_value=np.nan) / MONEY_SCALE_FACTOR
+
+
+def expand_compact(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert a compact frame back to the generated representation.
+
+    IDs become prefixed strings, money becomes float64 currency units and
+    dates ``datetime.date`` objects; categories are left as they are, since text
+    writers emit their values. Frames without compact ``attrs`` are
+    returned unchanged.
+
+    Args:
+        df: Compact DataFrame
+
+    Returns:
+        DataFrame with the compacted columns expanded
+    """
+    compacted = df.attrs.get(COMPACT_ATTR)
+    if compacted is None:
+        return df
+
+    result = df.copy(deep=False)
+    for col in compacted["ids"]:
+        if col in result.columns:
+            result[col] = format_ids(result[col], *ID_FORMATS[col])
+    for col in compacted["money"]:
+        if col in result.columns:
+            result[col] = cents_to_units(result[col])
+    for col in compacted["dates"]:
+        if col in result.columns:
+            dates = result[col].dt.date.to_numpy()
+            dates[result[col].isna().to_numpy()] = None
+            result[col] = dates
+
+    result.attrs = {key: value for key, value in df.attrs.items() if key != COMPACT_ATTR}
+    return result
@@ -1,6 +1,6 @@
 """Configuration classes for synthetic payroll data generation."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
 
 
@@ -11,6 +11,10 @@ class ChaosConfig(BaseModel):
         duplicate_rate: Percentage of duplicate rows to inject (0.0-1.0)
         null_spike_rate: Percentage of null values to inject randomly (0.0-1.0)
         late_arrival_pct: Percentage of timecards that arrive late (0.0-1.0)
+        late_arrival_max_lag_days: Maximum days a late record is delayed
+        late_arrival_lag_distribution: Lag day distribution (uniform, geometric, empirical)
+        late_arrival_lag_p: Success probability of the geometric lag distribution
+        late_arrival_lag_weights: Empirical weights for lags of 1..N days
         schema_drift_days: Add new column every N days
         timezone_error_rate: Percentage of timezone errors (0.0-1.0)
         fk_orphan_rate: Percentage of orphaned foreign key records (0.0-1.0)
@@ -19,11 +23,102 @@ class ChaosConfig(BaseModel):
     duplicate_rate: float = Field(default=0.02, ge=0.0, le=1.0)
     null_spike_rate: float = Field(default=0.01, ge=0.0, le=1.0)
     late_arrival_pct: float = Field(default=0.15, ge=0.0, le=1.0)
+    late_arrival_max_lag_days: int = Field(default=3, gt=0)
+    late_arrival_lag_distribution: str = Field(
+        default="uniform", pattern="^(uniform|geometric|empirical)$"
+    )
+    late_arrival_lag_p: float = Field(default=0.5, gt=0.0, le=1.0)
+    late_arrival_lag_weights: Optional[List[float]] = None
     schema_drift_days: int = Field(default=90, gt=0)
     timezone_error_rate: float = Field(default=0.03, ge=0.0, le=1.0)
     fk_orphan_rate: float = Field(default=0.01, ge=0.0, le=1.0)
 
 
+class DailyOvertimeRule(BaseModel):
+    """Daily overtime thresholds of one state.
+    
+    Args:
+        overtime_after: Hours per workday beyond which hours are overtime
+        double_time_after: Hours per workday beyond which hours are double
+            time (None for no daily double time)
+    """
+    
+    overtime_after: float = Field(default=8.0, gt=0.0)
+    double_time_after: Optional[float] = Field(default=None, gt=0.0)
+
+
+# States with daily overtime rules by default (work-location state -> rule)
+DEFAULT_DAILY_OVERTIME_RULES = {
+    "CA": DailyOvertimeRule(overtime_after=8.0, double_time_after=12.0),
+    "AK": DailyOvertimeRule(overtime_after=8.0),
+    "NV": DailyOvertimeRule(overtime_after=8.0),
+    "CO": DailyOvertimeRule(overtime_after=12.0),
+}
+
+
+class OvertimeConfig(BaseModel):
+    """Configuration for splitting worked hours into regular and overtime.
+    
+    Args:
+        weekly_threshold: Regular hours per workweek beyond which hours are overtime
+        week_start: First day of the workweek (MON-SUN)
+        daily_rules: Work-location state code -> daily overtime rule
+    """
+    
+    weekly_threshold: float = Field(default=40.0, gt=0.0)
+    week_start: str = Field(default="SUN", pattern="^(MON|TUE|WED|THU|FRI|SAT|SUN)$")
+    daily_rules: Dict[str, DailyOvertimeRule] = Field(
+        default_factory=lambda: dict(DEFAULT_DAILY_OVERTIME_RULES)
+    )
+
+
+class RetroConfig(BaseModel):
+    """Configuration for retroactive corrections of closed pay periods.
+    
+    Args:
+        max_lag_periods: Most pay periods between a period and its correction run
+        max_hours_delta: Largest hours change of one adjusted timecard
+        retro_pay_rate: Share of pay rows that get a retroactive raise (0.0-1.0)
+        raise_pct_min: Smallest retroactive raise, as a fraction of the rate
+        raise_pct_max: Largest retroactive raise, as a fraction of the rate
+    """
+    
+    max_lag_periods: int = Field(default=2, gt=0)
+    max_hours_delta: float = Field(default=4.0, ge=0.25)
+    retro_pay_rate: float = Field(default=0.01, ge=0.0, le=1.0)
+    raise_pct_min: float = Field(default=0.01, ge=0.0)
+    raise_pct_max: float = Field(default=0.05, ge=0.0)
+
+
+class AssignmentHistoryConfig(BaseModel):
+    """Configuration for employee assignment change history.
+    
+    Args:
+        changes_per_year: Expected assignment changes per employee per year
+        change_type_weights: Change type (PROMOTION, TRANSFER,
+            MANAGER_CHANGE) -> relative weight
+    """
+    
+    changes_per_year: float = Field(default=1.0, ge=0.0)
+    change_type_weights: Dict[str, float] = Field(
+        default_factory=lambda: {"PROMOTION": 0.25, "TRANSFER": 0.35, "MANAGER_CHANGE": 0.40}
+    )
+
+
+class OrgTreeConfig(BaseModel):
+    """Configuration for the manager hierarchy.
+    
+    Args:
+        max_depth: Most levels in the org tree, root included
+        fan_out: Mean direct reports per manager
+        fan_out_sigma: Lognormal spread of team sizes (0.0 for even teams)
+    """
+    
+    max_depth: int = Field(default=8, ge=2)
+    fan_out: float = Field(default=6.0, ge=1.0)
+    fan_out_sigma: float = Field(default=0.5, ge=0.0)
+
+
 class EmployeeConfig(BaseModel):
     """Configuration for employee generation."""
     
@@ -33,6 +128,26 @@ class EmployeeConfig(BaseModel):
     full_time_pct: float = Field(default=0.75, ge=0.0, le=1.0)
     union_pct: float = Field(default=0.30, ge=0.0, le=1.0)
     turnover_annual_rate: float = Field(default=0.15, ge=0.0, le=1.0)
+    pii_pool_size: int = Field(default=1000, gt=0)
+
+
+class OutputConfig(BaseModel):
+    """Configuration for output file writers.
+    
+    Args:
+        compression: Parquet/Feather/Avro codec (None uses the format default:
+            snappy for Parquet, lz4 for Feather, deflate for Avro)
+        row_group_size: Maximum rows per Parquet row group (None uses pyarrow's default)
+        partition_by: Domain name -> date column to Hive-partition that domain by
+        max_workers: Threads used to write partitions (None uses the executor default)
+        chunk_rows: Rows serialized per chunk by the Avro and NDJSON writers
+    """
+    
+    compression: Optional[str] = Field(default=None, pattern="^(snappy|gzip|zstd|lz4|brotli|none)$")
+    row_group_size: Optional[int] = Field(default=None, gt=0)
+    partition_by: Dict[str, str] = Field(default_factory=dict)
+    max_workers: Optional[int] = Field(default=None, gt=0)
+    chunk_rows: int = Field(default=100_000, gt=0)
 
 
 class PayrollConfig(BaseModel):
@@ -41,7 +156,13 @@ class PayrollConfig(BaseModel):
     employees: EmployeeConfig = Field(default_factory=EmployeeConfig)
     start_date: str = Field(default="2024-01-01")
     end_date: str = Field(default="2024-12-31")
-    output_format: str = Field(default="csv", pattern="^(csv|json|parquet)$")
+    output_format: str = Field(default="csv", pattern="^(csv|json|parquet|feather|avro|ndjson)$")
+    output: OutputConfig = Field(default_factory=OutputConfig)
+    engine: str = Field(default="python", pattern="^(python|numpy)$")
+    overtime: OvertimeConfig = Field(default_factory=OvertimeConfig)
+    retro: Optional[RetroConfig] = None
+    history: Optional[AssignmentHistoryConfig] = None
+    org: Optional[OrgTreeConfig] = None
     chaos: Optional[ChaosConfig] = Field(default_factory=ChaosConfig)
     seed: Optional[int] = None  # For reproducibility
 
@@ -0,0 +1,248 @@
+"""Employee assignment history generator."""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from faker import Faker
+
+from synthetic_payroll_lab.org_tree import org_depths
+from synthetic_payroll_lab.random_state import SeedLike, make_rng
+
+
+# Assignment change events and the columns each one changes
+CHANGE_COLUMNS = {
+    "PROMOTION": ["job_code"],
+    "TRANSFER": ["department", "location", "cost_center"],
+    "MANAGER_CHANGE": ["manager_id"],
+}
+
+# Assignment attributes carried from version to version
+ASSIGNMENT_COLUMNS = [
+    "job_code", "department", "location", "manager_id", "cost_center",
+    "employment_category", "union_flag",
+]
+
+OPEN_END_DATE = np.datetime64("9999-12-31", "D")
+
+
+class AssignmentHistoryGenerator:
+    """Generate effective-dated assignment versions from employee rows."""
+    
+    def __init__(self, fake: Faker, seed: SeedLike = None):
+        self.fake = fake
+        self.rng = make_rng(seed)
+    
+    def generate(
+        self,
+        employees_df: pd.DataFrame,
+        jobs_df: pd.DataFrame,
+        cost_centers: List[str],
+        start_date: datetime,
+        end_date: datetime,
+        changes_per_year: float = 1.0,
+        change_type_weights: Optional[Dict[str, float]] = None,
+        org_tree: bool = False
+    ) -> pd.DataFrame:
+        """Generate assignment history with change events between start and end.
+        
+        Each employee starts with a ``HIRE`` version holding their employee
+        row's assignment. Change events arrive as a Poisson process of
+        ``changes_per_year`` over the days the employee is employed within
+        [start_date, end_date], at most one per day. A ``PROMOTION`` moves to
+        the next ``job_level`` in the job family (or the next level in any
+        family at the top of one), a ``TRANSFER`` draws a new department,
+        location and cost center, and a ``MANAGER_CHANGE`` a new manager
+        among employees_df. With ``org_tree``, new managers are drawn from
+        the org layer directly above the employee (see ``org_depths``), so
+        the manager hierarchy stays a tree ordered by hire job level, and
+        manager changes of the root become transfers. Promotions at the top
+        level become transfers. Terminated employees end with a
+        ``TERMINATION`` version.
+        
+        All events are drawn as arrays; each version's attributes are the
+        previous version's, with the changed columns forward-filled per
+        employee in one group-by pass.
+        
+        Versions are contiguous: ``effective_end_date`` is the day before
+        the next version starts, and 9999-12-31 for the last one.
+        ``snapshot_date`` is the day the version appears in a daily change
+        snapshot, its start date or start_date for versions already in
+        effect when the window opens.
+        
+        Args:
+            employees_df: Employee data (one row per employee)
+            jobs_df: Job data with job_family and job_level
+            cost_centers: List of valid cost center codes
+            start_date: First day of change events
+            end_date: Last day of change events
+            changes_per_year: Expected change events per employee per year
+            change_type_weights: Change type -> relative weight (defaults to
+                equal weights over ``CHANGE_COLUMNS``)
+            org_tree: Whether employees_df's managers form a layered org
+                tree to keep (as built by ``OrgTreeBuilder``)
+        
+        Returns:
+            DataFrame with one row per assignment version
+        """
+        weights = change_type_weights or {change_type: 1.0 for change_type in CHANGE_COLUMNS}
+        unknown = set(weights) - set(CHANGE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unsupported change types: {sorted(unknown)}")
+        change_types = np.array(list(weights), dtype=object)
+        p = np.array(list(weights.values()), dtype=np.float64)
+        if (p < 0).any() or p.sum() <= 0:
+            raise ValueError(f"change_type_weights must be non-negative with a positive total: {weights}")
+        
+        rng = self.rng
+        count = len(employees_df)
+        start_day = np.datetime64(start_date.date(), 'D')
+        end_day = np.datetime64(end_date.date(), 'D')
+        hire = np.asarray(pd.to_datetime(employees_df['hire_date']).to_numpy(), dtype='datetime64[D]')
+        termination = np.asarray(
+            pd.to_datetime(employees_df['termination_date']).to_numpy(), dtype='datetime64[D]'
+        )
+        terminated = ~np.isnat(termination)
+        
+        # Change events: Poisson counts over each employee's days in the window
+        first_day = np.maximum(hire + 1, start_day)
+        last_day = np.where(terminated, np.minimum(termination - 1, end_day), end_day)
+        span = np.maximum((last_day - first_day).astype(np.int64) + 1, 0)
+        counts = rng.poisson(changes_per_year * span / 365.25)
+        event_emp = np.repeat(np.arange(count), counts)
+        event_day = first_day[event_emp] + (rng.random(len(event_emp)) * span[event_emp]).astype('timedelta64[D]')
+        
+        order = np.lexsort((event_day, event_emp))
+        event_emp, event_day = event_emp[order], event_day[order]
+        first = np.ones(len(event_emp), dtype=bool)
+        first[1:] = (event_emp[1:] != event_emp[:-1]) | (event_day[1:] != event_day[:-1])
+        event_emp, event_day = event_emp[first], event_day[first]
+        n = len(event_emp)
+        event_type = change_types[rng.choice(len(change_types), size=n, p=p / p.sum())]
+        
+        # Promotions walk up the job ladder from the hire job
+        codes = employees_df['job_code'].astype(object).to_numpy()
+        ladder, promote_to = self._job_ladder(jobs_df, codes)
+        promoted = event_type == "PROMOTION"
+        rank = pd.Series(promoted).groupby(event_emp).cumsum().to_numpy()
+        job = before = ladder.get_indexer(codes)[event_emp]
+        for step in range(int(rank.max()) if n else 0):
+            before = np.where(rank > step + 1, promote_to[before], before)
+            job = np.where(rank > step, promote_to[job], job)
+        event_type = np.where(promoted & (job == before), "TRANSFER", event_type).astype(object)
+        
+        # New values for each event, kept only for the columns it changes
+        departments = pd.unique(employees_df['department'].astype(object))
+        locations = pd.unique(employees_df['location'].astype(object))
+        employee_ids = employees_df['employee_number'].to_numpy(dtype=object)
+        manager = rng.integers(0, max(count - 1, 1), size=n)
+        manager = np.where(manager >= event_emp, manager + 1, manager) % max(count, 1)
+        if org_tree and n:
+            manager, root = self._layer_above(org_depths(employees_df), event_emp)
+            event_type = np.where(
+                (event_type == "MANAGER_CHANGE") & root, "TRANSFER", event_type
+            ).astype(object)
+        new_values = {
+            "job_code": ladder.to_numpy(dtype=object)[job],
+            "department": departments[rng.integers(0, len(departments), size=n)],
+            "location": locations[rng.integers(0, len(locations), size=n)],
+            "cost_center": np.asarray(cost_centers, dtype=object)[rng.integers(0, len(cost_centers), size=n)],
+            "manager_id": employee_ids[manager],
+        }
+        
+        events = pd.DataFrame({"employee": event_emp, "change_type": event_type, "day": event_day})
+        for change_type, columns in CHANGE_COLUMNS.items():
+            changed = event_type == change_type
+            for column in columns:
+                events[column] = np.where(changed, new_values[column], None)
+        
+        # Hire and termination versions around the events
+        hires = employees_df[ASSIGNMENT_COLUMNS].astype(object).reset_index(drop=True)
+        hires['employee'] = np.arange(count)
+        hires['change_type'] = "HIRE"
+        hires['day'] = hire
+        terminations = pd.DataFrame({
+            "employee": np.flatnonzero(terminated),
+            "change_type": "TERMINATION",
+            "day": termination[terminated],
+        })
+        versions = pd.concat([hires, events, terminations], ignore_index=True)
+        kind = np.concatenate([np.zeros(count), np.ones(n), np.full(terminated.sum(), 2)])
+        versions = versions.iloc[np.lexsort((kind, versions['day'].to_numpy(), versions['employee'].to_numpy()))]
+        versions = versions.reset_index(drop=True)
+        
+        employee = versions['employee'].to_numpy()
+        filled = versions.groupby(employee)[ASSIGNMENT_COLUMNS].ffill().astype(object)
+        versions[ASSIGNMENT_COLUMNS] = filled.where(filled.notna(), None)
+        
+        day = versions['day'].to_numpy().astype('datetime64[D]')
+        last = np.ones(len(versions), dtype=bool)
+        last[:-1] = employee[1:] != employee[:-1]
+        effective_end = np.where(last, OPEN_END_DATE, np.roll(day, -1) - 1)
+        
+        return pd.DataFrame({
+            "employee_number": employee_ids[employee],
+            "assignment_id": employees_df['assignment_id'].to_numpy()[employee],
+            "assignment_version": versions.groupby(employee).cumcount().to_numpy() + 1,
+            "change_type": versions['change_type'].to_numpy(dtype=object),
+            "employment_status": np.where(
+                versions['change_type'] == "TERMINATION", "TERMINATED", "ACTIVE"
+            ).astype(object),
+            **{column: versions[column].to_numpy(dtype=object) for column in ASSIGNMENT_COLUMNS},
+            "effective_start_date": day.astype(object),
+            "effective_end_date": effective_end.astype(object),
+            "snapshot_date": np.maximum(day, start_day).astype(object),
+        })
+    
+    def _layer_above(self, depth: np.ndarray, event_emp: np.ndarray) -> tuple:
+        """Random manager one org layer above each event's employee.
+        
+        Args:
+            depth: Org depth of every employee
+            event_emp: Employee position of each event
+        
+        Returns:
+            (Array of manager positions, mask of events of root employees)
+        """
+        order = np.argsort(depth, kind='stable')
+        starts = np.searchsorted(depth[order], np.arange(depth.max() + 2))
+        layer = depth[event_emp] - 1
+        root = layer < 0
+        layer = np.maximum(layer, 0)
+        sizes = starts[layer + 1] - starts[layer]
+        picks = starts[layer] + (self.rng.random(len(event_emp)) * sizes).astype(np.int64)
+        return order[picks], root
+    
+    @staticmethod
+    def _job_ladder(jobs_df: pd.DataFrame, codes: np.ndarray) -> tuple:
+        """Job codes and the position each one is promoted to.
+        
+        A job is promoted to the lowest higher ``job_level`` in its family,
+        else the lowest higher level in any family; jobs at the top and
+        codes missing from jobs_df are promoted to themselves.
+        
+        Args:
+            jobs_df: Job data with job_code, job_family and job_level
+            codes: Employee job codes (may include codes not in jobs_df)
+        
+        Returns:
+            (Index of job codes, array of promotion target positions)
+        """
+        ladder = pd.Index(pd.unique(np.concatenate([
+            jobs_df['job_code'].astype(object).to_numpy(), codes
+        ])))
+        jobs = jobs_df.set_index(jobs_df['job_code'].astype(object))
+        families = jobs['job_family'].astype(object).reindex(ladder).to_numpy()
+        levels = jobs['job_level'].reindex(ladder).to_numpy(dtype=np.float64)
+        
+        promote_to = np.arange(len(ladder))
+        for position, (family, level) in enumerate(zip(families, levels)):
+            if np.isnan(level):
+                continue
+            higher = np.flatnonzero(levels > level)
+            same_family = higher[families[higher] == family]
+            candidates = same_family if len(same_family) else higher
+            if len(candidates):
+                promote_to[position] = candidates[np.argmin(levels[candidates])]
+        return ladder, promote_to
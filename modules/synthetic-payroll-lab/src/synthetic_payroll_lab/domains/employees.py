@@ -1,20 +1,45 @@
 """Employee and assignment data generator."""
 
-import random
 from datetime import datetime, timedelta
 from typing import List
 
+import numpy as np
 import pandas as pd
 from faker import Faker
 
+from synthetic_payroll_lab.random_state import SeedLike, make_rng, make_python_random
+
 
 class EmployeeGenerator:
     """Generate employee and assignment data with realistic demographics."""
     
-    def __init__(self, fake: Faker, seed: int = None):
+    def __init__(self, fake: Faker, seed: SeedLike = None, pool_size: int = 1000):
         self.fake = fake
-        if seed:
-            random.seed(seed)
+        self.rng = make_rng(seed)
+        self.random = make_python_random(self.rng)
+        
+        # Faker draws come from this generator's stream as well, through a
+        # private Faker (same locales) so the caller's instance is not reseeded
+        if seed is not None:
+            self.fake = Faker(fake.locales)
+            self.fake.seed_instance(int(self.rng.integers(2**32)))
+        
+        # Number of distinct Faker values sampled per PII field in bulk mode
+        self.pool_size = pool_size
+        
+        self.departments = [
+            "Engineering", "Sales", "Operations", "Marketing",
+            "Finance", "HR", "Customer Service", "IT"
+        ]
+        self.locations = [
+            "New York, NY", "San Francisco, CA", "Chicago, IL",
+            "Austin, TX", "Boston, MA", "Seattle, WA", "Denver, CO"
+        ]
+        self.employment_categories = ["FULL_TIME", "PART_TIME", "CONTRACTOR"]
+        self.employment_category_weights = [0.75, 0.15, 0.10]
+        self.turnover_rate = 0.15
+        self.union_rate = 0.30
+        self.manager_rate = 0.80
     
     def generate(
         self,
@@ -22,7 +47,8 @@ class EmployeeGenerator:
         start_date: datetime,
         end_date: datetime,
         job_codes: List[str],
-        cost_centers: List[str]
+        cost_centers: List[str],
+        id_offset: int = 0
     ) -> pd.DataFrame:
         """Generate employee and assignment data.
         
@@ -32,13 +58,14 @@ class EmployeeGenerator:
             end_date: End date for employment periods
             job_codes: List of valid job codes
             cost_centers: List of valid cost center codes
+            id_offset: Sequence number of the first employee generated
         
         Returns:
             DataFrame with employee and assignment data
         """
         employees = []
         
-        for i in range(count):
+        for i in range(id_offset, id_offset + count):
             emp_id = f"EMP{i:06d}"
             
             # Demographics
@@ -62,7 +89,7 @@ class EmployeeGenerator:
             )
             
             # Random terminations (15% turnover rate)
-            is_terminated = random.random() < 0.15
+            is_terminated = self.random.random() < self.turnover_rate
             termination_date = None
             employment_status = "ACTIVE"
             
@@ -77,31 +104,25 @@ class EmployeeGenerator:
                 employment_status = "TERMINATED"
             
             # Assignment attributes
-            job_code = random.choice(job_codes)
-            department = random.choice([
-                "Engineering", "Sales", "Operations", "Marketing",
-                "Finance", "HR", "Customer Service", "IT"
-            ])
-            location = random.choice([
-                "New York, NY", "San Francisco, CA", "Chicago, IL",
-                "Austin, TX", "Boston, MA", "Seattle, WA", "Denver, CO"
-            ])
-            cost_center = random.choice(cost_centers)
+            job_code = self.random.choice(job_codes)
+            department = self.random.choice(self.departments)
+            location = self.random.choice(self.locations)
+            cost_center = self.random.choice(cost_centers)
             
             # Employment category
-            employment_category = random.choices(
-                ["FULL_TIME", "PART_TIME", "CONTRACTOR"],
-                weights=[0.75, 0.15, 0.10]
+            employment_category = self.random.choices(
+                self.employment_categories,
+                weights=self.employment_category_weights
             )[0]
             
             # Union membership
-            union_flag = "Y" if random.random() < 0.30 else "N"
+            union_flag = "Y" if self.random.random() < self.union_rate else "N"
             
             # Manager (20% are managers, others report to managers)
             manager_id = None
-            if i > 0 and random.random() < 0.80:
+            if i > 0 and self.random.random() < self.manager_rate:
                 # Report to earlier employee (simplified hierarchy)
-                manager_id = f"EMP{random.randint(0, max(0, i-1)):06d}"
+                manager_id = f"EMP{self.random.randint(0, max(0, i-1)):06d}"
             
             employees.append({
                 # Person attributes
@@ -138,3 +159,156 @@ class EmployeeGenerator:
         
         return pd.DataFrame(employees)
 
+    
+    def generate_vectorized(
+        self,
+        count: int,
+        start_date: datetime,
+        end_date: datetime,
+        job_codes: List[str],
+        cost_centers: List[str],
+        id_offset: int = 0
+    ) -> pd.DataFrame:
+        """Generate employee and assignment data with bulk PII synthesis.
+        
+        Faker is sampled ``pool_size`` times per field into vocabulary pools,
+        and every employee draws pool indices with NumPy. SSNs, phone numbers
+        and ZIP codes are built from vectorized digit templates, and dates are
+        drawn as day offsets. A larger ``pool_size`` gives more distinct names
+        and addresses at the cost of more Faker calls. Dates of birth are
+        anchored to ``end_date`` so runs are reproducible.
+        
+        Args:
+            count: Number of employees to generate
+            start_date: Start date for employment periods
+            end_date: End date for employment periods
+            job_codes: List of valid job codes
+            cost_centers: List of valid cost center codes
+            id_offset: Sequence number of the first employee generated
+        
+        Returns:
+            DataFrame with employee and assignment data
+        """
+        rng = self.rng
+        seq = np.arange(id_offset, id_offset + count)
+        
+        # Vocabulary pools sampled once from Faker (never larger than needed)
+        pool_size = max(min(self.pool_size, count), 1)
+        first_names = self._sample_pool(self.fake.first_name, pool_size)
+        last_names = self._sample_pool(self.fake.last_name, pool_size)
+        addresses = self._sample_pool(self.fake.street_address, pool_size)
+        cities = self._sample_pool(self.fake.city, pool_size)
+        states = self._sample_pool(self.fake.state_abbr, pool_size)
+        
+        first_name = first_names[rng.integers(0, len(first_names), count)]
+        last_name = last_names[rng.integers(0, len(last_names), count)]
+        email = (
+            pd.Series(first_name).str.lower() + "." +
+            pd.Series(last_name).str.lower() + "@company.com"
+        ).to_numpy()
+        
+        # SSN: area 001-899 (excluding 666), group 01-99, serial 0001-9999
+        area = rng.integers(1, 899, count)
+        area = np.where(area >= 666, area + 1, area)
+        ssn = self._join_digits(
+            [(area, 3), (rng.integers(1, 100, count), 2), (rng.integers(1, 10000, count), 4)],
+            ["", "-", "-"]
+        )
+        phone = self._join_digits(
+            [(rng.integers(201, 990, count), 3), (rng.integers(200, 1000, count), 3),
+             (rng.integers(0, 10000, count), 4)],
+            ["(", ") ", "-"]
+        )
+        zip_code = self._join_digits([(rng.integers(501, 99951, count), 5)], [""])
+        
+        # Dates as day offsets
+        end_day = np.datetime64(end_date.date(), 'D')
+        start_day = np.datetime64(start_date.date(), 'D')
+        date_of_birth = end_day - rng.integers(18 * 365, 70 * 365 + 1, count).astype('timedelta64[D]')
+        hire_window = (end_day - (start_day - 1825)).astype(int)
+        hire_date = start_day - 1825 + rng.integers(0, hire_window + 1, count).astype('timedelta64[D]')
+        
+        # Random terminations (at least 90 days after hire)
+        terminated = (rng.random(count) < self.turnover_rate) & (hire_date < end_day - 90)
+        tenure_window = np.maximum((end_day - (hire_date + 90)).astype(int), 0)
+        termination_date = hire_date + 90 + (
+            rng.random(count) * (tenure_window + 1)
+        ).astype(int).astype('timedelta64[D]')
+        
+        hire_dates = hire_date.astype(object)
+        termination_dates = np.where(terminated, termination_date.astype(object), None)
+        effective_end_dates = np.where(
+            terminated, termination_dates, datetime(9999, 12, 31).date()
+        )
+        
+        # Manager (20% have none, others report to an earlier employee)
+        has_manager = (seq > 0) & (rng.random(count) < self.manager_rate)
+        manager_seq = (rng.random(count) * seq).astype(int)
+        manager_id = np.where(
+            has_manager,
+            np.char.add("EMP", np.char.zfill(manager_seq.astype(str), 6)).astype(object),
+            None
+        )
+        
+        return pd.DataFrame({
+            # Person attributes
+            "person_id": seq + 1,
+            "employee_number": np.char.add("EMP", np.char.zfill(seq.astype(str), 6)).astype(object),
+            "first_name": first_name,
+            "last_name": last_name,
+            "date_of_birth": date_of_birth.astype(object),
+            "national_identifier": ssn,  # PII
+            "email_address": email,
+            "phone_number": phone,
+            "address": addresses[rng.integers(0, len(addresses), count)],
+            "city": cities[rng.integers(0, len(cities), count)],
+            "state": states[rng.integers(0, len(states), count)],
+            "zip_code": zip_code,
+            
+            # Employment
+            "hire_date": hire_dates,
+            "termination_date": termination_dates,
+            "employment_status": np.where(terminated, "TERMINATED", "ACTIVE").astype(object),
+            "effective_start_date": hire_dates,
+            "effective_end_date": effective_end_dates,
+            
+            # Assignment
+            "assignment_id": seq + 1,
+            "job_code": np.asarray(job_codes, dtype=object)[rng.integers(0, len(job_codes), count)],
+            "department": np.array(self.departments, dtype=object)[
+                rng.integers(0, len(self.departments), count)
+            ],
+            "location": np.array(self.locations, dtype=object)[
+                rng.integers(0, len(self.locations), count)
+            ],
+            "manager_id": manager_id,
+            "cost_center": np.asarray(cost_centers, dtype=object)[
+                rng.integers(0, len(cost_centers), count)
+            ],
+            "employment_category": np.array(self.employment_categories, dtype=object)[
+                rng.choice(len(self.employment_categories), count, p=self.employment_category_weights)
+            ],
+            "union_flag": np.where(rng.random(count) < self.union_rate, "Y", "N").astype(object)
+        })
+    
+    @staticmethod
+    def _sample_pool(provider, size: int) -> np.ndarray:
+        """Sample a Faker provider ``size`` times into a value pool."""
+        return np.array([provider() for _ in range(size)], dtype=object)
+    
+    @staticmethod
+    def _join_digits(parts: list, separators: list) -> np.ndarray:
+        """Format zero-padded integer arrays into a delimited string template.
+        
+        Args:
+            parts: List of (values, width) pairs
+            separators: Literal placed before each part
+        
+        Returns:
+            Object array of formatted strings
+        """
+        result = None
+        for (values, width), separator in zip(parts, separators):
+            piece = np.char.add(separator, np.char.zfill(values.astype(str), width))
+            result = piece if result is None else np.char.add(result, piece)
+        return result.astype(object)
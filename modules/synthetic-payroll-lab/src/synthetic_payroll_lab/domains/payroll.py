@@ -1,19 +1,33 @@
 """Payroll run results generator."""
 
-import random
 from datetime import datetime, timedelta
 
+import numpy as np
 import pandas as pd
 from faker import Faker
 
+from synthetic_payroll_lab.random_state import SeedLike, make_rng, make_python_random
+
 
 class PayrollGenerator:
     """Generate payroll run results."""
     
-    def __init__(self, fake: Faker, seed: int = None):
+    def __init__(self, fake: Faker, seed: SeedLike = None):
         self.fake = fake
-        if seed:
-            random.seed(seed)
+        self.rng = make_rng(seed)
+        self.random = make_python_random(self.rng)
+        
+        # Pay and deduction assumptions
+        self.default_salary_range = {'min_salary': 50000, 'max_salary': 80000}
+        self.annual_hours = 2080
+        self.overtime_multiplier = 1.5
+        self.double_time_multiplier = 2.0
+        self.tax_rates = {'federal': 0.12, 'state': 0.05, 'fica': 0.0765}
+        self.deduction_401k_rates = [0.03, 0.05, 0.06, 0.00]
+        self.deduction_health_amounts = [0, 150, 300, 450]
+        self.deduction_dental_amounts = [0, 25, 50]
+        self.run_types = ['REGULAR', 'BONUS', 'ADJUSTMENT', 'CORRECTION']
+        self.run_type_weights = [0.90, 0.05, 0.03, 0.02]
     
     def generate(
         self,
@@ -72,42 +86,47 @@ class PayrollGenerator:
                 # Calculate hours
                 hours_regular = emp_timecards['hours_regular'].sum()
                 hours_overtime = emp_timecards['hours_overtime'].sum()
+                hours_double_time = emp_timecards['hours_double_time'].sum()
                 hours_pto = emp_timecards['hours_pto'].sum()
-                total_hours = hours_regular + hours_overtime + hours_pto
+                total_hours = hours_regular + hours_overtime + hours_double_time + hours_pto
                 
                 # Calculate pay based on job
-                job_info = job_lookup.get(job_code, {'min_salary': 50000, 'max_salary': 80000})
-                annual_salary = random.uniform(job_info['min_salary'], job_info['max_salary'])
+                job_info = job_lookup.get(job_code, self.default_salary_range)
+                annual_salary = self.random.uniform(job_info['min_salary'], job_info['max_salary'])
                 
                 # Calculate hourly rate (assuming 2080 hours/year)
-                hourly_rate = annual_salary / 2080
-                overtime_rate = hourly_rate * 1.5
+                hourly_rate = annual_salary / self.annual_hours
+                overtime_rate = hourly_rate * self.overtime_multiplier
+                double_time_rate = hourly_rate * self.double_time_multiplier
                 
                 # Gross pay
                 gross_pay_regular = hours_regular * hourly_rate
                 gross_pay_overtime = hours_overtime * overtime_rate
+                gross_pay_double_time = hours_double_time * double_time_rate
                 gross_pay_pto = hours_pto * hourly_rate
-                gross_pay = gross_pay_regular + gross_pay_overtime + gross_pay_pto
+                gross_pay = (
+                    gross_pay_regular + gross_pay_overtime + gross_pay_double_time + gross_pay_pto
+                )
                 
                 # Taxes (simplified)
-                tax_federal = gross_pay * 0.12  # Simplified federal tax
-                tax_state = gross_pay * 0.05    # Simplified state tax
-                tax_fica = gross_pay * 0.0765   # FICA (Social Security + Medicare)
+                tax_federal = gross_pay * self.tax_rates['federal']  # Simplified federal tax
+                tax_state = gross_pay * self.tax_rates['state']      # Simplified state tax
+                tax_fica = gross_pay * self.tax_rates['fica']        # FICA (Social Security + Medicare)
                 total_taxes = tax_federal + tax_state + tax_fica
                 
                 # Deductions
-                deduction_401k = gross_pay * random.choice([0.03, 0.05, 0.06, 0.00])
-                deduction_health = random.choice([0, 150, 300, 450])  # Monthly premium
-                deduction_dental = random.choice([0, 25, 50])
+                deduction_401k = gross_pay * self.random.choice(self.deduction_401k_rates)
+                deduction_health = self.random.choice(self.deduction_health_amounts)  # Monthly premium
+                deduction_dental = self.random.choice(self.deduction_dental_amounts)
                 total_deductions = deduction_401k + deduction_health + deduction_dental
                 
                 # Net pay
                 net_pay = gross_pay - total_taxes - total_deductions
                 
                 # Run type
-                run_type = random.choices(
-                    ['REGULAR', 'BONUS', 'ADJUSTMENT', 'CORRECTION'],
-                    weights=[0.90, 0.05, 0.03, 0.02]
+                run_type = self.random.choices(
+                    self.run_types,
+                    weights=self.run_type_weights
                 )[0]
                 
                 payroll_runs.append({
@@ -127,6 +146,7 @@ class PayrollGenerator:
                     "deduction_dental": round(deduction_dental, 2),
                     "hours_base": round(hours_regular, 2),
                     "hours_overtime": round(hours_overtime, 2),
+                    "hours_double_time": round(hours_double_time, 2),
                     "hours_pto": round(hours_pto, 2),
                     "hourly_rate": round(hourly_rate, 2),
                     "annual_salary": round(annual_salary, 2)
@@ -136,6 +156,294 @@ class PayrollGenerator:
         
         return pd.DataFrame(payroll_runs)
     
+    def generate_vectorized(
+        self,
+        employees_df: pd.DataFrame,
+        timecards_df: pd.DataFrame,
+        jobs_df: pd.DataFrame,
+        start_date: datetime,
+        end_date: datetime,
+        frequency: str = "biweekly"
+    ) -> pd.DataFrame:
+        """Generate payroll run results with a single group-by aggregation.
+        
+        Each timecard is assigned its pay period index in one pass, hours are
+        summed with one groupby over (period, employee), and pay, tax and
+        deduction columns are computed as whole arrays over the
+        (period x eligible employee) grid. Output columns and row order match
+        ``generate``; values come from a different random stream.
+        
+        Args:
+            employees_df: Employee data
+            timecards_df: Timecard data
+            jobs_df: Job data with salary ranges
+            start_date: Start date for payroll periods
+            end_date: End date for payroll periods
+            frequency: Payroll frequency (weekly, biweekly, semimonthly, monthly)
+        
+        Returns:
+            DataFrame with payroll run data
+        """
+        pay_periods = self._generate_pay_periods(start_date, end_date, frequency)
+        period_starts = np.array([start.date() for start, _ in pay_periods], dtype='datetime64[D]')
+        period_ends = np.array([end.date() for _, end in pay_periods], dtype='datetime64[D]')
+        num_periods = len(pay_periods)
+        
+        # Employees are keyed by position in the unique employee_number index
+        emp_ids = employees_df['employee_number'].to_numpy()
+        key_index = pd.Index(pd.unique(emp_ids))
+        emp_keys = key_index.get_indexer(emp_ids)
+        num_keys = len(key_index)
+        
+        # Sum hours per (period, employee) in one pass
+        hour_columns = ['hours_regular', 'hours_overtime', 'hours_double_time', 'hours_pto']
+        hour_totals = np.zeros((len(hour_columns), num_periods * num_keys))
+        if not timecards_df.empty and num_periods > 0:
+            work_dates = pd.to_datetime(timecards_df['work_date']).to_numpy().astype('datetime64[D]')
+            period_idx = np.searchsorted(period_starts, work_dates, side='right') - 1
+            tc_keys = key_index.get_indexer(timecards_df['employee_id'])
+            in_period = (
+                (period_idx >= 0) &
+                (work_dates <= period_ends[np.clip(period_idx, 0, num_periods - 1)]) &
+                (tc_keys >= 0)
+            )
+            sums = (
+                timecards_df.loc[in_period, hour_columns]
+                .groupby([period_idx[in_period], tc_keys[in_period]])
+                .sum()
+            )
+            flat = (
+                sums.index.get_level_values(0).to_numpy() * num_keys +
+                sums.index.get_level_values(1).to_numpy()
+            )
+            hour_totals[:, flat] = sums.to_numpy().T
+        
+        # Eligible (period, employee) grid: skip employees terminated before the period
+        termination = pd.to_datetime(employees_df['termination_date']).to_numpy().astype('datetime64[D]')
+        eligible = np.isnat(termination)[None, :] | (termination[None, :] >= period_starts[:, None])
+        grid_period, grid_emp = np.nonzero(eligible)
+        n = len(grid_period)
+        
+        flat = grid_period * num_keys + emp_keys[grid_emp]
+        hours_regular, hours_overtime, hours_double_time, hours_pto = hour_totals[:, flat]
+        
+        # Calculate pay based on job
+        salary_ranges = jobs_df.set_index('job_code')[['min_salary', 'max_salary']]
+        salary_ranges = salary_ranges.reindex(employees_df['job_code'])
+        min_salary = salary_ranges['min_salary'].fillna(self.default_salary_range['min_salary']).to_numpy()
+        max_salary = salary_ranges['max_salary'].fillna(self.default_salary_range['max_salary']).to_numpy()
+        annual_salary = self.rng.uniform(min_salary[grid_emp], max_salary[grid_emp])
+        
+        hourly_rate = annual_salary / self.annual_hours
+        overtime_rate = hourly_rate * self.overtime_multiplier
+        double_time_rate = hourly_rate * self.double_time_multiplier
+        gross_pay = (
+            (hours_regular + hours_pto) * hourly_rate +
+            hours_overtime * overtime_rate +
+            hours_double_time * double_time_rate
+        )
+        
+        # Taxes (simplified)
+        tax_federal = gross_pay * self.tax_rates['federal']
+        tax_state = gross_pay * self.tax_rates['state']
+        tax_fica = gross_pay * self.tax_rates['fica']
+        total_taxes = tax_federal + tax_state + tax_fica
+        
+        # Deductions
+        deduction_401k = gross_pay * self.rng.choice(self.deduction_401k_rates, size=n)
+        deduction_health = self.rng.choice(self.deduction_health_amounts, size=n)
+        deduction_dental = self.rng.choice(self.deduction_dental_amounts, size=n)
+        total_deductions = deduction_401k + deduction_health + deduction_dental
+        
+        net_pay = gross_pay - total_taxes - total_deductions
+        
+        run_types = np.array(self.run_types, dtype=object)
+        run_type = run_types[self.rng.choice(len(run_types), size=n, p=self.run_type_weights)]
+        
+        start_dates = np.array([start.date() for start, _ in pay_periods], dtype=object)
+        end_dates = np.array([end.date() for _, end in pay_periods], dtype=object)
+        
+        return pd.DataFrame({
+            "run_id": 1001 + grid_period,
+            "run_date": end_dates[grid_period],
+            "period_start": start_dates[grid_period],
+            "period_end": end_dates[grid_period],
+            "run_type": run_type,
+            "employee_id": emp_ids[grid_emp],
+            "gross_pay": gross_pay.round(2),
+            "net_pay": net_pay.round(2),
+            "tax_federal": tax_federal.round(2),
+            "tax_state": tax_state.round(2),
+            "tax_fica": tax_fica.round(2),
+            "deduction_401k": deduction_401k.round(2),
+            "deduction_health": deduction_health,
+            "deduction_dental": deduction_dental,
+            "hours_base": hours_regular.round(2),
+            "hours_overtime": hours_overtime.round(2),
+            "hours_double_time": hours_double_time.round(2),
+            "hours_pto": hours_pto.round(2),
+            "hourly_rate": hourly_rate.round(2),
+            "annual_salary": annual_salary.round(2)
+        })
+    
+    def generate_retro(
+        self,
+        payroll_df: pd.DataFrame,
+        timecards_df: pd.DataFrame,
+        max_lag_periods: int = 2,
+        max_hours_delta: float = 4.0,
+        retro_pay_rate: float = 0.01,
+        raise_pct_min: float = 0.01,
+        raise_pct_max: float = 0.05
+    ) -> pd.DataFrame:
+        """Generate retroactive correction rows for closed pay periods.
+        
+        Every ``adjustment_flag`` timecard gets a signed hours change in
+        quarter hours, paid in the correction run 1 to ``max_lag_periods``
+        periods after the timecard's own period; changes to one pay row
+        paid in the same run are summed. Positive changes on timecards that
+        already had overtime are overtime, and negative changes never
+        exceed the timecard's regular hours. Separately, ``retro_pay_rate``
+        of the pay rows get a retroactive raise paid the same way. Cards
+        and rows are matched to pay rows with one index lookup on
+        (period, employee), and all amounts are computed as arrays.
+        
+        Each correction row carries the correction run's ``run_id`` and
+        ``run_date``, the corrected period's dates and the ``original_run_id``
+        of the pay row it corrects. Pay, tax, deduction and hours columns
+        are signed deltas; ``hourly_rate`` and ``annual_salary`` are the rates
+        in effect after the correction. Hours changes are ``CORRECTION``
+        runs and raises ``ADJUSTMENT`` runs. Correction run IDs continue
+        after the last regular run, one per period, and corrections falling
+        after the last period are left out.
+        
+        Args:
+            payroll_df: Regular payroll runs, as from ``generate``
+            timecards_df: Timecards the runs were computed from
+            max_lag_periods: Most periods between a period and its correction
+            max_hours_delta: Largest hours change of one adjusted timecard
+            retro_pay_rate: Share of pay rows that get a retroactive raise
+            raise_pct_min: Smallest raise, as a fraction of the hourly rate
+            raise_pct_max: Largest raise, as a fraction of the hourly rate
+        
+        Returns:
+            DataFrame of correction rows with payroll_df's columns plus
+            ``original_run_id``
+        """
+        if payroll_df.empty:
+            return pd.DataFrame(columns=list(payroll_df.columns) + ['original_run_id'])
+        
+        # Regular runs in period order; a row's period is its run's position
+        runs = payroll_df[['run_id', 'period_start', 'period_end']].drop_duplicates('run_id')
+        runs = runs.sort_values('run_id', kind='stable')
+        run_ids = runs['run_id'].to_numpy()
+        num_periods = len(runs)
+        period_starts = np.asarray(pd.to_datetime(runs['period_start']).to_numpy(), dtype='datetime64[D]')
+        period_ends = np.asarray(pd.to_datetime(runs['period_end']).to_numpy(), dtype='datetime64[D]')
+        row_period = pd.Index(run_ids).get_indexer(payroll_df['run_id'])
+        row_index = pd.MultiIndex.from_arrays([row_period, payroll_df['employee_id']])
+        
+        # Hours changes of adjusted timecards
+        flagged = timecards_df[timecards_df['adjustment_flag'].to_numpy(dtype=bool, na_value=False)]
+        n_cards = len(flagged)
+        steps = int(max_hours_delta * 4)
+        delta = self.rng.integers(1, steps + 1, size=n_cards) / 4 * self.rng.choice([-1.0, 1.0], size=n_cards)
+        card_lag = self.rng.integers(1, max_lag_periods + 1, size=n_cards)
+        
+        card_rows = np.full(n_cards, -1)
+        card_period = np.full(n_cards, -1)
+        if n_cards and num_periods:
+            work_dates = np.asarray(pd.to_datetime(flagged['work_date']).to_numpy(), dtype='datetime64[D]')
+            card_period = np.searchsorted(period_starts, work_dates, side='right') - 1
+            in_period = (card_period >= 0) & (work_dates <= period_ends[np.clip(card_period, 0, None)])
+            card_period = np.where(in_period, card_period, -1)
+            card_rows = row_index.get_indexer(pd.MultiIndex.from_arrays([card_period, flagged['employee_id']]))
+        
+        hours_regular = flagged['hours_regular'].to_numpy(dtype=np.float64, na_value=0.0)
+        had_overtime = (
+            flagged['hours_overtime'].to_numpy(dtype=np.float64, na_value=0.0) +
+            flagged['hours_double_time'].to_numpy(dtype=np.float64, na_value=0.0)
+        ) > 0
+        delta = np.maximum(delta, -hours_regular)
+        to_overtime = (delta > 0) & had_overtime
+        
+        keep = (card_rows >= 0) & (card_period + card_lag < num_periods) & (delta != 0)
+        changes = pd.DataFrame({
+            'hours_regular': np.where(to_overtime, 0.0, delta)[keep],
+            'hours_overtime': np.where(to_overtime, delta, 0.0)[keep],
+        }).groupby([card_rows[keep], (card_period + card_lag)[keep]]).sum()
+        hours_rows = changes.index.get_level_values(0).to_numpy()
+        hours_runs = changes.index.get_level_values(1).to_numpy()
+        
+        # Retroactive raises on the whole pay row
+        picked = np.flatnonzero(self.rng.random(len(payroll_df)) < retro_pay_rate)
+        raise_pct = self.rng.uniform(raise_pct_min, raise_pct_max, size=len(picked))
+        raise_lag = self.rng.integers(1, max_lag_periods + 1, size=len(picked))
+        keep = (
+            (row_period[picked] + raise_lag < num_periods) &
+            (payroll_df['gross_pay'].to_numpy(dtype=np.float64)[picked] != 0)
+        )
+        raise_rows, raise_pct = picked[keep], raise_pct[keep]
+        raise_runs = row_period[raise_rows] + raise_lag[keep]
+        
+        # One array per output column over both kinds of correction
+        rows = np.concatenate([hours_rows, raise_rows]).astype(np.int64)
+        correction_period = np.concatenate([hours_runs, raise_runs]).astype(np.int64)
+        is_raise = np.arange(len(rows)) >= len(hours_rows)
+        order = np.lexsort((rows, is_raise, correction_period))
+        rows, correction_period, is_raise = rows[order], correction_period[order], is_raise[order]
+        n = len(rows)
+        
+        original = payroll_df.iloc[rows]
+        hourly_rate = original['hourly_rate'].to_numpy(dtype=np.float64)
+        annual_salary = original['annual_salary'].to_numpy(dtype=np.float64)
+        pct = np.concatenate([np.zeros(len(hours_rows)), raise_pct])[order]
+        delta_regular = np.concatenate([changes['hours_regular'].to_numpy(), np.zeros(len(raise_rows))])[order]
+        delta_overtime = np.concatenate([changes['hours_overtime'].to_numpy(), np.zeros(len(raise_rows))])[order]
+        
+        original_gross = original['gross_pay'].to_numpy(dtype=np.float64)
+        gross_pay = np.where(
+            is_raise,
+            original_gross * pct,
+            (delta_regular + delta_overtime * self.overtime_multiplier) * hourly_rate
+        )
+        
+        # Taxes and 401k at the rates of the original run
+        tax_federal = gross_pay * self.tax_rates['federal']
+        tax_state = gross_pay * self.tax_rates['state']
+        tax_fica = gross_pay * self.tax_rates['fica']
+        rate_401k = np.divide(
+            original['deduction_401k'].to_numpy(dtype=np.float64), original_gross,
+            out=np.zeros(n), where=original_gross != 0
+        )
+        deduction_401k = gross_pay * rate_401k
+        net_pay = gross_pay - tax_federal - tax_state - tax_fica - deduction_401k
+        
+        run_dates = runs['period_end'].to_numpy()
+        return pd.DataFrame({
+            "run_id": run_ids[-1] + correction_period if num_periods else correction_period,
+            "run_date": run_dates[correction_period],
+            "period_start": original['period_start'].to_numpy(),
+            "period_end": original['period_end'].to_numpy(),
+            "run_type": np.where(is_raise, 'ADJUSTMENT', 'CORRECTION').astype(object),
+            "employee_id": original['employee_id'].to_numpy(),
+            "gross_pay": gross_pay.round(2),
+            "net_pay": net_pay.round(2),
+            "tax_federal": tax_federal.round(2),
+            "tax_state": tax_state.round(2),
+            "tax_fica": tax_fica.round(2),
+            "deduction_401k": deduction_401k.round(2),
+            "deduction_health": np.zeros(n, dtype=payroll_df['deduction_health'].dtype),
+            "deduction_dental": np.zeros(n, dtype=payroll_df['deduction_dental'].dtype),
+            "hours_base": delta_regular.round(2),
+            "hours_overtime": delta_overtime.round(2),
+            "hours_double_time": np.zeros(n),
+            "hours_pto": np.zeros(n),
+            "hourly_rate": (hourly_rate * (1 + pct)).round(2),
+            "annual_salary": (annual_salary * (1 + pct)).round(2),
+            "original_run_id": pd.array(original['run_id'].to_numpy(), dtype="Int64")
+        }, columns=list(payroll_df.columns) + ['original_run_id'])
+    
     def _generate_pay_periods(
         self,
         start_date: datetime,
@@ -154,17 +462,7 @@ class PayrollGenerator:
         """
         periods = []
         current = start_date
-        
-        if frequency == "weekly":
-            delta = timedelta(days=7)
-        elif frequency == "biweekly":
-            delta = timedelta(days=14)
-        elif frequency == "semimonthly":
-            delta = timedelta(days=15)  # Simplified
-        elif frequency == "monthly":
-            delta = timedelta(days=30)  # Simplified
-        else:
-            delta = timedelta(days=14)  # Default to biweekly
+        delta = self.period_delta(frequency)
         
         while current < end_date:
             period_end = min(current + delta, end_date)
@@ -172,4 +470,23 @@ class PayrollGenerator:
             current = period_end + timedelta(days=1)
         
         return periods
-
+    
+    @staticmethod
+    def period_delta(frequency: str) -> timedelta:
+        """Offset from a pay period's first day to its last day.
+        
+        Args:
+            frequency: Payroll frequency
+        
+        Returns:
+            timedelta between period_start and period_end
+        """
+        if frequency == "weekly":
+            return timedelta(days=7)
+        elif frequency == "biweekly":
+            return timedelta(days=14)
+        elif frequency == "semimonthly":
+            return timedelta(days=15)  # Simplified
+        elif frequency == "monthly":
+            return timedelta(days=30)  # Simplified
+        return timedelta(days=14)  # Default to biweekly
@@ -1,20 +1,22 @@
 """Shift schedule generator."""
 
-import random
 from datetime import datetime, timedelta
 from typing import List
 
+import numpy as np
 import pandas as pd
 from faker import Faker
 
+from synthetic_payroll_lab.random_state import SeedLike, make_rng, make_python_random
+
 
 class ScheduleGenerator:
     """Generate shift schedules for employees."""
     
-    def __init__(self, fake: Faker, seed: int = None):
+    def __init__(self, fake: Faker, seed: SeedLike = None):
         self.fake = fake
-        if seed:
-            random.seed(seed)
+        self.rng = make_rng(seed)
+        self.random = make_python_random(self.rng)
         
         # Define shift types
         self.shift_types = {
@@ -23,6 +25,14 @@ class ScheduleGenerator:
             "NIGHT": (22, 6),     # 10 PM - 6 AM
             "SWING": (13, 21),    # 1 PM - 9 PM
         }
+        self.shift_weights = [0.70, 0.15, 0.10, 0.05]
+        
+        self.schedule_types = ["REGULAR", "ONCALL", "OVERTIME", "PTO", "TRAINING"]
+        self.schedule_weights = [0.75, 0.10, 0.08, 0.05, 0.02]
+        
+        # Attendance probabilities
+        self.weekend_off_rate = 0.7   # 70% don't work weekends
+        self.absence_rate = 0.05      # 5% weekday absence rate
         
         # Timezones for locations
         self.timezones = {
@@ -43,7 +53,8 @@ class ScheduleGenerator:
         employee_ids: List[str],
         employee_locations: dict,
         start_date: datetime,
-        end_date: datetime
+        end_date: datetime,
+        id_offset: int = 0
     ) -> pd.DataFrame:
         """Generate shift schedules for employees.
         
@@ -52,12 +63,13 @@ class ScheduleGenerator:
             employee_locations: Dict mapping employee_id to location
             start_date: Start date for schedules
             end_date: End date for schedules
+            id_offset: First sequence number used for schedule_id
         
         Returns:
             DataFrame with schedule data
         """
         schedules = []
-        schedule_id = 0
+        schedule_id = id_offset
         
         # Generate schedules for each day
         current_date = start_date
@@ -67,18 +79,18 @@ class ScheduleGenerator:
             
             for emp_id in employee_ids:
                 # Not everyone works every day
-                if is_weekend and random.random() < 0.7:  # 70% don't work weekends
+                if is_weekend and self.random.random() < self.weekend_off_rate:
                     continue
-                if not is_weekend and random.random() < 0.05:  # 5% absence rate
+                if not is_weekend and self.random.random() < self.absence_rate:
                     continue
                 
                 location = employee_locations.get(emp_id, "New York, NY")
                 timezone = self.timezones.get(location, "America/New_York")
                 
                 # Select shift type (most people work day shift)
-                shift_type = random.choices(
+                shift_type = self.random.choices(
                     list(self.shift_types.keys()),
-                    weights=[0.70, 0.15, 0.10, 0.05]
+                    weights=self.shift_weights
                 )[0]
                 
                 start_hour, end_hour = self.shift_types[shift_type]
@@ -94,9 +106,9 @@ class ScheduleGenerator:
                 shift_end = datetime.combine(end_date_adj.date(), datetime.min.time()) + \
                             timedelta(hours=end_hour)
                 
-                schedule_type = random.choices(
-                    ["REGULAR", "ONCALL", "OVERTIME", "PTO", "TRAINING"],
-                    weights=[0.75, 0.10, 0.08, 0.05, 0.02]
+                schedule_type = self.random.choices(
+                    self.schedule_types,
+                    weights=self.schedule_weights
                 )[0]
                 
                 schedules.append({
@@ -118,3 +130,83 @@ class ScheduleGenerator:
         
         return pd.DataFrame(schedules)
 
+    
+    def generate_vectorized(
+        self,
+        employee_ids: List[str],
+        employee_locations: dict,
+        start_date: datetime,
+        end_date: datetime,
+        id_offset: int = 0
+    ) -> pd.DataFrame:
+        """Generate shift schedules using columnar NumPy draws.
+        
+        Attendance, shift types and schedule types are drawn for the whole
+        (day x employee) grid at once instead of row by row. Output columns
+        and row order (day-major, then employee) match ``generate``; the
+        random streams differ, so values are reproducible per seed but not
+        identical to the row-wise engine.
+        
+        Args:
+            employee_ids: List of employee IDs to schedule
+            employee_locations: Dict mapping employee_id to location
+            start_date: Start date for schedules
+            end_date: End date for schedules
+            id_offset: First sequence number used for schedule_id
+        
+        Returns:
+            DataFrame with schedule data
+        """
+        employee_ids = np.asarray(employee_ids, dtype=object)
+        days = pd.date_range(start_date.date(), end_date.date(), freq="D")
+        
+        # Attendance mask for every (day, employee) cell
+        is_weekend = (days.weekday >= 5)[:, None]
+        draws = self.rng.random((len(days), len(employee_ids)))
+        works = np.where(
+            is_weekend,
+            draws >= self.weekend_off_rate,
+            draws >= self.absence_rate
+        )
+        day_idx, emp_idx = np.nonzero(works)
+        n = len(day_idx)
+        
+        # Per-employee attributes are resolved once and broadcast by index
+        locations = np.array(
+            [employee_locations.get(emp_id, "New York, NY") for emp_id in employee_ids],
+            dtype=object
+        )
+        timezones = np.array(
+            [self.timezones.get(loc, "America/New_York") for loc in locations],
+            dtype=object
+        )
+        
+        shift_names = np.array(list(self.shift_types.keys()), dtype=object)
+        shift_codes = self.rng.choice(len(shift_names), size=n, p=self.shift_weights)
+        schedule_names = np.array(self.schedule_types, dtype=object)
+        schedule_codes = self.rng.choice(len(schedule_names), size=n, p=self.schedule_weights)
+        
+        # Shift boundaries as hour offsets from midnight (overnight shifts end next day)
+        start_hours = np.array([start for start, _ in self.shift_types.values()])
+        end_hours = np.array([
+            end + 24 if end < start else end
+            for start, end in self.shift_types.values()
+        ])
+        day_values = days.values[day_idx]
+        shift_start = day_values + start_hours[shift_codes].astype("timedelta64[h]")
+        shift_end = day_values + end_hours[shift_codes].astype("timedelta64[h]")
+        
+        schedule_type = schedule_names[schedule_codes]
+        
+        return pd.DataFrame({
+            "schedule_id": [f"SCH{i:08d}" for i in range(id_offset, id_offset + n)],
+            "employee_id": employee_ids[emp_idx],
+            "shift_date": days.date[day_idx],
+            "shift_start": shift_start,
+            "shift_end": shift_end,
+            "shift_type": shift_names[shift_codes],
+            "timezone": timezones[emp_idx],
+            "location": locations[emp_idx],
+            "schedule_type": schedule_type,
+            "hours_scheduled": np.where(schedule_type == "PTO", 0.0, 8.0)
+        })
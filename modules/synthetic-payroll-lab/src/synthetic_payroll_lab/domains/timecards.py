@@ -1,26 +1,37 @@
 """Timecard and punch data generator."""
 
-import random
 from datetime import datetime, timedelta
 from typing import List
 
+import numpy as np
 import pandas as pd
 from faker import Faker
 
+from synthetic_payroll_lab.random_state import SeedLike, make_rng, make_python_random
+
 
 class TimecardGenerator:
     """Generate timecard punch records."""
     
-    def __init__(self, fake: Faker, seed: int = None):
+    def __init__(self, fake: Faker, seed: SeedLike = None):
         self.fake = fake
-        if seed:
-            random.seed(seed)
+        self.rng = make_rng(seed)
+        self.random = make_python_random(self.rng)
+        
+        # Punch variation profiles: (label, weight, max minutes off schedule)
+        self.punch_in_variations = [('late', 0.10, 30), ('early', 0.05, 15), ('ontime', 0.85, 0)]
+        self.punch_out_variations = [('early', 0.05, 30), ('late', 0.15, 180), ('ontime', 0.80, 0)]
+        
+        self.approval_statuses = ['PENDING', 'APPROVED', 'REJECTED']
+        self.approval_weights = [0.05, 0.93, 0.02]
+        self.adjustment_rate = 0.05
     
     def generate(
         self,
         schedules_df: pd.DataFrame,
         start_date: datetime,
-        end_date: datetime
+        end_date: datetime,
+        id_offset: int = 0
     ) -> pd.DataFrame:
         """Generate timecard records based on schedules.
         
@@ -28,12 +39,13 @@ class TimecardGenerator:
             schedules_df: DataFrame with schedule data
             start_date: Start date for timecards
             end_date: End date for timecards
+            id_offset: First sequence number used for timecard_id
         
         Returns:
             DataFrame with timecard data
         """
         timecards = []
-        timecard_id = 0
+        timecard_id = id_offset
         
         for _, schedule in schedules_df.iterrows():
             # Skip PTO schedules (no punches)
@@ -47,28 +59,28 @@ class TimecardGenerator:
             
             # Simulate punch variations
             # 10% late, 5% early, 85% on time
-            punch_variation = random.choices(
-                ['late', 'early', 'ontime'],
-                weights=[0.10, 0.05, 0.85]
+            punch_variation = self.random.choices(
+                [label for label, _, _ in self.punch_in_variations],
+                weights=[weight for _, weight, _ in self.punch_in_variations]
             )[0]
             
             if punch_variation == 'late':
-                punch_in = scheduled_start + timedelta(minutes=random.randint(1, 30))
+                punch_in = scheduled_start + timedelta(minutes=self.random.randint(1, 30))
             elif punch_variation == 'early':
-                punch_in = scheduled_start - timedelta(minutes=random.randint(1, 15))
+                punch_in = scheduled_start - timedelta(minutes=self.random.randint(1, 15))
             else:
                 punch_in = scheduled_start
             
             # End time variations
-            end_variation = random.choices(
-                ['early', 'late', 'ontime'],
-                weights=[0.05, 0.15, 0.80]  # 15% work overtime
+            end_variation = self.random.choices(
+                [label for label, _, _ in self.punch_out_variations],
+                weights=[weight for _, weight, _ in self.punch_out_variations]  # 15% work overtime
             )[0]
             
             if end_variation == 'early':
-                punch_out = scheduled_end - timedelta(minutes=random.randint(1, 30))
+                punch_out = scheduled_end - timedelta(minutes=self.random.randint(1, 30))
             elif end_variation == 'late':
-                punch_out = scheduled_end + timedelta(minutes=random.randint(1, 180))  # Up to 3 hrs OT
+                punch_out = scheduled_end + timedelta(minutes=self.random.randint(1, 180))  # Up to 3 hrs OT
             else:
                 punch_out = scheduled_end
             
@@ -76,13 +88,9 @@ class TimecardGenerator:
             hours_worked = (punch_out - punch_in).total_seconds() / 3600
             hours_scheduled = schedule['hours_scheduled']
             
-            # Overtime calculation (over 8 hours/day or 40 hours/week)
-            if hours_worked > 8:
-                hours_overtime = hours_worked - 8
-                hours_regular = 8.0
-            else:
-                hours_overtime = 0.0
-                hours_regular = hours_worked
+            # All hours start as regular; OvertimeCalculator splits overtime
+            hours_regular = hours_worked
+            hours_overtime = 0.0
             
             # PTO hours (if applicable)
             hours_pto = 0.0
@@ -91,14 +99,14 @@ class TimecardGenerator:
                 hours_regular = 0.0
             
             # Approval status
-            approval_status = random.choices(
-                ['PENDING', 'APPROVED', 'REJECTED'],
-                weights=[0.05, 0.93, 0.02]
+            approval_status = self.random.choices(
+                self.approval_statuses,
+                weights=self.approval_weights
             )[0]
             
             # Adjustment flag (for late-arriving corrections)
             adjustment_flag = False
-            if random.random() < 0.05:  # 5% are adjustments
+            if self.random.random() < self.adjustment_rate:  # 5% are adjustments
                 adjustment_flag = True
             
             timecards.append({
@@ -110,6 +118,7 @@ class TimecardGenerator:
                 "hours_worked": round(hours_worked, 2),
                 "hours_regular": round(hours_regular, 2),
                 "hours_overtime": round(hours_overtime, 2),
+                "hours_double_time": 0.0,
                 "hours_pto": round(hours_pto, 2),
                 "approval_status": approval_status,
                 "adjustment_flag": adjustment_flag,
@@ -120,3 +129,79 @@ class TimecardGenerator:
         
         return pd.DataFrame(timecards)
 
+    
+    def generate_vectorized(
+        self,
+        schedules_df: pd.DataFrame,
+        start_date: datetime,
+        end_date: datetime,
+        id_offset: int = 0
+    ) -> pd.DataFrame:
+        """Generate timecard records as whole-column array operations.
+        
+        Punch offsets, hours, approval status and adjustment flags are
+        drawn for every schedule at once instead of iterating rows. Output
+        columns match ``generate``; values are reproducible per seed but come
+        from a different random stream than the row-wise engine.
+        
+        Args:
+            schedules_df: DataFrame with schedule data
+            start_date: Start date for timecards
+            end_date: End date for timecards
+            id_offset: First sequence number used for timecard_id
+        
+        Returns:
+            DataFrame with timecard data
+        """
+        # Skip PTO schedules (no punches)
+        worked = schedules_df[schedules_df['schedule_type'] != 'PTO']
+        n = len(worked)
+        
+        punch_in = worked['shift_start'].to_numpy(dtype='datetime64[ns]')
+        punch_in = punch_in + self._draw_offsets(self.punch_in_variations, n)
+        punch_out = worked['shift_end'].to_numpy(dtype='datetime64[ns]')
+        punch_out = punch_out + self._draw_offsets(self.punch_out_variations, n)
+        
+        # Calculate hours (all regular; OvertimeCalculator splits overtime)
+        hours_worked = (punch_out - punch_in) / np.timedelta64(1, 'h')
+        
+        approval_codes = self.rng.choice(
+            len(self.approval_statuses), size=n, p=self.approval_weights
+        )
+        
+        return pd.DataFrame({
+            "timecard_id": [f"TC{i:08d}" for i in range(id_offset, id_offset + n)],
+            "employee_id": worked['employee_id'].to_numpy(),
+            "work_date": worked['shift_date'].to_numpy(),
+            "punch_in": punch_in,
+            "punch_out": punch_out,
+            "hours_worked": hours_worked.round(2),
+            "hours_regular": hours_worked.round(2),
+            "hours_overtime": np.zeros(n),
+            "hours_double_time": np.zeros(n),
+            "hours_pto": np.zeros(n),
+            "approval_status": np.array(self.approval_statuses, dtype=object)[approval_codes],
+            "adjustment_flag": self.rng.random(n) < self.adjustment_rate,
+            "shift_type": worked['shift_type'].to_numpy()
+        })
+    
+    def _draw_offsets(self, variations: list, size: int) -> np.ndarray:
+        """Draw signed punch offsets for a variation profile.
+        
+        Args:
+            variations: List of (label, weight, max_minutes) tuples
+            size: Number of offsets to draw
+        
+        Returns:
+            Array of timedelta64[m] offsets
+        """
+        codes = self.rng.choice(
+            len(variations), size=size, p=[weight for _, weight, _ in variations]
+        )
+        max_minutes = np.array([max_min for _, _, max_min in variations])[codes]
+        minutes = self.rng.integers(1, np.maximum(max_minutes, 1) + 1)
+        direction = np.array([
+            1 if label == 'late' else -1 if label == 'early' else 0
+            for label, _, _ in variations
+        ])[codes]
+        return (minutes * direction).astype('timedelta64[m]')
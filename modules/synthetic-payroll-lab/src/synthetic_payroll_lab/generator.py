@@ -1,16 +1,29 @@
 """Main payroll data generator class."""
 
 import os
-from datetime import datetime, timedelta
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional, Dict, Any
-import random
+from typing import Optional, Dict, Any, Callable, Iterator, Tuple
 
+import numpy as np
 import pandas as pd
 from faker import Faker
 
-from synthetic_payroll_lab.config import PayrollConfig, ChaosConfig
+from synthetic_payroll_lab.config import (
+    PayrollConfig,
+    ChaosConfig,
+    OutputConfig,
+    OvertimeConfig,
+    RetroConfig,
+    AssignmentHistoryConfig,
+    OrgTreeConfig
+)
+from synthetic_payroll_lab.compact import compact_frame, expand_compact
 from synthetic_payroll_lab.domains.employees import EmployeeGenerator
+from synthetic_payroll_lab.domains.assignments import AssignmentHistoryGenerator
 from synthetic_payroll_lab.domains.jobs import JobGenerator
 from synthetic_payroll_lab.domains.cost_centers import CostCenterGenerator
 from synthetic_payroll_lab.domains.schedules import ScheduleGenerator
@@ -21,8 +34,71 @@ from synthetic_payroll_lab.chaos import (
     NullInjector,
     LateArrivalInjector,
     SchemaDriftInjector,
-    FKOrphanInjector
+    FKOrphanInjector,
+    TimezoneErrorInjector,
+    ChaosPipeline
+)
+from synthetic_payroll_lab.chaos.schema_drift import SCHEMA_VERSIONS_ATTR
+from synthetic_payroll_lab.incremental import IncrementalState
+from synthetic_payroll_lab.instrumentation import TRACE_FILE, RunMetrics
+from synthetic_payroll_lab.org_tree import OrgTreeBuilder, closure_table
+from synthetic_payroll_lab.overtime import (
+    OVERTIME_COLUMNS,
+    WEEKDAYS,
+    OvertimeCalculator,
+    work_states
 )
+from synthetic_payroll_lab.random_state import make_rng, stream_seed
+from synthetic_payroll_lab.writers import (
+    DEFAULT_PARTITION_COLUMNS,
+    SCHEMA_FORMATS,
+    write_bigquery_schema,
+    write_frame,
+    write_partitioned,
+    write_manifest,
+    read_manifest
+)
+
+# Supported generation engines
+ENGINES = ("python", "numpy")
+
+# Foreign key columns orphaned by chaos, per domain
+CHAOS_FK_COLUMNS = {
+    "timecards": ["employee_id"],
+    "employees": ["cost_center", "job_code", "manager_id"],
+    "assignment_history": ["cost_center", "job_code", "manager_id"],
+}
+
+# Upstream domains each domain is generated from, in generation order
+DOMAIN_DEPENDENCIES = {
+    "jobs": (),
+    "cost_centers": (),
+    "employees": ("jobs", "cost_centers"),
+    "schedules": ("employees",),
+    "timecards": ("schedules",),
+    "payroll_runs": ("employees", "timecards", "jobs"),
+}
+
+# Domains generated only when configured, with their upstream domains
+OPTIONAL_DOMAIN_DEPENDENCIES = {
+    "assignment_history": ("employees", "jobs", "cost_centers"),
+    "org_closure": ("employees",),
+}
+
+# Generator setting that enables each optional domain
+OPTIONAL_DOMAIN_SETTINGS = {
+    "assignment_history": "history",
+    "org_closure": "org",
+}
+
+# Pay run frequency for generated payroll runs
+PAY_FREQUENCY = "biweekly"
+
+# Sequential ID columns re-assigned after shards are merged: domain -> (column, prefix)
+SEQUENCE_ID_COLUMNS = {
+    "schedules": ("schedule_id", "SCH"),
+    "timecards": ("timecard_id", "TC"),
+}
 
 
 class PayrollGenerator:
@@ -42,6 +118,23 @@ class PayrollGenerator:
         end_date: End date for time-series data (YYYY-MM-DD)
         chaos: ChaosConfig for injecting data quality issues
         seed: Random seed for reproducibility
+        engine: Generation engine ('python' row-wise or 'numpy' columnar)
+        output: OutputConfig with writer options (compression, row group size)
+        workers: Processes for sharded generation (None generates in-process, unsharded)
+        shard_size: Employees per shard when workers is set
+        pii_pool_size: Distinct Faker values per PII field in numpy-engine bulk synthesis
+        trace_memory: Trace Python allocations per stage with tracemalloc (slower)
+        compact: Hold domains in compact dtypes (categories, integer IDs,
+            datetime64 dates, int64 cents); requires the numpy engine
+        overtime: OvertimeConfig with the weekly threshold and state daily
+            rules used to split timecard hours
+        retro: RetroConfig to append retroactive correction runs to payroll
+            runs (None for regular runs only)
+        history: AssignmentHistoryConfig to also generate the
+            ``assignment_history`` domain, written as daily change files
+        org: OrgTreeConfig to assign managers as a job-level org tree and
+            also generate its ``org_closure`` domain (None keeps random
+            earlier-employee managers)
     
     Example:
         >>> gen = PayrollGenerator(employees=1000, start_date="2024-01-01")
@@ -54,33 +147,78 @@ class PayrollGenerator:
         start_date: str = "2024-01-01",
         end_date: str = "2024-12-31",
         chaos: Optional[ChaosConfig] = None,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        engine: str = "python",
+        output: Optional[OutputConfig] = None,
+        workers: Optional[int] = None,
+        shard_size: int = 10000,
+        pii_pool_size: int = 1000,
+        trace_memory: bool = False,
+        compact: bool = False,
+        overtime: Optional[OvertimeConfig] = None,
+        retro: Optional[RetroConfig] = None,
+        history: Optional[AssignmentHistoryConfig] = None,
+        org: Optional[OrgTreeConfig] = None
     ):
+        if engine not in ENGINES:
+            raise ValueError(f"Unsupported engine: {engine}")
+        if workers is not None and workers <= 0:
+            raise ValueError(f"workers must be positive: {workers}")
+        if shard_size <= 0:
+            raise ValueError(f"shard_size must be positive: {shard_size}")
+        if pii_pool_size <= 0:
+            raise ValueError(f"pii_pool_size must be positive: {pii_pool_size}")
+        if compact and engine != "numpy":
+            raise ValueError("compact dtypes require the numpy engine")
+        
         self.employees = employees
         self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
         self.end_date = datetime.strptime(end_date, "%Y-%m-%d")
         self.chaos = chaos or ChaosConfig()
         self.seed = seed
+        self.engine = engine
+        self.output = output or OutputConfig()
+        self.workers = workers
+        self.shard_size = shard_size
+        self.pii_pool_size = pii_pool_size
+        self.compact = compact
+        self.overtime = overtime or OvertimeConfig()
+        self.retro = retro
+        self.history = history
+        self.org = org
+        if history is not None and "assignment_history" not in self.output.partition_by:
+            # History is written as one change snapshot per day
+            self.output = self.output.model_copy(update={"partition_by": {
+                **self.output.partition_by,
+                "assignment_history": DEFAULT_PARTITION_COLUMNS["assignment_history"],
+            }})
         
-        # Initialize Faker
-        if seed:
-            Faker.seed(seed)
-            random.seed(seed)
+        # Shared Faker for generators that don't draw PII; each domain
+        # generator and chaos injector seeds its own stream via _stream()
         self.fake = Faker()
         
-        # Will store generated data
+        # Clean (pre-chaos) domains generated so far, filled by get_domain
         self._data_cache: Dict[str, pd.DataFrame] = {}
+        
+        # Per-stage spans of the last generate_all_domains run
+        self.metrics = RunMetrics(trace_memory=trace_memory)
     
     def generate_all_domains(
         self, 
         output_path: str = "./landing",
-        format: str = "csv"
+        format: str = "csv",
+        trace: bool = False
     ) -> Dict[str, pd.DataFrame]:
-        """Generate all 6 payroll domains and write to output.
+        """Generate all 6 payroll domains (and enabled optional ones) and write to output.
+        
+        Each domain generation, chaos injector and domain write is timed as
+        a span in ``self.metrics`` (a ``RunMetrics``), with the process RSS
+        and, if ``trace_memory`` is set, tracemalloc allocations.
         
         Args:
             output_path: Directory to write output files
-            format: Output format (csv, json, parquet)
+            format: Output format (csv, json, parquet, feather, avro, ndjson)
+            trace: Also write the spans as a Chrome trace to ``<output_path>/_trace.json``
         
         Returns:
             Dictionary of domain_name -> DataFrame
@@ -91,55 +229,459 @@ class PayrollGenerator:
         print(f"   Chaos Mode: {'Enabled' if self.chaos else 'Disabled'}")
         print()
         
-        domains = {}
+        self._data_cache = {}
+        
+        with self.metrics:
+            # Resolve every domain once, upstream domains first
+            print("📊 Generating domains...")
+            if self.workers:
+                jobs_df = self.get_domain('jobs')
+                cost_centers_df = self.get_domain('cost_centers')
+                with self.metrics.span("generate.sharded", "generate", workers=self.workers):
+                    for domain_name, df in self._generate_sharded(jobs_df, cost_centers_df).items():
+                        self._data_cache[domain_name] = self._compact(df)
+            domains = {domain_name: self.get_domain(domain_name) for domain_name in self._dependencies()}
+            
+            # Apply chaos patterns if enabled
+            if self.chaos:
+                print(f"\n🌪️  Applying chaos patterns...")
+                domains = self._apply_chaos(domains)
+            
+            # Write to output
+            print(f"\n💾 Writing to {output_path}/...")
+            self._write_domains(domains, output_path, format)
+        
+        if trace:
+            trace_path = self.metrics.write_chrome_trace(Path(output_path) / TRACE_FILE)
+            print(f"\n📈 Trace written to {trace_path}")
+        
+        print("\n✅ Generation complete!")
+        return domains
+    
+    def get_domain(self, domain_name: str) -> pd.DataFrame:
+        """Return a clean domain, generating it on first use.
+        
+        Upstream domains from ``DOMAIN_DEPENDENCIES`` (and, for optional
+        domains, ``OPTIONAL_DOMAIN_DEPENDENCIES``) are resolved first
+        the same way, so requesting one domain generates exactly the domains
+        it needs, each once. Results are memoized in ``_data_cache`` until
+        the next ``generate_all_domains`` run. With ``compact`` set, domains
+        are converted to compact dtypes as soon as they are generated and
+        downstream domains are built from the compact frames.
+        
+        Args:
+            domain_name: Name of the domain
         
-        # Generate each domain (order matters due to dependencies)
-        print("📊 Generating domains...")
-        domains['jobs'] = self._generate_jobs()
-        domains['cost_centers'] = self._generate_cost_centers()
-        domains['employees'] = self._generate_employees()
-        domains['schedules'] = self._generate_schedules()
-        domains['timecards'] = self._generate_timecards()
-        domains['payroll_runs'] = self._generate_payroll_runs()
+        Returns:
+            Domain DataFrame (without chaos)
+        """
+        dependencies = self._dependencies()
+        if domain_name not in dependencies:
+            raise ValueError(f"Unknown domain: {domain_name}")
         
-        # Cache for future use
-        self._data_cache = domains.copy()
+        df = self._data_cache.get(domain_name)
+        if df is None:
+            upstream = {name: self.get_domain(name) for name in dependencies[domain_name]}
+            generate = getattr(self, f"_generate_{domain_name}")
+            with self.metrics.span(f"generate.{domain_name}", "generate", domain=domain_name) as span:
+                df = self._compact(generate(**upstream))
+                span.args['rows'] = len(df)
+            self._data_cache[domain_name] = df
+        return df
+    
+    def generate_streaming(
+        self,
+        output_path: str = "./landing",
+        format: str = "csv",
+        chunk_size: int = 10000
+    ) -> Dict[str, int]:
+        """Generate all domains in employee-range chunks and write as they go.
+        
+        Employees, schedules, timecards and payroll runs are produced for
+        ``chunk_size`` employees at a time, chaos is applied to the chunk and
+        each domain is written as ``domain=<name>/part-NNNNN.<ext>`` before
+        the next chunk is generated, so peak memory is bounded by the chunk
+        size rather than the dataset size. Each chunk draws from its own
+        random streams keyed by the chunk number. With ``workers``
+        set, up to two chunks per worker are generated ahead in a process pool.
         
-        # Apply chaos patterns if enabled
+        Args:
+            output_path: Directory to write output files
+            format: Output format (csv, json, parquet, feather, avro, ndjson)
+            chunk_size: Number of employees per chunk
+        
+        Returns:
+            Dictionary of domain_name -> rows written
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive: {chunk_size}")
+        
+        num_chunks = -(-self.employees // chunk_size)
+        print(f"🚀 Starting streaming payroll data generation...")
+        print(f"   Employees: {self.employees:,} in {num_chunks:,} chunks of {chunk_size:,}")
+        print(f"   Date Range: {self.start_date.date()} to {self.end_date.date()}")
+        print(f"   Chaos Mode: {'Enabled' if self.chaos else 'Disabled'}")
+        print()
+        
+        output_dir = Path(output_path)
+        row_counts: Dict[str, int] = {}
+        manifests: Dict[str, list] = {}
+        
+        # Reference domains are small and written once
+        print("📊 Generating reference domains...")
+        jobs_df = self._generate_jobs()
+        cost_centers_df = self._generate_cost_centers()
+        reference = {'jobs': jobs_df, 'cost_centers': cost_centers_df}
         if self.chaos:
-            print(f"\n🌪️  Applying chaos patterns...")
-            domains = self._apply_chaos(domains)
+            reference = self._apply_chaos(reference)
+        self._write_domains(reference, output_path, format)
+        for domain_name, df in reference.items():
+            row_counts[domain_name] = len(df)
+        
+        id_offsets: Dict[str, int] = {}
+        schemas: Dict[str, Any] = {}
+        shards = self._iter_shards(chunk_size, jobs_df, cost_centers_df)
+        for chunk_id, chunk in enumerate(shards):
+            emp_offset = chunk_id * chunk_size
+            count = len(chunk['employees'])
+            print(f"\n📦 Chunk {chunk_id + 1}/{num_chunks}: employees {emp_offset:,}-{emp_offset + count - 1:,}")
+            
+            self._assign_sequence_ids(chunk, id_offsets)
+            chunk = {domain_name: self._compact(df) for domain_name, df in chunk.items()}
+            
+            if self.chaos:
+                chunk = self._apply_chaos(chunk, chunk_id)
+            
+            for domain_name, df in chunk.items():
+                domain_dir = output_dir / f"domain={domain_name}"
+                domain_dir.mkdir(parents=True, exist_ok=True)
+                entries = self._write_domain(df, domain_dir, domain_name, format, chunk_id)
+                if domain_name in self.output.partition_by:
+                    manifests.setdefault(domain_name, []).extend(entries)
+                    schemas[domain_name] = df.attrs.get(SCHEMA_VERSIONS_ATTR)
+                row_counts[domain_name] = row_counts.get(domain_name, 0) + len(df)
+            
+            # Release the chunk before generating the next one
+            del chunk
         
-        # Write to output
-        print(f"\n💾 Writing to {output_path}/...")
-        self._write_domains(domains, output_path, format)
+        for domain_name, entries in manifests.items():
+            write_manifest(
+                output_dir / f"domain={domain_name}",
+                domain_name,
+                self.output.partition_by[domain_name],
+                format,
+                entries,
+                schema=schemas.get(domain_name)
+            )
         
         print("\n✅ Generation complete!")
-        return domains
+        return row_counts
     
-    def _generate_employees(self) -> pd.DataFrame:
-        """Generate employee and assignment data."""
-        print("   → Generating employees...")
+    def generate_incremental(
+        self,
+        output_path: str = "./landing",
+        format: str = "csv",
+        days: int = 1
+    ) -> Dict[str, int]:
+        """Append the next ``days`` days to a landing zone.
         
-        # Generate jobs and cost centers first (needed for employees)
-        jobs_df = self._data_cache.get('jobs')
-        if jobs_df is None:
-            jobs_df = self._generate_jobs()
-            self._data_cache['jobs'] = jobs_df
+        The first call generates jobs, cost centers and the employee roster,
+        writes them, and saves a state snapshot under ``_state/`` starting at
+        ``start_date``. Every call then loads the snapshot and, for each day,
+        generates only that day's schedules and timecards plus the pay run
+        whose period closes that day. Those rows are appended as new date
+        partitions (``domain=<name>/<column>=YYYY-MM-DD/part-NNNNN.<ext>``,
+        NNNNN being the day number), the manifests are updated and the
+        snapshot (roster, next IDs, open-period timecards, RNG state) is
+        saved. Re-running a day whose snapshot was not saved overwrites its
+        partition files instead of duplicating them.
         
-        cost_centers_df = self._data_cache.get('cost_centers')
-        if cost_centers_df is None:
-            cost_centers_df = self._generate_cost_centers()
-            self._data_cache['cost_centers'] = cost_centers_df
+        Args:
+            output_path: Landing zone directory (holds the ``_state`` snapshot)
+            format: Output format (csv, json, parquet, feather, avro, ndjson)
+            days: Number of days to append
         
-        emp_gen = EmployeeGenerator(self.fake, self.seed)
-        return emp_gen.generate(
-            count=self.employees,
-            start_date=self.start_date,
-            end_date=self.end_date,
-            job_codes=jobs_df['job_code'].tolist(),
-            cost_centers=cost_centers_df['cost_center_code'].tolist()
+        Returns:
+            Dictionary of domain_name -> rows written by this call
+        """
+        if days <= 0:
+            raise ValueError(f"days must be positive: {days}")
+        
+        output_dir = Path(output_path)
+        state = IncrementalState.load(output_dir)
+        row_counts: Dict[str, int] = {}
+        if state is None:
+            state = self._init_incremental(output_path, format)
+            row_counts = {'jobs': len(state.jobs), 'employees': len(state.roster)}
+        
+        print(f"🚀 Appending {days} day(s) from {state.next_date} to {output_path}/...")
+        for _ in range(days):
+            for domain_name, rows in self._generate_day(state, output_dir, format).items():
+                row_counts[domain_name] = row_counts.get(domain_name, 0) + rows
+            state.save(output_dir)
+        
+        print("\n✅ Generation complete!")
+        return row_counts
+    
+    def _init_incremental(self, output_path: str, format: str) -> IncrementalState:
+        """Write reference domains and the roster, and build the initial snapshot."""
+        print("📊 Initializing incremental landing zone...")
+        jobs_df = self._generate_jobs()
+        cost_centers_df = self._generate_cost_centers()
+        roster = self._build_employees(jobs_df, cost_centers_df, count=self.employees)
+        
+        reference = {'jobs': jobs_df, 'cost_centers': cost_centers_df, 'employees': roster}
+        if self.chaos:
+            reference = self._apply_chaos(reference)
+        self._write_domains(reference, output_path, format)
+        
+        return IncrementalState(
+            start_date=self.start_date.date(),
+            next_date=self.start_date.date(),
+            period_start=self.start_date.date(),
+            next_ids={},
+            next_run_id=1001,
+            rng_state=make_rng(self._stream("incremental")).bit_generator.state,
+            roster=roster,
+            jobs=jobs_df,
+            open_timecards=pd.DataFrame(),
+            week_timecards=pd.DataFrame()
+        )
+    
+    def _generate_day(
+        self,
+        state: IncrementalState,
+        output_dir: Path,
+        format: str
+    ) -> Dict[str, int]:
+        """Generate and append one day, advancing state in place.
+        
+        Args:
+            state: Incremental snapshot (updated in place)
+            output_dir: Landing zone directory
+            format: Output format
+        
+        Returns:
+            Dictionary of domain_name -> rows written
+        """
+        day = state.next_date
+        print(f"\n📅 {day}")
+        
+        # One draw from the persisted root stream seeds all of the day's streams
+        rng = state.rng()
+        day_seed = int(rng.integers(2**63))
+        state.rng_state = rng.bit_generator.state
+        
+        day_gen = self._window_generator(day, day, day_seed)
+        domains = {}
+        domains['schedules'] = day_gen._build_schedules(state.roster)
+        if day.weekday() == WEEKDAYS[self.overtime.week_start]:
+            state.week_timecards = pd.DataFrame()
+        domains['timecards'] = day_gen._build_timecards(
+            domains['schedules'], prior_timecards=state.week_timecards
+        )
+        self._assign_sequence_ids(domains, state.next_ids)
+        week_rows = domains['timecards'][OVERTIME_COLUMNS]
+        if state.week_timecards.empty:
+            state.week_timecards = week_rows.reset_index(drop=True)
+        else:
+            state.week_timecards = pd.concat([state.week_timecards, week_rows], ignore_index=True)
+        
+        if state.open_timecards.empty:
+            state.open_timecards = domains['timecards']
+        else:
+            state.open_timecards = pd.concat(
+                [state.open_timecards, domains['timecards']], ignore_index=True
+            )
+        
+        # Close the pay period ending today
+        period_end = state.period_start + PayrollDomainGenerator.period_delta(PAY_FREQUENCY)
+        if day == period_end:
+            period_gen = self._window_generator(state.period_start, period_end, day_seed)
+            payroll_runs = period_gen._build_payroll_runs(
+                state.roster, state.open_timecards, state.jobs
+            )
+            payroll_runs['run_id'] = state.next_run_id
+            domains['payroll_runs'] = payroll_runs
+            state.next_run_id += 1
+            state.period_start = period_end + timedelta(days=1)
+            state.open_timecards = pd.DataFrame()
+        
+        if self.chaos:
+            domains = day_gen._apply_chaos(domains, drift_anchor=state.start_date)
+        
+        part_name = f"part-{(day - state.start_date).days:05d}"
+        row_counts = {}
+        for domain_name, df in domains.items():
+            domain_dir = output_dir / f"domain={domain_name}"
+            domain_dir.mkdir(parents=True, exist_ok=True)
+            partition_column = self.output.partition_by.get(
+                domain_name, DEFAULT_PARTITION_COLUMNS[domain_name]
+            )
+            if format in SCHEMA_FORMATS:
+                write_bigquery_schema(df, domain_dir, exclude=[partition_column])
+            entries = write_partitioned(
+                df, domain_dir, partition_column, format, self.output, part_name=part_name
+            )
+            rewritten = {entry['path'] for entry in entries}
+            kept = [entry for entry in read_manifest(domain_dir) if entry['path'] not in rewritten]
+            write_manifest(
+                domain_dir, domain_name, partition_column, format, kept + entries,
+                schema=df.attrs.get(SCHEMA_VERSIONS_ATTR)
+            )
+            print(f"      ✓ {domain_name}: {len(df):,} rows → {domain_dir}/")
+            row_counts[domain_name] = len(df)
+        
+        state.next_date = day + timedelta(days=1)
+        return row_counts
+    
+    def _window_generator(self, start: date, end: date, seed: int) -> "PayrollGenerator":
+        """Generator with this one's settings over [start, end], seeded by seed."""
+        return PayrollGenerator(
+            employees=self.employees,
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
+            chaos=self.chaos,
+            seed=seed,
+            engine=self.engine,
+            output=self.output,
+            pii_pool_size=self.pii_pool_size,
+            overtime=self.overtime,
+            retro=self.retro,
+            history=self.history,
+            org=self.org
+        )
+    
+    def _generate_sharded(
+        self,
+        jobs_df: pd.DataFrame,
+        cost_centers_df: pd.DataFrame
+    ) -> Dict[str, pd.DataFrame]:
+        """Generate employee-scoped domains per shard and merge in shard order.
+        
+        Shard boundaries depend only on ``shard_size`` and sequential IDs are
+        assigned after the merge, so the result is identical for any number
+        of workers.
+        """
+        print(f"   → Generating employee shards on {self.workers} worker(s)...")
+        frames: Dict[str, list] = {}
+        for shard in self._iter_shards(self.shard_size, jobs_df, cost_centers_df):
+            for domain_name, df in shard.items():
+                frames.setdefault(domain_name, []).append(df)
+        
+        merged = {
+            domain_name: pd.concat(dfs, ignore_index=True)
+            for domain_name, dfs in frames.items()
+        }
+        self._assign_sequence_ids(merged, {})
+        return merged
+    
+    def _iter_shards(
+        self,
+        shard_size: int,
+        jobs_df: pd.DataFrame,
+        cost_centers_df: pd.DataFrame
+    ) -> Iterator[Dict[str, pd.DataFrame]]:
+        """Yield employee-scoped domains for each shard, in shard order.
+        
+        Shards run in-process unless ``workers`` > 1, in which case at most
+        two shards per worker are in flight at once.
+        """
+        generator_kwargs = {
+            "employees": self.employees,
+            "start_date": self.start_date.strftime("%Y-%m-%d"),
+            "end_date": self.end_date.strftime("%Y-%m-%d"),
+            "seed": self.seed,
+            "engine": self.engine,
+            "pii_pool_size": self.pii_pool_size,
+            "overtime": self.overtime,
+            "retro": self.retro,
+            "history": self.history,
+            "org": self.org,
+        }
+        tasks = (
+            (generator_kwargs, shard_id, emp_offset, min(shard_size, self.employees - emp_offset),
+             jobs_df, cost_centers_df)
+            for shard_id, emp_offset in enumerate(range(0, self.employees, shard_size))
         )
+        
+        if not self.workers or self.workers == 1:
+            for task in tasks:
+                yield _generate_shard(task)
+            return
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for task in tasks:
+                pending.append(executor.submit(_generate_shard, task))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+    
+    def _build_shard(
+        self,
+        shard_id: int,
+        emp_offset: int,
+        count: int,
+        jobs_df: pd.DataFrame,
+        cost_centers_df: pd.DataFrame
+    ) -> Dict[str, pd.DataFrame]:
+        """Build employees, schedules, timecards and payroll runs for one shard.
+        
+        Schedule and timecard IDs are local to the shard; callers re-number
+        them with ``_assign_sequence_ids``.
+        """
+        shard_key = ("shard", shard_id)
+        shard = {}
+        shard['employees'] = self._build_employees(
+            jobs_df, cost_centers_df, count=count, id_offset=emp_offset, stream_key=shard_key
+        )
+        shard['schedules'] = self._build_schedules(shard['employees'], shard_key)
+        shard['timecards'] = self._build_timecards(shard['schedules'], shard_key)
+        shard['payroll_runs'] = self._build_payroll_runs(
+            shard['employees'], shard['timecards'], jobs_df, shard_key
+        )
+        if self.history is not None:
+            shard['assignment_history'] = self._build_assignment_history(
+                shard['employees'], jobs_df, cost_centers_df, shard_key
+            )
+        if self.org is not None:
+            shard['org_closure'] = self._build_org_closure(shard['employees'])
+        return shard
+    
+    def _dependencies(self) -> Dict[str, Tuple[str, ...]]:
+        """Upstream domains of every domain this generator produces, in order."""
+        return {**DOMAIN_DEPENDENCIES, **{
+            domain_name: upstream
+            for domain_name, upstream in OPTIONAL_DOMAIN_DEPENDENCIES.items()
+            if getattr(self, OPTIONAL_DOMAIN_SETTINGS[domain_name]) is not None
+        }}
+    
+    def _stream(self, *key: Any) -> Optional[np.random.SeedSequence]:
+        """Seed sequence for the named random stream (None when unseeded)."""
+        return stream_seed(self.seed, *key)
+    
+    @staticmethod
+    def _assign_sequence_ids(domains: Dict[str, pd.DataFrame], offsets: Dict[str, int]) -> None:
+        """Re-number sequential IDs in place, continuing from offsets.
+        
+        Args:
+            domains: Dictionary of domain DataFrames (modified in place)
+            offsets: Next sequence number per domain (updated in place)
+        """
+        for domain_name, (column, prefix) in SEQUENCE_ID_COLUMNS.items():
+            df = domains.get(domain_name)
+            if df is None or column not in df.columns:
+                continue
+            start = offsets.get(domain_name, 0)
+            df[column] = [f"{prefix}{i:08d}" for i in range(start, start + len(df))]
+            offsets[domain_name] = start + len(df)
+    
+    def _generate_employees(self, jobs: pd.DataFrame, cost_centers: pd.DataFrame) -> pd.DataFrame:
+        """Generate employee and assignment data."""
+        print("   → Generating employees...")
+        return self._build_employees(jobs, cost_centers, count=self.employees)
     
     def _generate_jobs(self) -> pd.DataFrame:
         """Generate job codes and titles."""
@@ -153,16 +695,81 @@ class PayrollGenerator:
         cc_gen = CostCenterGenerator()
         return cc_gen.generate(count=50)
     
-    def _generate_schedules(self) -> pd.DataFrame:
+    def _generate_schedules(self, employees: pd.DataFrame) -> pd.DataFrame:
         """Generate shift schedules."""
         print("   → Generating schedules...")
+        return self._build_schedules(employees)
+    
+    def _generate_timecards(self, schedules: pd.DataFrame) -> pd.DataFrame:
+        """Generate timecard punch data."""
+        print("   → Generating timecards...")
+        return self._build_timecards(schedules)
+    
+    def _generate_payroll_runs(
+        self, employees: pd.DataFrame, timecards: pd.DataFrame, jobs: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Generate payroll run results."""
+        print("   → Generating payroll runs...")
+        return self._build_payroll_runs(employees, timecards, jobs)
+    
+    def _generate_assignment_history(
+        self, employees: pd.DataFrame, jobs: pd.DataFrame, cost_centers: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Generate effective-dated assignment changes."""
+        print("   → Generating assignment history...")
+        return self._build_assignment_history(employees, jobs, cost_centers)
+    
+    def _generate_org_closure(self, employees: pd.DataFrame) -> pd.DataFrame:
+        """Generate the manager hierarchy closure table."""
+        print("   → Generating org closure...")
+        return self._build_org_closure(employees)
+    
+    def _compact(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert a generated frame to compact dtypes when compact mode is on."""
+        return compact_frame(df) if self.compact else df
+    
+    def _generate_fn(self, domain_gen: Any) -> Callable[..., pd.DataFrame]:
+        """Pick the domain generator method matching the configured engine."""
+        if self.engine == "numpy" and hasattr(domain_gen, "generate_vectorized"):
+            return domain_gen.generate_vectorized
+        return domain_gen.generate
+    
+    def _build_employees(
+        self,
+        jobs_df: pd.DataFrame,
+        cost_centers_df: pd.DataFrame,
+        count: int,
+        id_offset: int = 0,
+        stream_key: Tuple = ()
+    ) -> pd.DataFrame:
+        """Build employees for an employee-number range.
         
-        # Get employee data
-        employees_df = self._data_cache.get('employees')
-        if employees_df is None:
-            employees_df = self._generate_employees()
-            self._data_cache['employees'] = employees_df
-        
+        With ``org`` set, managers are re-assigned as an org tree over the
+        range's employees.
+        """
+        emp_gen = EmployeeGenerator(
+            Faker(), self._stream("employees", *stream_key), pool_size=self.pii_pool_size
+        )
+        employees_df = self._generate_fn(emp_gen)(
+            count=count,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            job_codes=jobs_df['job_code'].tolist(),
+            cost_centers=cost_centers_df['cost_center_code'].tolist(),
+            id_offset=id_offset
+        )
+        if self.org is not None:
+            OrgTreeBuilder(self.org, self._stream("org_tree", *stream_key)).assign_managers_in_place(
+                employees_df, jobs_df
+            )
+        return employees_df
+    
+    def _build_schedules(
+        self,
+        employees_df: pd.DataFrame,
+        stream_key: Tuple = ()
+    ) -> pd.DataFrame:
+        """Build schedules for the active employees in employees_df."""
         # Create employee location mapping
         emp_locations = dict(zip(
             employees_df['employee_number'],
@@ -174,129 +781,214 @@ class PayrollGenerator:
             employees_df['employment_status'] == 'ACTIVE'
         ]['employee_number'].tolist()
         
-        schedule_gen = ScheduleGenerator(self.fake, self.seed)
-        return schedule_gen.generate(
+        schedule_gen = ScheduleGenerator(self.fake, self._stream("schedules", *stream_key))
+        return self._generate_fn(schedule_gen)(
             employee_ids=active_employees,
             employee_locations=emp_locations,
             start_date=self.start_date,
             end_date=self.end_date
         )
     
-    def _generate_timecards(self) -> pd.DataFrame:
-        """Generate timecard punch data."""
-        print("   → Generating timecards...")
-        
-        # Get schedules first
-        schedules_df = self._data_cache.get('schedules')
-        if schedules_df is None:
-            schedules_df = self._generate_schedules()
-            self._data_cache['schedules'] = schedules_df
+    def _build_timecards(
+        self,
+        schedules_df: pd.DataFrame,
+        stream_key: Tuple = (),
+        prior_timecards: Optional[pd.DataFrame] = None
+    ) -> pd.DataFrame:
+        """Build timecards from schedules_df, splitting overtime per workweek.
         
-        timecard_gen = TimecardGenerator(self.fake, self.seed)
-        return timecard_gen.generate(
+        Args:
+            schedules_df: Schedules to punch
+            stream_key: Random stream key suffix (shard)
+            prior_timecards: Earlier timecards of the open workweeks, counted
+                toward the weekly threshold (incremental runs)
+        """
+        timecard_gen = TimecardGenerator(self.fake, self._stream("timecards", *stream_key))
+        timecards_df = self._generate_fn(timecard_gen)(
             schedules_df=schedules_df,
             start_date=self.start_date,
             end_date=self.end_date
         )
+        locations = schedules_df.drop_duplicates('employee_id').set_index('employee_id')['location']
+        OvertimeCalculator(self.overtime).split_in_place(
+            timecards_df, work_states(locations), prior=prior_timecards
+        )
+        return timecards_df
     
-    def _generate_payroll_runs(self) -> pd.DataFrame:
-        """Generate payroll run results."""
-        print("   → Generating payroll runs...")
-        
-        # Get all dependencies
-        employees_df = self._data_cache.get('employees')
-        if employees_df is None:
-            employees_df = self._generate_employees()
-            self._data_cache['employees'] = employees_df
-        
-        timecards_df = self._data_cache.get('timecards')
-        if timecards_df is None:
-            timecards_df = self._generate_timecards()
-            self._data_cache['timecards'] = timecards_df
-        
-        jobs_df = self._data_cache.get('jobs')
-        if jobs_df is None:
-            jobs_df = self._generate_jobs()
-            self._data_cache['jobs'] = jobs_df
+    def _build_payroll_runs(
+        self,
+        employees_df: pd.DataFrame,
+        timecards_df: pd.DataFrame,
+        jobs_df: pd.DataFrame,
+        stream_key: Tuple = ()
+    ) -> pd.DataFrame:
+        """Build payroll runs for employees_df from timecards_df.
         
-        payroll_gen = PayrollDomainGenerator(self.fake, self.seed)
-        return payroll_gen.generate(
+        With ``retro`` set, correction runs for the window's closed periods
+        are appended after the regular runs, from their own random stream.
+        """
+        payroll_gen = PayrollDomainGenerator(self.fake, self._stream("payroll_runs", *stream_key))
+        payroll_df = self._generate_fn(payroll_gen)(
             employees_df=employees_df,
             timecards_df=timecards_df,
+            # Salary ranges are read in currency units, not compact cents
+            jobs_df=expand_compact(jobs_df),
+            start_date=self.start_date,
+            end_date=self.end_date,
+            frequency=PAY_FREQUENCY
+        )
+        if self.retro is None:
+            return payroll_df
+        
+        retro_gen = PayrollDomainGenerator(self.fake, self._stream("retro", *stream_key))
+        corrections = retro_gen.generate_retro(
+            payroll_df, timecards_df, **self.retro.model_dump()
+        )
+        payroll_df['original_run_id'] = pd.array([pd.NA] * len(payroll_df), dtype="Int64")
+        return pd.concat([payroll_df, corrections], ignore_index=True)
+    
+    def _build_assignment_history(
+        self,
+        employees_df: pd.DataFrame,
+        jobs_df: pd.DataFrame,
+        cost_centers_df: pd.DataFrame,
+        stream_key: Tuple = ()
+    ) -> pd.DataFrame:
+        """Build assignment versions for employees_df over the date range."""
+        history_gen = AssignmentHistoryGenerator(self.fake, self._stream("assignment_history", *stream_key))
+        return history_gen.generate(
+            # Versions carry the same ID and date values as employees
+            employees_df=expand_compact(employees_df),
             jobs_df=jobs_df,
+            cost_centers=expand_compact(cost_centers_df)['cost_center_code'].tolist(),
             start_date=self.start_date,
             end_date=self.end_date,
-            frequency="biweekly"
+            changes_per_year=self.history.changes_per_year,
+            change_type_weights=self.history.change_type_weights,
+            org_tree=self.org is not None
         )
     
-    def _apply_chaos(self, domains: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    def _build_org_closure(self, employees_df: pd.DataFrame) -> pd.DataFrame:
+        """Build the closure table of employees_df's manager hierarchy."""
+        # Pairs carry the same ID values as employees
+        return closure_table(expand_compact(employees_df), max_depth=self.org.max_depth)
+    
+    def _apply_chaos(
+        self,
+        domains: Dict[str, pd.DataFrame],
+        chunk_id: Optional[int] = None,
+        drift_anchor: Optional[date] = None
+    ) -> Dict[str, pd.DataFrame]:
         """Apply chaos patterns to generated domains.
         
+        Each injector gets its own random stream per domain (and per chunk
+        when streaming), so the chaos applied to one domain does not depend
+        on which other domains were processed before it. Injections are
+        composed into a ``ChaosPipeline`` so each domain is copied once and
+        then modified in place, and the input frames are left untouched.
+        
+        Schema drift is recorded as ``SchemaVersions`` in ``df.attrs`` rather
+        than as dense columns; writers give each file only the drift columns
+        in effect for its rows. Versions count from ``drift_anchor`` so they
+        line up across chunks, shards and incremental days.
+        
         Args:
             domains: Dictionary of domain DataFrames
+            chunk_id: Streaming chunk number, if any
+            drift_anchor: Date schema version 0 starts (defaults to start_date)
         
         Returns:
             Dictionary of domains with chaos applied
         """
         result = {}
-        
-        # Initialize injectors
-        dup_injector = DuplicateInjector(self.seed)
-        null_injector = NullInjector(self.seed)
-        late_injector = LateArrivalInjector(self.seed)
-        drift_injector = SchemaDriftInjector(self.seed)
-        fk_injector = FKOrphanInjector(self.seed)
+        chunk_key = () if chunk_id is None else ("chunk", chunk_id)
         
         for domain_name, df in domains.items():
-            working_df = df.copy()
+            # Initialize injectors
+            stream_key = (domain_name,) + chunk_key
+            dup_injector = DuplicateInjector(self._stream("chaos", "duplicates", *stream_key))
+            null_injector = NullInjector(self._stream("chaos", "nulls", *stream_key))
+            late_injector = LateArrivalInjector(self._stream("chaos", "late_arrivals", *stream_key))
+            drift_injector = SchemaDriftInjector(self._stream("chaos", "schema_drift", *stream_key))
+            fk_injector = FKOrphanInjector(self._stream("chaos", "fk_orphans", *stream_key))
+            tz_injector = TimezoneErrorInjector(self._stream("chaos", "timezone_errors", *stream_key))
+            
+            # Plan every injection, then materialize the domain once
+            pipeline = ChaosPipeline()
             
             # 1. Inject duplicates
             if self.chaos.duplicate_rate > 0:
-                working_df = dup_injector.inject(working_df, self.chaos.duplicate_rate)
+                pipeline.add_row_plan(
+                    partial(dup_injector.plan, rate=self.chaos.duplicate_rate), name='duplicates'
+                )
                 print(f"   → Duplicates injected into {domain_name}: {self.chaos.duplicate_rate*100:.1f}%")
             
             # 2. Inject nulls (not on key columns)
             if self.chaos.null_spike_rate > 0:
-                working_df = null_injector.inject(working_df, self.chaos.null_spike_rate)
+                pipeline.add_step(
+                    partial(null_injector.inject_in_place, rate=self.chaos.null_spike_rate), name='nulls'
+                )
                 print(f"   → Null spikes injected into {domain_name}: {self.chaos.null_spike_rate*100:.1f}%")
             
             # 3. Late arrivals (timecards only)
             if domain_name == 'timecards' and self.chaos.late_arrival_pct > 0:
-                working_df = late_injector.inject(
-                    working_df, 
-                    self.chaos.late_arrival_pct,
-                    date_column='work_date'
-                )
+                pipeline.add_step(partial(
+                    late_injector.inject_in_place,
+                    rate=self.chaos.late_arrival_pct,
+                    date_column='work_date',
+                    max_lag_days=self.chaos.late_arrival_max_lag_days,
+                    lag_distribution=self.chaos.late_arrival_lag_distribution,
+                    lag_p=self.chaos.late_arrival_lag_p,
+                    lag_weights=self.chaos.late_arrival_lag_weights
+                ), name='late_arrivals')
                 print(f"   → Late arrivals marked in timecards: {self.chaos.late_arrival_pct*100:.1f}%")
             
-            # 4. Schema drift (progressive)
+            # 4. Timezone errors (punch and shift timestamps)
+            if self.chaos.timezone_error_rate > 0 and domain_name in ['schedules', 'timecards']:
+                pipeline.add_step(
+                    partial(tz_injector.inject_in_place, rate=self.chaos.timezone_error_rate),
+                    name='timezone_errors'
+                )
+                print(f"   → Timezone errors injected into {domain_name}: {self.chaos.timezone_error_rate*100:.1f}%")
+            
+            # 5. Schema drift (progressive)
             if self.chaos.schema_drift_days > 0 and domain_name in ['timecards', 'employees']:
                 date_col = 'work_date' if domain_name == 'timecards' else 'hire_date'
-                if date_col in working_df.columns:
-                    working_df = drift_injector.inject_progressive(
-                        working_df,
+                if date_col in df.columns:
+                    pipeline.add_step(partial(
+                        drift_injector.attach_progressive,
                         date_column=date_col,
-                        drift_interval_days=self.chaos.schema_drift_days
-                    )
+                        drift_interval_days=self.chaos.schema_drift_days,
+                        anchor_date=drift_anchor or self.start_date
+                    ), name='schema_drift')
                     print(f"   → Schema drift applied to {domain_name} every {self.chaos.schema_drift_days} days")
             
-            # 5. FK orphans
+            # 6. FK orphans
             if self.chaos.fk_orphan_rate > 0:
-                if domain_name == 'timecards':
-                    working_df = fk_injector.inject(working_df, 'employee_id', self.chaos.fk_orphan_rate)
-                    print(f"   → FK orphans created in {domain_name}: {self.chaos.fk_orphan_rate*100:.1f}%")
-                elif domain_name == 'employees':
-                    working_df = fk_injector.inject_multiple(
-                        working_df,
-                        ['cost_center', 'job_code', 'manager_id'],
-                        self.chaos.fk_orphan_rate
-                    )
+                fk_columns = CHAOS_FK_COLUMNS.get(domain_name, [])
+                for fk_column in fk_columns:
+                    pipeline.add_step(partial(
+                        fk_injector.inject_in_place,
+                        fk_column=fk_column,
+                        rate=self.chaos.fk_orphan_rate
+                    ), name=f'fk_orphans.{fk_column}')
+                if fk_columns:
                     print(f"   → FK orphans created in {domain_name}: {self.chaos.fk_orphan_rate*100:.1f}%")
             
-            result[domain_name] = working_df
+            with self.metrics.span(f"chaos.{domain_name}", "chaos", domain=domain_name) as span:
+                result[domain_name] = pipeline.apply(
+                    df, span=partial(self._chaos_span, domain_name)
+                )
+                span.args['rows'] = len(result[domain_name])
         
         return result
     
+    def _chaos_span(self, domain_name: str, stage: str):
+        """Span for one chaos injector applied to a domain."""
+        return self.metrics.span(
+            f"chaos.{domain_name}.{stage}", "chaos", domain=domain_name, injector=stage
+        )
+    
     def _write_domains(
         self, 
         domains: Dict[str, pd.DataFrame], 
@@ -312,17 +1004,74 @@ class PayrollGenerator:
             domain_dir = output_dir / f"domain={domain_name}"
             domain_dir.mkdir(exist_ok=True)
             
-            # Write file
-            if format == 'csv':
-                filepath = domain_dir / f"{domain_name}.csv"
-                df.to_csv(filepath, index=False)
-            elif format == 'json':
-                filepath = domain_dir / f"{domain_name}.json"
-                df.to_json(filepath, orient='records', lines=True)
-            else:
-                raise ValueError(f"Unsupported format: {format}")
-            
+            with self.metrics.span(
+                f"write.{domain_name}", "write", domain=domain_name, format=format, rows=len(df)
+            ):
+                entries = self._write_domain(df, domain_dir, domain_name, format)
+                if domain_name in self.output.partition_by:
+                    write_manifest(
+                        domain_dir, domain_name, self.output.partition_by[domain_name], format,
+                        entries, schema=df.attrs.get(SCHEMA_VERSIONS_ATTR)
+                    )
+    
+    def _write_domain(
+        self,
+        df: pd.DataFrame,
+        domain_dir: Path,
+        domain_name: str,
+        format: str,
+        chunk_id: Optional[int] = None
+    ) -> list:
+        """Write one domain frame, partitioned if configured for the domain.
+        
+        Avro and NDJSON domains also get a BigQuery ``_schema.json`` (for
+        streaming, rewritten with each chunk).
+        
+        Args:
+            df: Domain DataFrame
+            domain_dir: Domain output directory
+            domain_name: Name of the domain
+            format: Output format
+            chunk_id: Streaming chunk number (None for a single-shot write)
+        
+        Returns:
+            Manifest entries for partitioned domains, else an empty list
+        """
+        part_name = f"part-{chunk_id or 0:05d}"
+        partition_column = self.output.partition_by.get(domain_name)
+        if format in SCHEMA_FORMATS:
+            # Partition values come from the Hive path, not the files
+            exclude = [partition_column] if partition_column else []
+            write_bigquery_schema(df, domain_dir, exclude=exclude)
+        if partition_column is None:
+            if chunk_id is None:
+                part_name = domain_name
+            filepath = write_frame(df, domain_dir / part_name, format, self.output)
             print(f"      ✓ {domain_name}: {len(df):,} rows → {filepath}")
+            return []
+        
+        entries = write_partitioned(
+            df, domain_dir, partition_column, format, self.output, part_name=part_name
+        )
+        print(
+            f"      ✓ {domain_name}: {len(df):,} rows → {domain_dir}/ "
+            f"({len(entries):,} {partition_column} partitions)"
+        )
+        return entries
+
+
+def _generate_shard(task: Tuple) -> Dict[str, pd.DataFrame]:
+    """Generate one employee shard (process-pool entry point).
+    
+    Args:
+        task: (generator_kwargs, shard_id, emp_offset, count, jobs_df, cost_centers_df)
+    
+    Returns:
+        Dictionary of employee-scoped domain DataFrames for the shard
+    """
+    generator_kwargs, shard_id, emp_offset, count, jobs_df, cost_centers_df = task
+    gen = PayrollGenerator(**generator_kwargs)
+    return gen._build_shard(shard_id, emp_offset, count, jobs_df, cost_centers_df)
 
 
 # Convenience function
@@ -0,0 +1,150 @@
+"""Persisted state for incremental day-by-day generation."""
+
+import json
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+
+# State snapshot directory inside the landing zone
+STATE_DIR = "_state"
+
+STATE_FILE = "state.json"
+
+# Frames kept alongside the JSON state: attribute -> file name. Saved
+# snapshots suffix the name with next_date and list their files in the JSON.
+STATE_FRAMES = {
+    "roster": "roster.pkl",
+    "jobs": "jobs.pkl",
+    "open_timecards": "open_timecards.pkl",
+    "week_timecards": "week_timecards.pkl",
+}
+
+
+class IncrementalState:
+    """Snapshot needed to continue generation one day at a time.
+    
+    Args:
+        start_date: First day of the generated history
+        next_date: Next day to generate
+        period_start: First day of the open pay period
+        next_ids: Next sequence number per SEQUENCE_ID_COLUMNS domain
+        next_run_id: run_id of the next pay run
+        rng_state: ``bit_generator.state`` of the root incremental stream
+        roster: Employee roster (clean, without chaos)
+        jobs: Job reference data used for salary ranges
+        open_timecards: Timecards of the open pay period (clean, without chaos)
+        week_timecards: Overtime inputs (employee, date, punch in, hours
+            worked) of the open workweek
+    """
+    
+    def __init__(
+        self,
+        start_date: date,
+        next_date: date,
+        period_start: date,
+        next_ids: Dict[str, int],
+        next_run_id: int,
+        rng_state: Dict[str, Any],
+        roster: pd.DataFrame,
+        jobs: pd.DataFrame,
+        open_timecards: pd.DataFrame,
+        week_timecards: pd.DataFrame
+    ):
+        self.start_date = start_date
+        self.next_date = next_date
+        self.period_start = period_start
+        self.next_ids = next_ids
+        self.next_run_id = next_run_id
+        self.rng_state = rng_state
+        self.roster = roster
+        self.jobs = jobs
+        self.open_timecards = open_timecards
+        self.week_timecards = week_timecards
+    
+    def rng(self) -> np.random.Generator:
+        """Restore the root incremental stream."""
+        bit_generator = getattr(np.random, self.rng_state["bit_generator"])()
+        bit_generator.state = self.rng_state
+        return np.random.Generator(bit_generator)
+    
+    def save(self, landing_dir: Path) -> Path:
+        """Write the snapshot to ``<landing_dir>/_state``.
+        
+        Frames are pickled under names suffixed with ``next_date`` and
+        state.json, which lists them, is replaced atomically last, so an
+        interrupted save leaves the previous snapshot intact. Frames of
+        older snapshots are removed afterwards.
+        
+        Args:
+            landing_dir: Landing zone root
+        
+        Returns:
+            Path of the state directory
+        """
+        state_dir = Path(landing_dir) / STATE_DIR
+        state_dir.mkdir(parents=True, exist_ok=True)
+        
+        frames = {
+            attr: f"{Path(filename).stem}-{self.next_date.isoformat()}.pkl"
+            for attr, filename in STATE_FRAMES.items()
+        }
+        for attr, filename in frames.items():
+            getattr(self, attr).to_pickle(state_dir / filename)
+        
+        state = {
+            "start_date": self.start_date.isoformat(),
+            "next_date": self.next_date.isoformat(),
+            "period_start": self.period_start.isoformat(),
+            "next_ids": self.next_ids,
+            "next_run_id": self.next_run_id,
+            "rng_state": self.rng_state,
+            "frames": frames
+        }
+        # Replace state.json atomically so it is never read half-written
+        tmp_path = state_dir / f"{STATE_FILE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        tmp_path.replace(state_dir / STATE_FILE)
+        
+        for path in state_dir.glob("*.pkl"):
+            if path.name not in frames.values():
+                path.unlink()
+        return state_dir
+    
+    @classmethod
+    def load(cls, landing_dir: Path) -> Optional["IncrementalState"]:
+        """Read the snapshot from ``<landing_dir>/_state``, if one exists.
+        
+        Args:
+            landing_dir: Landing zone root
+        
+        Returns:
+            The saved state, or None when the landing zone has no snapshot
+        """
+        state_dir = Path(landing_dir) / STATE_DIR
+        state_path = state_dir / STATE_FILE
+        if not state_path.exists():
+            return None
+        
+        with open(state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        # Snapshots from before a frame was added load it empty
+        filenames = {**STATE_FRAMES, **state.get("frames", {})}
+        frames = {
+            attr: pd.read_pickle(state_dir / filename)
+            if (state_dir / filename).exists() else pd.DataFrame()
+            for attr, filename in filenames.items()
+        }
+        return cls(
+            start_date=date.fromisoformat(state["start_date"]),
+            next_date=date.fromisoformat(state["next_date"]),
+            period_start=date.fromisoformat(state["period_start"]),
+            next_ids=state["next_ids"],
+            next_run_id=state["next_run_id"],
+            rng_state=state["rng_state"],
+            **frames
+        )
@@ -0,0 +1,240 @@
+"""Per-stage timing and memory instrumentation.
+
+A ``RunMetrics`` records one ``Span`` per stage of a generation run (each
+domain generated, each chaos injector, each domain written) with its wall
+time, the process RSS when it ended and, when memory tracing is on, the
+Python allocations tracemalloc saw during it. Spans can be exported in
+Chrome trace-event format for chrome://tracing or Perfetto.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Trace file written next to the output when tracing is requested
+TRACE_FILE = "_trace.json"
+
+_MB = 1024 * 1024
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / _MB if sys.platform == "darwin" else peak / 1024
+
+
+def current_rss_mb() -> Optional[float]:
+    """Current resident set size of this process in MB.
+
+    Read from /proc where available, otherwise falls back to the peak RSS.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / _MB
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss_mb()
+
+
+class Span:
+    """One timed stage of a run.
+
+    Args:
+        name: Stage name, e.g. ``generate.timecards`` or ``chaos.timecards.nulls``
+        category: Stage kind (``generate``, ``chaos`` or ``write``)
+        start: Seconds from the start of the run
+        args: Extra attributes (domain, rows, ...)
+    """
+
+    def __init__(self, name: str, category: str, start: float, args: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.args = args
+        self.duration: Optional[float] = None
+        self.rss_mb: Optional[float] = None
+        self.py_alloc_mb: Optional[float] = None
+        self.py_peak_mb: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "start": self.start,
+            "duration": self.duration,
+            "rss_mb": self.rss_mb,
+            "py_alloc_mb": self.py_alloc_mb,
+            "py_peak_mb": self.py_peak_mb,
+            "args": self.args
+        }
+
+
+class RunMetrics:
+    """Spans recorded over one generation run.
+
+    Spans are only recorded while the metrics are active, i.e. inside a
+    ``with metrics:`` block, so stages run outside an instrumented call
+    cost nothing beyond a no-op context manager.
+
+    Args:
+        trace_memory: Also trace Python allocations with tracemalloc
+            (noticeably slower; RSS is always recorded)
+
+    Example:
+        >>> metrics = RunMetrics()
+        >>> with metrics:
+        ...     with metrics.span("generate.jobs", "generate") as span:
+        ...         span.args["rows"] = len(jobs_df)
+        >>> metrics.durations()
+        {'generate.jobs': 0.0012}
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.spans: List[Span] = []
+        self.wall_time: Optional[float] = None
+        self.peak_rss_mb: Optional[float] = None
+        self._origin: Optional[float] = None
+        self._active = False
+        self._started_tracemalloc = False
+        # Open spans and the highest tracemalloc peak seen in each so far
+        self._stack: List[List[Any]] = []
+
+    def __enter__(self) -> "RunMetrics":
+        self.spans = []
+        self._origin = time.perf_counter()
+        self._active = True
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.wall_time = time.perf_counter() - self._origin
+        self.peak_rss_mb = peak_rss_mb()
+        self._active = False
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[Span]:
+        """Time the enclosed block as a stage.
+
+        Yields the span so callers can add attributes (e.g. row counts) to
+        ``span.args``. Spans may be nested.
+
+        Args:
+            name: Stage name
+            category: Stage kind
+            **args: Extra attributes recorded with the span
+        """
+        if not self._active:
+            yield Span(name, category, 0.0, args)
+            return
+
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            # Fold the parent's peak so far into it before resetting the peak
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            frame = [current, current]
+        else:
+            frame = [0, 0]
+        self._stack.append(frame)
+
+        started = time.perf_counter()
+        span = Span(name, category, started - self._origin, args)
+        try:
+            yield span
+        finally:
+            span.duration = time.perf_counter() - started
+            span.rss_mb = current_rss_mb()
+            self._stack.pop()
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(frame[1], peak)
+                span.py_alloc_mb = (current - frame[0]) / _MB
+                span.py_peak_mb = peak / _MB
+                if self._stack:
+                    self._stack[-1][1] = max(self._stack[-1][1], peak)
+            self.spans.append(span)
+
+    def durations(self, category: Optional[str] = None) -> Dict[str, float]:
+        """Total seconds per stage name, optionally for one category."""
+        totals: Dict[str, float] = {}
+        for span in self.spans:
+            if category is None or span.category == category:
+                totals[span.name] = totals.get(span.name, 0.0) + span.duration
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_time": self.wall_time,
+            "peak_rss_mb": self.peak_rss_mb,
+            "spans": [span.to_dict() for span in self.spans]
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Spans as Chrome trace events (complete events plus memory counters)."""
+        pid = os.getpid()
+        events = []
+        for span in sorted(self.spans, key=lambda s: s.start):
+            ts = span.start * 1e6
+            end_ts = ts + span.duration * 1e6
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": ts,
+                "dur": span.duration * 1e6,
+                "pid": pid,
+                "tid": 0,
+                "args": span.args
+            })
+            memory = {
+                key: value
+                for key, value in (("rss_mb", span.rss_mb), ("py_peak_mb", span.py_peak_mb))
+                if value is not None
+            }
+            if not memory:
+                continue
+            events.append({
+                "name": "memory",
+                "ph": "C",
+                "ts": end_ts,
+                "pid": pid,
+                "args": memory
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path) -> Path:
+        """Write the Chrome trace JSON to path.
+
+        Args:
+            path: Trace file path
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
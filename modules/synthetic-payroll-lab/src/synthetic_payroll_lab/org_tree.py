@@ -0,0 +1,163 @@
+"""Org hierarchy of employees by job level.
+
+The tree is built in layers from the top: employees are ordered by
+``job_level`` (highest first), the root is the first one and each layer
+is up to ``fan_out`` times larger than the one above it, until
+``max_depth`` layers are reached and everyone left joins the last layer.
+Every employee in a layer reports to someone in the layer above, with team
+sizes drawn from one multinomial over lognormal manager weights, so the
+whole build is a radix sort plus one ``np.repeat`` per layer.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from synthetic_payroll_lab.config import OrgTreeConfig
+from synthetic_payroll_lab.random_state import SeedLike, make_rng
+
+
+# Columns of the closure table
+CLOSURE_COLUMNS = ["ancestor_id", "descendant_id", "distance"]
+
+
+def layer_sizes(count: int, fan_out: float, max_depth: int) -> np.ndarray:
+    """Employees per org layer, root first.
+    
+    Args:
+        count: Number of employees
+        fan_out: Mean direct reports per manager
+        max_depth: Most layers in the tree
+    
+    Returns:
+        Array of layer sizes summing to count
+    """
+    sizes = []
+    remaining = count
+    while remaining > 0:
+        size = 1 if not sizes else int(np.ceil(sizes[-1] * fan_out))
+        if len(sizes) == max_depth - 1:
+            size = remaining
+        sizes.append(min(size, remaining))
+        remaining -= sizes[-1]
+    return np.array(sizes, dtype=np.int64)
+
+
+def org_depths(employees_df: pd.DataFrame) -> np.ndarray:
+    """Distance of every employee from the root of its ``manager_id`` chain.
+    
+    Employees without a manager in employees_df are roots (depth 0). Depths
+    are found for all employees at once by following parent positions one
+    level per step.
+    
+    Args:
+        employees_df: Employee data with employee_number and manager_id
+    
+    Returns:
+        Array of int64 depths, one per employee row
+    """
+    ids = employees_df['employee_number'].to_numpy()
+    parent = pd.Index(ids).get_indexer(employees_df['manager_id'])
+    depth = np.zeros(len(parent), dtype=np.int64)
+    ancestors = parent
+    # A chain of n employees ends within n steps; one more pass sees no links
+    for _ in range(len(parent) + 1):
+        linked = ancestors >= 0
+        if not linked.any():
+            return depth
+        depth += linked
+        ancestors = np.where(linked, parent[np.maximum(ancestors, 0)], -1)
+    raise ValueError("manager_id hierarchy has a cycle")
+
+
+def closure_table(employees_df: pd.DataFrame, max_depth: Optional[int] = None) -> pd.DataFrame:
+    """Ancestor/descendant pairs of the ``manager_id`` hierarchy.
+    
+    Every employee is paired with itself (distance 0) and with each manager
+    above it. Pairs are produced one level at a time by following the
+    parent positions of all employees at once.
+    
+    Args:
+        employees_df: Employee data with employee_number and manager_id
+        max_depth: Most levels to follow (None follows every chain to its
+            root; a chain longer than the employee count means a cycle)
+    
+    Returns:
+        DataFrame with ancestor_id, descendant_id and distance
+    """
+    ids = employees_df['employee_number'].to_numpy()
+    parent = pd.Index(ids).get_indexer(employees_df['manager_id'])
+    limit = len(ids) if max_depth is None else max_depth
+    
+    descendants = np.arange(len(ids))
+    ancestors = descendants
+    pairs = [(ancestors, descendants, 0)]
+    for distance in range(1, limit + 1):
+        ancestors = parent[ancestors]
+        linked = ancestors >= 0
+        if not linked.any():
+            break
+        ancestors, descendants = ancestors[linked], descendants[linked]
+        pairs.append((ancestors, descendants, distance))
+    else:
+        if max_depth is None and len(ids):
+            raise ValueError("manager_id hierarchy has a cycle")
+    
+    return pd.DataFrame({
+        "ancestor_id": ids[np.concatenate([a for a, _, _ in pairs])],
+        "descendant_id": ids[np.concatenate([d for _, d, _ in pairs])],
+        "distance": np.concatenate([np.full(len(d), k, dtype=np.int64) for _, d, k in pairs]),
+    }, columns=CLOSURE_COLUMNS)
+
+
+class OrgTreeBuilder:
+    """Assign managers as a layered tree following job levels.
+    
+    Example:
+        >>> builder = OrgTreeBuilder(OrgTreeConfig(fan_out=8), seed=42)
+        >>> builder.assign_managers_in_place(employees_df, jobs_df)
+    """
+    
+    def __init__(self, config: Optional[OrgTreeConfig] = None, seed: SeedLike = None):
+        self.config = config or OrgTreeConfig()
+        self.rng = make_rng(seed)
+    
+    def assign_managers_in_place(self, employees_df: pd.DataFrame, jobs_df: pd.DataFrame) -> None:
+        """Replace ``manager_id`` with a manager one layer up the org tree.
+        
+        Employees are shuffled, then stably ordered by job level (codes
+        missing from jobs_df rank lowest), so ties are broken at random and
+        nobody reports to a lower job level. The root's manager_id is None.
+        
+        Args:
+            employees_df: Employee data with employee_number and job_code
+                (modified in place)
+            jobs_df: Job data with job_code and job_level
+        """
+        count = len(employees_df)
+        if count == 0:
+            return
+        
+        levels = (
+            jobs_df.set_index(jobs_df['job_code'].astype(object))['job_level']
+            .reindex(employees_df['job_code'].astype(object))
+            .to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+        levels = np.nan_to_num(levels, nan=0.0).astype(np.int16)
+        
+        # int16 keys take NumPy's radix sort
+        shuffled = self.rng.permutation(count)
+        order = shuffled[np.argsort(-levels[shuffled], kind='stable')]
+        
+        sizes = layer_sizes(count, self.config.fan_out, self.config.max_depth)
+        starts = np.concatenate([[0], np.cumsum(sizes)])
+        parent = np.full(count, -1, dtype=np.int64)
+        for depth in range(1, len(sizes)):
+            managers = order[starts[depth - 1]:starts[depth]]
+            weights = self.rng.lognormal(0.0, self.config.fan_out_sigma, size=len(managers))
+            team_sizes = self.rng.multinomial(sizes[depth], weights / weights.sum())
+            parent[order[starts[depth]:starts[depth + 1]]] = np.repeat(managers, team_sizes)
+        
+        ids = employees_df['employee_number'].to_numpy(dtype=object)
+        employees_df['manager_id'] = np.where(parent >= 0, ids[parent], None)
@@ -0,0 +1,125 @@
+"""Workweek overtime split of timecard hours.
+
+Hours are split over the whole timecards frame at once: rows are sorted by
+(employee, work date, punch in), and the hours worked so far in each
+workday and each workweek come from one cumulative sum per level, reset at
+group boundaries. Daily rules apply first; only the remaining regular
+hours count toward the weekly threshold, so no hour is paid as overtime
+twice.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from synthetic_payroll_lab.config import OvertimeConfig
+
+
+# Workweek start day -> numpy weekday (Monday = 0)
+WEEKDAYS = {"MON": 0, "TUE": 1, "WED": 2, "THU": 3, "FRI": 4, "SAT": 5, "SUN": 6}
+
+# Columns the split reads from timecards
+OVERTIME_COLUMNS = ["employee_id", "work_date", "punch_in", "hours_worked"]
+
+
+def work_states(locations: pd.Series) -> pd.Series:
+    """State codes of ``"City, ST"`` work locations (None where unknown)."""
+    codes = locations.astype(object).str.rsplit(", ", n=1).str[-1]
+    return codes.where(codes.str.len() == 2, None)
+
+
+def _grouped_cumsum(values: np.ndarray, group_starts: np.ndarray) -> np.ndarray:
+    """Cumulative sum of values, restarting wherever group_starts is True."""
+    totals = np.cumsum(values)
+    offsets = (totals - values)[group_starts]
+    return totals - offsets[np.cumsum(group_starts) - 1]
+
+
+def _overlap(start: np.ndarray, end: np.ndarray, low, high) -> np.ndarray:
+    """Length of [start, end] inside [low, high], elementwise."""
+    return np.maximum(np.minimum(end, high) - np.maximum(start, low), 0.0)
+
+
+class OvertimeCalculator:
+    """Split worked hours into regular, overtime and double-time hours.
+
+    Example:
+        >>> calculator = OvertimeCalculator(OvertimeConfig())
+        >>> calculator.split_in_place(timecards_df, states_by_employee)
+    """
+
+    def __init__(self, config: Optional[OvertimeConfig] = None):
+        self.config = config or OvertimeConfig()
+
+    def split_in_place(
+        self,
+        timecards: pd.DataFrame,
+        states: pd.Series,
+        prior: Optional[pd.DataFrame] = None
+    ) -> None:
+        """Recompute ``hours_regular``, ``hours_overtime`` and ``hours_double_time``.
+
+        Args:
+            timecards: Timecards with employee_id, work_date, punch_in and
+                hours_worked (modified in place)
+            states: Work-location state code, indexed by employee_id
+            prior: Earlier timecards of the same workweeks, counted toward
+                the weekly threshold but left unmodified
+        """
+        if timecards.empty:
+            if 'hours_double_time' not in timecards.columns:
+                timecards['hours_double_time'] = pd.Series(dtype=np.float64)
+            return
+
+        frame = timecards[OVERTIME_COLUMNS]
+        if prior is not None and not prior.empty:
+            frame = pd.concat([prior[OVERTIME_COLUMNS], frame], ignore_index=True)
+        num_prior = len(frame) - len(timecards)
+
+        emp_codes = pd.factorize(frame['employee_id'])[0]
+        days = np.asarray(frame['work_date'].to_numpy(), dtype='datetime64[D]').astype(np.int64)
+        punch_in = frame['punch_in'].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        hours = np.nan_to_num(frame['hours_worked'].to_numpy(dtype=np.float64, na_value=np.nan))
+
+        # Day 0 (1970-01-01) was a Thursday, weekday 3
+        weeks = days - (days + 3 - WEEKDAYS[self.config.week_start]) % 7
+
+        # Daily thresholds of each row's work-location state
+        row_states = frame['employee_id'].map(states)
+        rules = self.config.daily_rules
+        overtime_after = row_states.map(
+            {state: rule.overtime_after for state, rule in rules.items()}
+        ).to_numpy(dtype=np.float64, na_value=np.inf)
+        double_time_after = row_states.map(
+            {state: rule.double_time_after for state, rule in rules.items()}
+        ).to_numpy(dtype=np.float64, na_value=np.inf)
+
+        order = np.lexsort((punch_in, days, emp_codes))
+        emp_sorted, days_sorted, weeks_sorted = emp_codes[order], days[order], weeks[order]
+        hours_sorted = hours[order]
+        new_emp = np.ones(len(order), dtype=bool)
+        new_emp[1:] = emp_sorted[1:] != emp_sorted[:-1]
+        new_day = new_emp.copy()
+        new_day[1:] |= days_sorted[1:] != days_sorted[:-1]
+        new_week = new_emp.copy()
+        new_week[1:] |= weeks_sorted[1:] != weeks_sorted[:-1]
+
+        # Daily rules: hours past each threshold within the workday
+        day_end = _grouped_cumsum(hours_sorted, new_day)
+        day_start = day_end - hours_sorted
+        double_time = _overlap(day_start, day_end, double_time_after[order], np.inf)
+        daily_overtime = _overlap(day_start, day_end, overtime_after[order], double_time_after[order])
+        regular = hours_sorted - daily_overtime - double_time
+
+        # Weekly rule: regular hours past the threshold within the workweek
+        week_end = _grouped_cumsum(regular, new_week)
+        weekly_overtime = _overlap(week_end - regular, week_end, self.config.weekly_threshold, np.inf)
+        regular = regular - weekly_overtime
+
+        splits = np.empty((3, len(order)))
+        splits[:, order] = [regular, daily_overtime + weekly_overtime, double_time]
+        splits = splits[:, num_prior:].round(2)
+        timecards['hours_regular'] = splits[0]
+        timecards['hours_overtime'] = splits[1]
+        timecards['hours_double_time'] = splits[2]
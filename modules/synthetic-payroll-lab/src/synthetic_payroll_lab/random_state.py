@@ -0,0 +1,54 @@
+"""Isolated random streams for generators and chaos injectors.
+
+Every generator and injector owns a ``numpy.random.Generator`` built from a
+``SeedSequence`` derived from the root seed and a stream key such as
+``("timecards",)`` or ``("chaos", "nulls", "employees", 3)``. Keys are
+hashed to stable integers, so a stream depends only on its name and the
+root seed, never on construction order or on other generators having run.
+"""
+
+import random
+import zlib
+from typing import Optional, Union
+
+import numpy as np
+
+
+SeedLike = Union[int, np.random.SeedSequence, None]
+
+
+def _key_int(key: Union[str, int]) -> int:
+    """Map a stream key component to a stable non-negative integer."""
+    if isinstance(key, int):
+        return key
+    return zlib.crc32(str(key).encode("utf-8"))
+
+
+def stream_seed(seed: Optional[int], *key: Union[str, int]) -> Optional[np.random.SeedSequence]:
+    """Derive the seed sequence for a named stream.
+    
+    Args:
+        seed: Root seed (None means unseeded)
+        *key: Stream key components (names or integers)
+    
+    Returns:
+        SeedSequence for the stream, or None when unseeded
+    """
+    if seed is None:
+        return None
+    return np.random.SeedSequence(seed, spawn_key=tuple(_key_int(k) for k in key))
+
+
+def make_rng(seed: SeedLike) -> np.random.Generator:
+    """Create an isolated NumPy generator (fresh entropy when seed is None)."""
+    return np.random.default_rng(seed)
+
+
+def make_python_random(rng: np.random.Generator) -> random.Random:
+    """Create a private ``random.Random`` seeded from a NumPy generator.
+    
+    Row-wise code paths draw scalars per row, where ``random.Random`` is much
+    cheaper per call than ``numpy.random.Generator``; seeding it from the
+    owner's stream keeps it isolated from global state.
+    """
+    return random.Random(int(rng.integers(2**63)))
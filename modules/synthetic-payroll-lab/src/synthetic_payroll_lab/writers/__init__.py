@@ -0,0 +1,28 @@
+"""Output writers for generated domains."""
+
+from synthetic_payroll_lab.writers.bigquery import (
+    SCHEMA_FILE,
+    SCHEMA_FORMATS,
+    bigquery_schema,
+    write_bigquery_schema
+)
+from synthetic_payroll_lab.writers.formats import FORMAT_EXTENSIONS, write_frame
+from synthetic_payroll_lab.writers.partitioned import (
+    DEFAULT_PARTITION_COLUMNS,
+    write_partitioned,
+    write_manifest,
+    read_manifest
+)
+
+__all__ = [
+    "SCHEMA_FILE",
+    "SCHEMA_FORMATS",
+    "bigquery_schema",
+    "write_bigquery_schema",
+    "FORMAT_EXTENSIONS",
+    "write_frame",
+    "DEFAULT_PARTITION_COLUMNS",
+    "write_partitioned",
+    "write_manifest",
+    "read_manifest"
+]
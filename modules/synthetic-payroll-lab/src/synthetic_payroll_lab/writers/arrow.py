@@ -0,0 +1,150 @@
+"""Parquet and Arrow IPC (Feather) writers.
+
+pyarrow is an optional dependency, installed with the ``arrow`` extra.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from synthetic_payroll_lab.compact import (
+    COMPACT_ATTR,
+    DATE_COLUMNS,
+    ID_FORMATS,
+    MONEY_COLUMNS,
+    format_ids
+)
+
+
+MONEY_PRECISION = 18
+MONEY_SCALE = 2
+
+FEATHER_COMPRESSION = {"lz4", "zstd", "uncompressed"}
+
+
+def _import_pyarrow():
+    """Import pyarrow, with an install hint when it is missing."""
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "Parquet and Feather output require pyarrow: "
+            "pip install 'synthetic-payroll-lab[arrow]'"
+        ) from e
+    return pyarrow
+
+
+def _cents_to_decimal(pa, values: pd.Series):
+    """Wrap int64 cents as decimal128(18, 2) without converting the values.
+    
+    A decimal128 with scale 2 stores exactly the value in cents, as a
+    16-byte little-endian integer, so the cents only need sign-extending.
+    """
+    cents = values.to_numpy(dtype=np.int64, na_value=0)
+    valid = values.notna().to_numpy()
+    words = np.empty(2 * len(cents), dtype=np.int64)
+    words[0::2] = cents
+    words[1::2] = cents >> 63
+    validity = None if valid.all() else pa.array(valid).buffers()[1]
+    return pa.Array.from_buffers(
+        pa.decimal128(MONEY_PRECISION, MONEY_SCALE),
+        len(cents),
+        [validity, pa.py_buffer(words)],
+        null_count=int((~valid).sum())
+    )
+
+
+def to_arrow_table(df: pd.DataFrame):
+    """Convert a domain DataFrame to an Arrow table with typed columns.
+    
+    Date columns become ``date32`` and money columns become
+    ``decimal128(18, 2)``; everything else keeps pyarrow's inferred type.
+    Compact frames (see ``compact_frame``) are written natively: categories
+    as dictionary-encoded columns, integer IDs formatted back to strings
+    and cents wrapped directly as decimals.
+    
+    Args:
+        df: Domain DataFrame
+    
+    Returns:
+        pyarrow.Table
+    """
+    pa = _import_pyarrow()
+    compacted = df.attrs.get(COMPACT_ATTR) or {}
+    compact_money = set(compacted.get("money", ()))
+    if compacted:
+        df = df.copy(deep=False)
+        for col in compacted["ids"]:
+            if col in df.columns:
+                df[col] = format_ids(df[col], *ID_FORMATS[col])
+    
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    money_type = pa.decimal128(MONEY_PRECISION, MONEY_SCALE)
+    
+    for i, field in enumerate(table.schema):
+        column = table.column(i)
+        if field.name in DATE_COLUMNS and pa.types.is_timestamp(field.type):
+            column = column.cast(pa.date32())
+        elif field.name in compact_money:
+            column = _cents_to_decimal(pa, df[field.name])
+        elif field.name in MONEY_COLUMNS and (
+            pa.types.is_floating(field.type) or pa.types.is_integer(field.type)
+        ):
+            # Integers go through float64 so the decimal keeps its fixed precision
+            column = column.cast(pa.float64()).cast(money_type)
+        else:
+            continue
+        table = table.set_column(i, pa.field(field.name, column.type), column)
+    
+    return table
+
+
+def write_parquet(
+    df: pd.DataFrame,
+    filepath: Path,
+    compression: Optional[str] = None,
+    row_group_size: Optional[int] = None
+) -> None:
+    """Write a DataFrame as Parquet.
+    
+    Args:
+        df: DataFrame to write
+        filepath: Output file path
+        compression: Codec (snappy, gzip, zstd, lz4, brotli, none); default snappy
+        row_group_size: Maximum rows per row group; default pyarrow's
+    """
+    _import_pyarrow()
+    import pyarrow.parquet as pq
+    
+    pq.write_table(
+        to_arrow_table(df),
+        filepath,
+        compression=compression or "snappy",
+        row_group_size=row_group_size
+    )
+
+
+def write_feather(
+    df: pd.DataFrame,
+    filepath: Path,
+    compression: Optional[str] = None
+) -> None:
+    """Write a DataFrame as an Arrow IPC (Feather v2) file.
+    
+    Args:
+        df: DataFrame to write
+        filepath: Output file path
+        compression: Codec (lz4, zstd, none); default lz4
+    """
+    _import_pyarrow()
+    import pyarrow.feather as feather
+    
+    compression = compression or "lz4"
+    if compression == "none":
+        compression = "uncompressed"
+    if compression not in FEATHER_COMPRESSION:
+        raise ValueError(f"Unsupported Feather compression: {compression}")
+    
+    feather.write_feather(to_arrow_table(df), filepath, compression=compression)
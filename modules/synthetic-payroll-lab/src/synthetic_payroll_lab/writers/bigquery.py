@@ -0,0 +1,331 @@
+"""BigQuery load-ready Avro and NDJSON writers with schema emission.
+
+Both writers serialize a frame in chunks of ``OutputConfig.chunk_rows``
+rows, converting each column once per chunk: dates as ``YYYY-MM-DD`` (Avro
+``date``), naive timestamps as ``DATETIME`` strings, money as ``NUMERIC``
+(Avro ``decimal(18, 2)``) and compact IDs as prefixed strings. The
+BigQuery schema of a domain is written next to its files as
+``_schema.json``, so ``bq load`` needs no autodetect pass.
+
+fastavro is an optional dependency, installed with the ``avro`` extra.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from synthetic_payroll_lab.chaos.schema_drift import SCHEMA_VERSIONS_ATTR
+from synthetic_payroll_lab.compact import (
+    COMPACT_ATTR,
+    DATE_COLUMNS,
+    ID_FORMATS,
+    MONEY_COLUMNS,
+    MONEY_SCALE_FACTOR,
+    format_ids
+)
+from synthetic_payroll_lab.writers.arrow import MONEY_PRECISION, MONEY_SCALE
+
+
+SCHEMA_FILE = "_schema.json"
+
+# Formats whose domains get a BigQuery schema file
+SCHEMA_FORMATS = {"avro", "ndjson"}
+
+# OutputConfig.compression -> fastavro codec (default deflate)
+AVRO_CODECS = {
+    "none": "null",
+    "gzip": "deflate",
+    "snappy": "snappy",
+    "zstd": "zstandard",
+    "lz4": "lz4",
+}
+
+# BigQuery type of object columns by pandas' inferred value type
+_INFERRED_TYPES = {
+    "boolean": "BOOLEAN",
+    "date": "DATE",
+    "datetime": "DATETIME",
+    "datetime64": "DATETIME",
+}
+
+# Avro type per BigQuery type (BigQuery reads the logical types)
+AVRO_TYPES = {
+    "STRING": "string",
+    "INTEGER": "long",
+    "FLOAT": "double",
+    "BOOLEAN": "boolean",
+    "DATE": {"type": "int", "logicalType": "date"},
+    "DATETIME": {"type": "string", "logicalType": "datetime"},
+    "TIMESTAMP": {"type": "long", "logicalType": "timestamp-micros"},
+    "NUMERIC": {
+        "type": "bytes", "logicalType": "decimal",
+        "precision": MONEY_PRECISION, "scale": MONEY_SCALE
+    },
+}
+
+
+def _import_fastavro():
+    """Import fastavro, with an install hint when it is missing."""
+    try:
+        import fastavro
+    except ImportError as e:
+        raise ImportError(
+            "Avro output requires fastavro: pip install 'synthetic-payroll-lab[avro]'"
+        ) from e
+    return fastavro
+
+
+def _column_type(name: str, values: pd.Series, compact_ids: set) -> str:
+    """BigQuery type of one column, from its name and dtype."""
+    dtype = values.dtype
+    if name in compact_ids or isinstance(dtype, pd.CategoricalDtype):
+        return "STRING"
+    if name in MONEY_COLUMNS and pd.api.types.is_numeric_dtype(dtype):
+        return "NUMERIC"
+    if pd.api.types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "INTEGER"
+    if pd.api.types.is_float_dtype(dtype):
+        return "FLOAT"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        if name in DATE_COLUMNS:
+            return "DATE"
+        return "TIMESTAMP" if isinstance(dtype, pd.DatetimeTZDtype) else "DATETIME"
+
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+    if name in DATE_COLUMNS and inferred in ("date", "datetime", "datetime64", "empty"):
+        return "DATE"
+    return _INFERRED_TYPES.get(inferred, "STRING")
+
+
+def column_types(df: pd.DataFrame) -> Dict[str, str]:
+    """BigQuery type of every column of df.
+
+    Object columns are typed by their values, and anything mixed (such as
+    a string key with orphaned numbers) is written as ``STRING``.
+
+    Args:
+        df: Domain DataFrame (compact or not)
+
+    Returns:
+        Column name -> BigQuery standard type name
+    """
+    compact_ids = set((df.attrs.get(COMPACT_ATTR) or {}).get("ids", ()))
+    return {col: _column_type(col, df[col], compact_ids) for col in df.columns}
+
+
+def bigquery_schema(df: pd.DataFrame, exclude: Sequence[str] = ()) -> List[Dict[str, str]]:
+    """BigQuery schema JSON fields for a domain frame.
+
+    Every field is ``NULLABLE``, since chaos nulls any non-key column. If
+    ``df.attrs`` holds schema versions, the drift columns up to the newest
+    version among df's rows are included.
+
+    Args:
+        df: Domain DataFrame
+        exclude: Columns left out, such as a Hive partition column
+
+    Returns:
+        List of ``{"name", "type", "mode"}`` fields
+    """
+    types = column_types(df)
+    schema = df.attrs.get(SCHEMA_VERSIONS_ATTR)
+    if schema is not None and len(df):
+        max_version = int(schema.version_of(df[schema.date_column]).max())
+        types.update((column, "STRING") for column in schema.drift_columns(max_version))
+
+    return [
+        {"name": name, "type": bq_type, "mode": "NULLABLE"}
+        for name, bq_type in types.items() if name not in exclude
+    ]
+
+
+def write_bigquery_schema(
+    df: pd.DataFrame,
+    domain_dir: Path,
+    exclude: Sequence[str] = ()
+) -> Path:
+    """Write a domain's BigQuery schema as ``<domain_dir>/_schema.json``.
+
+    Args:
+        df: Domain DataFrame
+        domain_dir: Domain output directory
+        exclude: Columns left out, such as a Hive partition column
+
+    Returns:
+        Path of the schema file
+    """
+    filepath = domain_dir / SCHEMA_FILE
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(bigquery_schema(df, exclude), f, indent=2)
+    return filepath
+
+
+def avro_schema(types: Dict[str, str], name: str = "payroll_record") -> Dict[str, Any]:
+    """Avro record schema with a nullable field per column.
+
+    Args:
+        types: Column name -> BigQuery type, as from ``column_types``
+        name: Avro record name
+
+    Returns:
+        Avro schema as a dict
+    """
+    return {
+        "type": "record",
+        "name": name,
+        "fields": [
+            {"name": col, "type": ["null", AVRO_TYPES[bq_type]], "default": None}
+            for col, bq_type in types.items()
+        ],
+    }
+
+
+def _with_nulls(values: list, valid: np.ndarray) -> list:
+    """Set the invalid positions of a list of Python values to None."""
+    for i in np.flatnonzero(~valid):
+        values[i] = None
+    return values
+
+
+def _cents(values: pd.Series, compact: bool) -> np.ndarray:
+    """Money as int64 cents (0 where null)."""
+    if compact:
+        return values.to_numpy(dtype=np.int64, na_value=0)
+    units = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.nan_to_num(np.round(units * MONEY_SCALE_FACTOR)).astype(np.int64)
+
+
+def _micros(values: pd.Series) -> np.ndarray:
+    """Timestamps as datetime64[us] in UTC (tz-aware) or wall-clock (naive)."""
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+    return np.asarray(values.to_numpy(), dtype="datetime64[us]")
+
+
+def _encode_column(
+    values: pd.Series,
+    bq_type: str,
+    id_format: Optional[tuple],
+    compact_money: bool,
+    avro: bool
+) -> list:
+    """Convert one column of a chunk to JSON/Avro-ready Python values."""
+    valid = values.notna().to_numpy()
+
+    if id_format is not None:
+        return format_ids(values, *id_format).tolist()
+    if bq_type == "NUMERIC":
+        cents = _cents(values, compact_money)
+        if avro:
+            # Avro decimals are big-endian two's complement unscaled integers
+            raw = cents.astype(">i8").tobytes()
+            encoded = [raw[i:i + 8] for i in range(0, len(raw), 8)]
+        else:
+            encoded = (cents / MONEY_SCALE_FACTOR).tolist()
+        return _with_nulls(encoded, valid)
+    if bq_type == "DATE":
+        days = np.asarray(values.to_numpy(), dtype="datetime64[D]")
+        encoded = days.astype(np.int64) if avro else np.datetime_as_string(days)
+        return _with_nulls(encoded.tolist(), valid)
+    if bq_type == "DATETIME":
+        return _with_nulls(np.datetime_as_string(_micros(values)).tolist(), valid)
+    if bq_type == "TIMESTAMP":
+        micros = _micros(values)
+        if avro:
+            return _with_nulls(micros.astype(np.int64).tolist(), valid)
+        return _with_nulls(np.char.add(np.datetime_as_string(micros), "Z").tolist(), valid)
+    if bq_type in ("INTEGER", "FLOAT"):
+        dtype = np.int64 if bq_type == "INTEGER" else np.float64
+        return _with_nulls(values.to_numpy(dtype=dtype, na_value=0).tolist(), valid)
+    if bq_type == "BOOLEAN":
+        flags = values.to_numpy(dtype=object, na_value=False)
+        return _with_nulls([bool(value) for value in flags], valid)
+
+    encoded = values.to_numpy(dtype=object, na_value=None)
+    encoded[valid] = encoded[valid].astype(str)
+    return encoded.tolist()
+
+
+def _iter_chunks(
+    df: pd.DataFrame,
+    types: Dict[str, str],
+    chunk_rows: int,
+    avro: bool
+) -> Iterator[Dict[str, list]]:
+    """Yield df as encoded column lists, ``chunk_rows`` rows at a time."""
+    compacted = df.attrs.get(COMPACT_ATTR) or {}
+    compact_ids = set(compacted.get("ids", ()))
+    compact_money = set(compacted.get("money", ()))
+
+    for start in range(0, len(df), chunk_rows):
+        chunk = df.iloc[start:start + chunk_rows]
+        yield {
+            col: _encode_column(
+                chunk[col],
+                bq_type,
+                ID_FORMATS[col] if col in compact_ids else None,
+                col in compact_money,
+                avro
+            )
+            for col, bq_type in types.items()
+        }
+
+
+def write_ndjson(df: pd.DataFrame, filepath: Path, chunk_rows: int = 100_000) -> None:
+    """Write a DataFrame as newline-delimited JSON typed for BigQuery.
+
+    Records are serialized from the encoded Python values, so INTEGER
+    columns stay integers when they hold nulls and NUMERIC money is
+    written as the shortest decimal of its cents (e.g. ``2143.16``).
+
+    Args:
+        df: DataFrame to write
+        filepath: Output file path
+        chunk_rows: Rows converted and written per chunk
+    """
+    types = column_types(df)
+    names = list(types)
+    with open(filepath, "w", encoding="utf-8") as f:
+        for columns in _iter_chunks(df, types, chunk_rows, avro=False):
+            f.writelines(
+                json.dumps(dict(zip(names, row)), separators=(",", ":")) + "\n"
+                for row in zip(*(columns[name] for name in names))
+            )
+
+
+def write_avro(
+    df: pd.DataFrame,
+    filepath: Path,
+    compression: Optional[str] = None,
+    chunk_rows: int = 100_000
+) -> None:
+    """Write a DataFrame as an Avro object container file.
+
+    Args:
+        df: DataFrame to write
+        filepath: Output file path
+        compression: Codec (none, gzip/deflate, snappy, zstd, lz4); default deflate
+        chunk_rows: Rows converted per chunk
+    """
+    fastavro = _import_fastavro()
+
+    compression = compression or "gzip"
+    if compression not in AVRO_CODECS:
+        raise ValueError(f"Unsupported Avro compression: {compression}")
+
+    types = column_types(df)
+    schema = fastavro.parse_schema(avro_schema(types))
+    names = list(types)
+
+    def records() -> Iterator[Dict[str, Any]]:
+        for columns in _iter_chunks(df, types, chunk_rows, avro=True):
+            for row in zip(*(columns[name] for name in names)):
+                yield dict(zip(names, row))
+
+    with open(filepath, "wb") as f:
+        fastavro.writer(f, schema, records(), codec=AVRO_CODECS[compression])
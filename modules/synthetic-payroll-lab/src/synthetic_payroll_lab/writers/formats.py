@@ -0,0 +1,72 @@
+"""Format dispatch for writing a single DataFrame."""
+
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from synthetic_payroll_lab.chaos.schema_drift import SCHEMA_VERSIONS_ATTR
+from synthetic_payroll_lab.compact import expand_compact
+from synthetic_payroll_lab.config import OutputConfig
+from synthetic_payroll_lab.writers.arrow import write_feather, write_parquet
+from synthetic_payroll_lab.writers.bigquery import write_avro, write_ndjson
+
+
+# File extension per supported output format
+FORMAT_EXTENSIONS = {
+    "csv": ".csv",
+    "json": ".json",
+    "parquet": ".parquet",
+    "feather": ".feather",
+    "avro": ".avro",
+    "ndjson": ".ndjson",
+}
+
+
+def write_frame(
+    df: pd.DataFrame,
+    path_stem: Path,
+    format: str,
+    output: Optional[OutputConfig] = None
+) -> Path:
+    """Write a single DataFrame, adding the format's file extension.
+    
+    Schema versions recorded in ``df.attrs`` are written as dense drift
+    columns, since a single file has a single schema. Compact frames are
+    expanded for CSV and written natively by the other formats. JSON is
+    written as records per line with the NDJSON writer's typed values.
+    
+    Args:
+        df: DataFrame to write
+        path_stem: Output path without extension
+        format: Output format (csv, json, parquet, feather, avro, ndjson)
+        output: Writer options (compression, row group size, chunk rows)
+    
+    Returns:
+        Path of the written file
+    """
+    if format not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Unsupported format: {format}")
+    
+    output = output or OutputConfig()
+    schema = df.attrs.get(SCHEMA_VERSIONS_ATTR)
+    if schema is not None:
+        df = schema.materialize(df).copy(deep=False)
+        df.attrs = {key: value for key, value in df.attrs.items() if key != SCHEMA_VERSIONS_ATTR}
+    filepath = path_stem.with_suffix(FORMAT_EXTENSIONS[format])
+    
+    if format == 'csv':
+        expand_compact(df).to_csv(filepath, index=False)
+    elif format == 'json':
+        # Same typed encoding as ndjson: ISO dates survive 9999-12-31 end dates
+        write_ndjson(df, filepath, output.chunk_rows)
+    elif format == 'parquet':
+        write_parquet(df, filepath, output.compression, output.row_group_size)
+    elif format == 'feather':
+        write_feather(df, filepath, output.compression)
+    elif format == 'avro':
+        write_avro(df, filepath, output.compression, output.chunk_rows)
+    elif format == 'ndjson':
+        write_ndjson(df, filepath, output.chunk_rows)
+    
+    return filepath
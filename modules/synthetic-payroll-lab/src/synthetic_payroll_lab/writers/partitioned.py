@@ -0,0 +1,158 @@
+"""Hive-style date-partitioned writer with a partition manifest."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from synthetic_payroll_lab.chaos.schema_drift import SCHEMA_VERSIONS_ATTR
+from synthetic_payroll_lab.config import OutputConfig
+from synthetic_payroll_lab.writers.formats import write_frame
+
+
+# Partition column used per domain when partitioning is enabled without overrides
+DEFAULT_PARTITION_COLUMNS = {
+    "schedules": "shift_date",
+    "timecards": "work_date",
+    "payroll_runs": "run_date",
+    "assignment_history": "snapshot_date",
+}
+
+# Hive's directory name for rows whose partition value is null
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+MANIFEST_FILE = "_manifest.json"
+
+
+def _partition_value(value: Any) -> str:
+    """Format a partition key as it appears in the directory name."""
+    if pd.isna(value):
+        return NULL_PARTITION
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def write_partitioned(
+    df: pd.DataFrame,
+    domain_dir: Path,
+    partition_column: str,
+    format: str,
+    output: Optional[OutputConfig] = None,
+    part_name: str = "part-00000"
+) -> List[Dict[str, Any]]:
+    """Write a DataFrame as ``<column>=<value>/<part_name>.<ext>`` files.
+    
+    Rows are grouped by partition value in one factorize and sort pass,
+    and every partition is written on its own thread from its own row
+    positions. The partition column is dropped from the files, as
+    Hive-partitioned loaders take it from the path.
+    If ``df.attrs`` holds schema versions, each partition gets only the
+    drift columns of its newest version and its entry a ``schema_version``.
+    
+    Args:
+        df: DataFrame to write
+        domain_dir: Domain output directory
+        partition_column: Column holding the partition key
+        format: Output format (csv, json, parquet, feather, avro, ndjson)
+        output: Writer options (compression, row group size, max_workers)
+        part_name: File name (without extension) inside each partition
+    
+    Returns:
+        Manifest entries with the relative path, partition value and row count
+        (and schema version)
+    """
+    if partition_column not in df.columns:
+        raise ValueError(f"Partition column not found: {partition_column}")
+    
+    output = output or OutputConfig()
+    codes, uniques = pd.factorize(df[partition_column], sort=True, use_na_sentinel=True)
+    schema = df.attrs.get(SCHEMA_VERSIONS_ATTR)
+    row_versions = None if schema is None else schema.version_of(df[schema.date_column])
+    data = df.drop(columns=[partition_column])
+    data.attrs = {key: value for key, value in data.attrs.items() if key != SCHEMA_VERSIONS_ATTR}
+    
+    # Split row positions by partition once: sort codes, then slice runs
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(-1, len(uniques) + 1))
+    partitions = [
+        (_partition_value(value), order[bounds[code + 1]:bounds[code + 2]])
+        for code, value in enumerate(uniques)
+    ]
+    if bounds[0] < bounds[1]:
+        partitions.append((NULL_PARTITION, order[bounds[0]:bounds[1]]))
+    
+    def write_one(partition) -> Dict[str, Any]:
+        value, rows = partition
+        partition_dir = domain_dir / f"{partition_column}={value}"
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        part = data.iloc[rows]
+        entry = {"partition_value": value, "rows": len(part)}
+        if schema is not None:
+            versions = row_versions[rows]
+            part = schema.materialize(part, versions)
+            entry["schema_version"] = int(versions.max()) if len(versions) else 0
+        filepath = write_frame(part, partition_dir / part_name, format, output)
+        return {"path": filepath.relative_to(domain_dir).as_posix(), **entry}
+    
+    with ThreadPoolExecutor(max_workers=output.max_workers) as executor:
+        return list(executor.map(write_one, partitions))
+
+
+def write_manifest(
+    domain_dir: Path,
+    domain_name: str,
+    partition_column: str,
+    format: str,
+    entries: List[Dict[str, Any]],
+    schema: Optional[Any] = None
+) -> Path:
+    """Write the partition manifest for a domain.
+    
+    Args:
+        domain_dir: Domain output directory
+        domain_name: Name of the domain
+        partition_column: Column the domain is partitioned by
+        format: Output format of the partition files
+        entries: Manifest entries returned by ``write_partitioned``
+        schema: The domain's SchemaVersions, adding a ``schema_versions``
+            list up to the newest version written
+    
+    Returns:
+        Path of the manifest file
+    """
+    entries = sorted(entries, key=lambda entry: entry["path"])
+    manifest = {
+        "domain": domain_name,
+        "partition_column": partition_column,
+        "format": format,
+        "total_rows": sum(entry["rows"] for entry in entries),
+        "partitions": entries
+    }
+    if schema is not None:
+        max_version = max((entry.get("schema_version", 0) for entry in entries), default=0)
+        manifest["schema_versions"] = schema.describe(max_version)
+    
+    filepath = domain_dir / MANIFEST_FILE
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return filepath
+
+
+def read_manifest(domain_dir: Path) -> List[Dict[str, Any]]:
+    """Read the partition entries of an existing manifest.
+    
+    Args:
+        domain_dir: Domain output directory
+    
+    Returns:
+        Manifest entries, or an empty list if the domain has no manifest
+    """
+    filepath = domain_dir / MANIFEST_FILE
+    if not filepath.exists():
+        return []
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)["partitions"]
@@ -0,0 +1,58 @@
+"""Tests for the scale-factor benchmark suite."""
+
+import copy
+
+import pytest
+
+from synthetic_payroll_lab.benchmark import BENCHMARK_DOMAINS, compare, run_case
+
+
+@pytest.fixture(scope="module")
+def results():
+    return {"metadata": {}, "cases": [run_case(employees=50, months=1, seed=7)]}
+
+
+class TestBenchmark:
+    """Test benchmark cases and baseline comparison."""
+
+    def test_run_case_metrics(self, results):
+        """Test a case records rows, per-domain timings and throughput."""
+        case = results["cases"][0]
+
+        assert set(case["domain_seconds"]) == set(BENCHMARK_DOMAINS)
+        assert case["rows"]["employees"] == 50
+        assert case["total_rows"] == sum(case["rows"].values())
+        assert case["rows_per_sec"] > 0
+        assert case["total_seconds"] >= case["generate_seconds"]
+
+    def test_compare_identical_has_no_regressions(self, results):
+        """Test a run compared against itself is clean."""
+        assert compare(results, results) == []
+
+    def test_compare_flags_regressions(self, results):
+        """Test throughput drops and slower domains are flagged."""
+        baseline = copy.deepcopy(results)
+        case = baseline["cases"][0]
+        case["rows_per_sec"] = results["cases"][0]["rows_per_sec"] * 2
+        case["domain_seconds"]["timecards"] = 0.1
+        results = copy.deepcopy(results)
+        results["cases"][0]["domain_seconds"]["timecards"] = 0.2
+
+        metrics = {item["metric"] for item in compare(results, baseline, tolerance=0.10)}
+        assert metrics == {"rows_per_sec", "domain_seconds.timecards"}
+
+    def test_compare_ignores_noise_and_unmatched_cases(self, results):
+        """Test sub-threshold timings and cases missing from the baseline are skipped."""
+        baseline = copy.deepcopy(results)
+        baseline["cases"][0]["chaos_seconds"] = 0.001
+        current = copy.deepcopy(results)
+        current["cases"][0]["chaos_seconds"] = 0.01
+        assert compare(current, baseline) == []
+
+        baseline["cases"][0]["employees"] = 999
+        baseline["cases"][0]["rows_per_sec"] = 1e12
+        assert compare(current, baseline) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -1,6 +1,7 @@
 """Tests for chaos injectors."""
 
 import pytest
+from functools import partial
 import pandas as pd
 from datetime import datetime
 
@@ -9,8 +10,11 @@ from synthetic_payroll_lab.chaos import (
     NullInjector,
     LateArrivalInjector,
     SchemaDriftInjector,
-    FKOrphanInjector
+    FKOrphanInjector,
+    TimezoneErrorInjector,
+    ChaosPipeline
 )
+from synthetic_payroll_lab.chaos.schema_drift import SCHEMA_VERSIONS_ATTR
 
 
 class TestDuplicateInjector:
@@ -33,6 +37,19 @@ class TestDuplicateInjector:
         
         result = injector.inject(df, rate=0.0)
         assert len(result) == len(df)
+    
+    def test_duplicates_keep_row_order(self):
+        """Test copies are scattered without reshuffling the original rows."""
+        df = pd.DataFrame({'id': range(100)})
+        injector = DuplicateInjector(seed=42)
+        
+        result = injector.inject(df, rate=0.10)
+        
+        assert len(result) == 110
+        assert sorted(result['id'].unique()) == list(range(100))
+        assert result['id'].duplicated().sum() == 10
+        singles = result.loc[~result['id'].duplicated(keep=False), 'id']
+        assert singles.is_monotonic_increasing
 
 
 class TestNullInjector:
@@ -66,6 +83,16 @@ class TestNullInjector:
         # Key columns should not have nulls
         assert result['employee_id'].notna().all()
         assert result['person_id'].notna().all()
+    
+    def test_bool_columns_become_nullable(self, recwarn):
+        """Test bool columns are nulled as nullable booleans."""
+        df = pd.DataFrame({'union_flag': [True, False] * 50})
+        
+        result = NullInjector(seed=42).inject(df, rate=0.5)
+        
+        assert result['union_flag'].dtype == 'boolean'
+        assert result['union_flag'].isna().any()
+        assert not [w for w in recwarn if issubclass(w.category, FutureWarning)]
 
 
 class TestLateArrivalInjector:
@@ -98,6 +125,38 @@ class TestLateArrivalInjector:
         for idx, row in result.iterrows():
             if pd.notna(row['_simulated_load_date']) and row['late_arrival_flag']:
                 assert row['_simulated_load_date'] > row['work_date']
+    
+    def test_lag_distributions(self):
+        """Test lag days follow the configured distribution."""
+        df = pd.DataFrame({
+            'work_date': [datetime(2024, 1, 1).date()] * 999 + [None]
+        })
+        injector = LateArrivalInjector(seed=42)
+        
+        def lags(**kwargs):
+            result = injector.inject(df, rate=1.0, **kwargs)
+            return (result['_simulated_load_date'] - pd.Timestamp('2024-01-01')).dt.days
+        
+        uniform = lags(max_lag_days=5)
+        assert uniform.dropna().between(1, 5).all()
+        assert uniform.isna().sum() == 1
+        
+        geometric = lags(max_lag_days=7, lag_distribution='geometric', lag_p=0.8)
+        assert geometric.dropna().between(1, 7).all()
+        assert (geometric == 1).mean() > 0.7
+        
+        empirical = lags(lag_distribution='empirical', lag_weights=[0, 0, 1])
+        assert (empirical.dropna() == 3).all()
+    
+    def test_invalid_lag_distribution(self):
+        """Test unknown or incomplete lag distributions are rejected."""
+        df = pd.DataFrame({'work_date': pd.to_datetime(['2024-01-01'])})
+        injector = LateArrivalInjector(seed=42)
+        
+        with pytest.raises(ValueError):
+            injector.inject(df, rate=1.0, lag_distribution='poisson')
+        with pytest.raises(ValueError):
+            injector.inject(df, rate=1.0, lag_distribution='empirical')
 
 
 class TestSchemaDriftInjector:
@@ -126,6 +185,107 @@ class TestSchemaDriftInjector:
         # Should have added drift columns
         drift_columns = [col for col in result.columns if 'drift_field_' in col]
         assert len(drift_columns) > 0
+    
+    def test_progressive_drift_as_metadata(self):
+        """Test attached schema versions match the dense drift columns."""
+        df = pd.DataFrame({
+            'id': [1, 2, 3, 4],
+            'date': pd.to_datetime(['2024-01-01', '2024-06-01', None, '2024-12-01'])
+        })
+        injector = SchemaDriftInjector(seed=42)
+        
+        tagged = df.copy()
+        injector.attach_progressive(tagged, date_column='date', drift_interval_days=90)
+        schema = tagged.attrs[SCHEMA_VERSIONS_ATTR]
+        
+        assert list(tagged.columns) == ['id', 'date']
+        assert schema.version_of(tagged['date']).tolist() == [0, 1, 0, 3]
+        dense = injector.inject_progressive(df, date_column='date', drift_interval_days=90)
+        pd.testing.assert_frame_equal(
+            schema.materialize(tagged).drop(columns='date'),
+            dense.drop(columns='date')
+        )
+        assert [v['effective_from'] for v in schema.describe(2)] == [
+            '2024-01-01', '2024-03-31', '2024-06-29'
+        ]
+
+
+class TestTimezoneErrorInjector:
+    """Test TimezoneErrorInjector."""
+    
+    def test_inject_timezone_errors(self):
+        """Test affected records shift every timestamp by the same offset."""
+        start = pd.to_datetime(['2024-01-15 09:00'] * 50 + ['2024-07-15 09:00'] * 50)
+        df = pd.DataFrame({
+            'shift_start': start,
+            'shift_end': start + pd.Timedelta(hours=8),
+            'timezone': ['America/Chicago'] * 100
+        })
+        injector = TimezoneErrorInjector(seed=42)
+        
+        result = injector.inject(df, rate=0.20)
+        
+        error_hours = result['_timezone_error_hours']
+        assert (error_hours != 0).sum() == 20
+        shift = (result['shift_start'] - df['shift_start']).dt.total_seconds() / 3600
+        assert (shift == error_hours).all()
+        assert ((result['shift_end'] - result['shift_start']) == pd.Timedelta(hours=8)).all()
+        # Wrong-zone offsets, or Chicago's DST-aware UTC offset
+        assert error_hours[error_hours != 0].isin([-3, -2, -1, 1, 2, 3, 5, 6]).all()
+        assert (df['shift_start'] == start).all()
+    
+    def test_utc_as_local(self):
+        """Test UTC-as-local errors follow daylight saving time."""
+        df = pd.DataFrame({
+            'punch_in': pd.to_datetime(['2024-01-15 09:00', '2024-07-15 09:00']),
+            'timezone': ['America/New_York', 'America/New_York']
+        })
+        injector = TimezoneErrorInjector(seed=42)
+        
+        result = injector.inject(df, rate=1.0, utc_share=1.0)
+        
+        assert result['_timezone_error_hours'].tolist() == [5.0, 4.0]
+    
+    def test_no_timestamp_columns(self):
+        """Test frames without timestamp columns are left alone."""
+        df = pd.DataFrame({'id': [1, 2, 3]})
+        result = TimezoneErrorInjector(seed=42).inject(df, rate=1.0)
+        assert list(result.columns) == ['id']
+
+
+class TestChaosPipeline:
+    """Test ChaosPipeline."""
+    
+    def test_apply_matches_injectors(self):
+        """Test the pipeline matches running the injectors one after another."""
+        df = pd.DataFrame({
+            'employee_id': [f'EMP{i:06d}' for i in range(200)],
+            'hours': [8.0] * 200,
+            'work_date': [datetime(2024, 1, 1).date()] * 200
+        })
+        
+        expected = DuplicateInjector(seed=1).inject(df, rate=0.05)
+        expected = NullInjector(seed=2).inject(expected, rate=0.05)
+        expected = LateArrivalInjector(seed=3).inject(expected, rate=0.20)
+        expected = FKOrphanInjector(seed=4).inject(expected, 'employee_id', rate=0.05)
+        
+        pipeline = (
+            ChaosPipeline()
+            .add_row_plan(partial(DuplicateInjector(seed=1).plan, rate=0.05))
+            .add_step(partial(NullInjector(seed=2).inject_in_place, rate=0.05))
+            .add_step(partial(LateArrivalInjector(seed=3).inject_in_place, rate=0.20))
+            .add_step(partial(FKOrphanInjector(seed=4).inject_in_place, fk_column='employee_id', rate=0.05))
+        )
+        original = df.copy()
+        result = pipeline.apply(df)
+        
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(df, original)
+    
+    def test_empty_pipeline_returns_input(self):
+        """Test a pipeline without injections does not copy."""
+        df = pd.DataFrame({'id': [1, 2, 3]})
+        assert ChaosPipeline().apply(df) is df
 
 
 class TestFKOrphanInjector:
@@ -144,6 +304,40 @@ class TestFKOrphanInjector:
         # Should have some invalid employee IDs
         orphan_count = result['employee_id'].str.contains('9').sum()
         assert orphan_count > 0  # Should have orphaned some
+    
+    def test_orphans_by_prefix(self):
+        """Test each FK class gets its own kind of orphan value."""
+        df = pd.DataFrame({
+            'employee_id': [f'EMP{i:06d}' for i in range(100)],
+            'cost_center': [f'CC{i:04d}' for i in range(100)],
+            'job_code': ['ENG'] * 99 + [None],
+            'location_id': list(range(100))
+        }, index=range(1000, 1100))
+        injector = FKOrphanInjector(seed=42)
+        
+        result = injector.inject_multiple(
+            df, ['employee_id', 'cost_center', 'job_code', 'location_id'], rate=0.10
+        )
+        
+        changed = result['employee_id'] != df['employee_id']
+        assert changed.sum() == 10
+        assert result.loc[changed, 'employee_id'].str.fullmatch(r'EMP9\d{5}').all()
+        assert result['cost_center'].str.fullmatch(r'CC(00\d{2}|9\d{3})').all()
+        assert (result['cost_center'] != df['cost_center']).sum() == 10
+        assert result['job_code'].isin(['ENG', 'ENG_INVALID']).sum() == 99
+        assert (result['location_id'] == 999999).sum() == 10
+        
+        # Input is left untouched
+        assert df['employee_id'].str.fullmatch(r'EMP0000\d\d').all()
+    
+    def test_zero_rate_returns_copy(self):
+        """Test a zero rate still returns a copy of the input."""
+        df = pd.DataFrame({'employee_id': ['EMP000001', 'EMP000002']})
+        
+        result = FKOrphanInjector(seed=42).inject_multiple(df, ['employee_id'], rate=0.0)
+        result.loc[0, 'employee_id'] = 'EMP999999'
+        
+        assert df['employee_id'].iloc[0] == 'EMP000001'
 
 
 if __name__ == '__main__':
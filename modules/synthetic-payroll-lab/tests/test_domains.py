@@ -0,0 +1,479 @@
+"""Tests for domain generators."""
+
+import pytest
+from datetime import datetime
+import pandas as pd
+from faker import Faker
+
+from synthetic_payroll_lab.domains.employees import EmployeeGenerator
+from synthetic_payroll_lab.domains.schedules import ScheduleGenerator
+from synthetic_payroll_lab.domains.timecards import TimecardGenerator
+from synthetic_payroll_lab.domains.payroll import PayrollGenerator as PayrollDomainGenerator
+from synthetic_payroll_lab.domains.assignments import AssignmentHistoryGenerator
+from synthetic_payroll_lab.domains.jobs import JobGenerator
+from synthetic_payroll_lab.config import OrgTreeConfig, OvertimeConfig
+from synthetic_payroll_lab.org_tree import OrgTreeBuilder, closure_table, layer_sizes, org_depths
+from synthetic_payroll_lab.overtime import OvertimeCalculator, work_states
+
+
+EMPLOYEE_IDS = [f"EMP{i:06d}" for i in range(20)]
+EMPLOYEE_LOCATIONS = {emp_id: "Chicago, IL" for emp_id in EMPLOYEE_IDS}
+
+
+class TestEmployeeGenerator:
+    """Test EmployeeGenerator engines."""
+    
+    def _generate(self, vectorized: bool, count: int = 200, **kwargs) -> pd.DataFrame:
+        fake = Faker()
+        fake.seed_instance(42)
+        gen = EmployeeGenerator(fake, 42, **kwargs)
+        generate_fn = gen.generate_vectorized if vectorized else gen.generate
+        return generate_fn(
+            count=count,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 12, 31),
+            job_codes=['ENG', 'OPS'],
+            cost_centers=['CC0001', 'CC0002'],
+            id_offset=100
+        )
+    
+    def test_caller_faker_not_reseeded(self):
+        """Test a seeded generator leaves the caller's Faker stream alone."""
+        fake, reference = Faker(), Faker()
+        fake.seed_instance(7)
+        reference.seed_instance(7)
+        EmployeeGenerator(fake, 42).generate(
+            count=5,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 12, 31),
+            job_codes=['ENG'],
+            cost_centers=['CC0001']
+        )
+        
+        assert fake.name() == reference.name()
+    
+    def test_bulk_schema_matches(self):
+        """Test bulk synthesis keeps the row-wise output schema."""
+        rowwise = self._generate(vectorized=False)
+        bulk = self._generate(vectorized=True)
+        
+        assert list(bulk.columns) == list(rowwise.columns)
+        assert bulk.dtypes.equals(rowwise.dtypes)
+        assert bulk['employee_number'].iloc[0] == 'EMP000100'
+        assert type(bulk['hire_date'].iloc[0]) is type(rowwise['hire_date'].iloc[0])
+    
+    def test_bulk_formats(self):
+        """Test SSN, phone and ZIP templates."""
+        df = self._generate(vectorized=True)
+        
+        assert df['national_identifier'].str.fullmatch(r'\d{3}-\d{2}-\d{4}').all()
+        assert not df['national_identifier'].str.startswith('666').any()
+        assert df['phone_number'].str.fullmatch(r'\(\d{3}\) \d{3}-\d{4}').all()
+        assert df['zip_code'].str.fullmatch(r'\d{5}').all()
+    
+    def test_bulk_dates(self):
+        """Test termination and manager constraints."""
+        df = self._generate(vectorized=True)
+        terminated = df[df['employment_status'] == 'TERMINATED']
+        
+        assert (terminated['termination_date'] >= terminated['hire_date']).all()
+        assert (terminated['effective_end_date'] == terminated['termination_date']).all()
+        assert df.loc[df['employment_status'] == 'ACTIVE', 'termination_date'].isna().all()
+        managers = df['manager_id'].dropna().str[3:].astype(int)
+        assert (managers < df.loc[managers.index, 'person_id'] - 1).all()
+    
+    def test_pool_size_controls_uniqueness(self):
+        """Test pool size bounds the number of distinct names."""
+        df = self._generate(vectorized=True, count=500, pool_size=10)
+        assert df['first_name'].nunique() <= 10
+
+
+class TestScheduleGenerator:
+    """Test ScheduleGenerator engines."""
+    
+    def _generate(self, vectorized: bool, seed: int = 42) -> pd.DataFrame:
+        gen = ScheduleGenerator(Faker(), seed)
+        generate_fn = gen.generate_vectorized if vectorized else gen.generate
+        return generate_fn(
+            employee_ids=EMPLOYEE_IDS,
+            employee_locations=EMPLOYEE_LOCATIONS,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 14)
+        )
+    
+    def test_vectorized_schema_matches(self):
+        """Test vectorized engine keeps the row-wise output schema."""
+        rowwise = self._generate(vectorized=False)
+        vectorized = self._generate(vectorized=True)
+        
+        assert list(vectorized.columns) == list(rowwise.columns)
+        assert vectorized.dtypes.equals(rowwise.dtypes)
+        assert vectorized['schedule_id'].is_unique
+        assert vectorized['timezone'].eq("America/Chicago").all()
+    
+    def test_vectorized_deterministic(self):
+        """Test vectorized engine is reproducible per seed."""
+        pd.testing.assert_frame_equal(
+            self._generate(vectorized=True, seed=7),
+            self._generate(vectorized=True, seed=7)
+        )
+    
+    def test_vectorized_shift_boundaries(self):
+        """Test overnight shifts end on the following day."""
+        df = self._generate(vectorized=True)
+        
+        assert (df['shift_end'] > df['shift_start']).all()
+        night = df[df['shift_type'] == 'NIGHT']
+        assert (night['shift_end'].dt.date > night['shift_date']).all()
+        assert (df.loc[df['schedule_type'] == 'PTO', 'hours_scheduled'] == 0.0).all()
+    
+    def test_vectorized_weekend_attendance(self):
+        """Test weekend attendance is sparser than weekday attendance."""
+        df = self._generate(vectorized=True)
+        weekday = pd.to_datetime(df['shift_date']).dt.weekday
+        
+        per_weekend_day = (weekday >= 5).sum() / 4
+        per_weekday = (weekday < 5).sum() / 10
+        assert per_weekend_day < per_weekday
+
+
+class TestTimecardGenerator:
+    """Test TimecardGenerator engines."""
+    
+    @pytest.fixture
+    def schedules_df(self) -> pd.DataFrame:
+        gen = ScheduleGenerator(Faker(), 42)
+        return gen.generate_vectorized(
+            employee_ids=EMPLOYEE_IDS,
+            employee_locations=EMPLOYEE_LOCATIONS,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 1, 14)
+        )
+    
+    def test_vectorized_schema_matches(self, schedules_df):
+        """Test vectorized engine keeps the row-wise output schema."""
+        start, end = datetime(2024, 1, 1), datetime(2024, 1, 14)
+        rowwise = TimecardGenerator(Faker(), 42).generate(schedules_df, start, end)
+        vectorized = TimecardGenerator(Faker(), 42).generate_vectorized(schedules_df, start, end)
+        
+        assert list(vectorized.columns) == list(rowwise.columns)
+        assert vectorized.dtypes.equals(rowwise.dtypes)
+        assert len(vectorized) == len(rowwise)
+    
+    def test_vectorized_hours(self, schedules_df):
+        """Test hours are left unsplit and punch offsets stay within profile bounds."""
+        gen = TimecardGenerator(Faker(), 42)
+        df = gen.generate_vectorized(schedules_df, datetime(2024, 1, 1), datetime(2024, 1, 14))
+        worked = schedules_df[schedules_df['schedule_type'] != 'PTO'].reset_index(drop=True)
+        
+        # Overtime is split later by OvertimeCalculator, not per generated day
+        assert (df['hours_regular'] == df['hours_worked']).all()
+        assert (df['hours_overtime'] == 0.0).all()
+        
+        punch_in_delta = (df['punch_in'] - worked['shift_start']).dt.total_seconds() / 60
+        assert punch_in_delta.between(-15, 30).all()
+        punch_out_delta = (df['punch_out'] - worked['shift_end']).dt.total_seconds() / 60
+        assert punch_out_delta.between(-30, 180).all()
+
+
+
+def make_timecards(employee_id: str, hours: list, first_day: str = "2024-01-07") -> pd.DataFrame:
+    """One timecard per consecutive day starting first_day (a Sunday)."""
+    days = pd.date_range(first_day, periods=len(hours), freq="D")
+    return pd.DataFrame({
+        'employee_id': employee_id,
+        'work_date': days.date,
+        'punch_in': days + pd.Timedelta(hours=9),
+        'hours_worked': hours,
+        'hours_regular': 0.0,
+        'hours_overtime': 0.0,
+    })
+
+
+class TestOvertimeCalculator:
+    """Test weekly and state daily overtime rules."""
+    
+    STATES = pd.Series({'EMP000001': 'TX', 'EMP000002': 'CA'})
+    
+    def test_weekly_threshold(self):
+        """Test hours past 40 in a workweek are overtime and weeks reset."""
+        df = make_timecards('EMP000001', [9.0] * 6 + [5.0] * 2)
+        OvertimeCalculator().split_in_place(df, self.STATES)
+        
+        assert df['hours_regular'].iloc[:7].sum() == 40.0
+        assert df['hours_overtime'].tolist() == [0, 0, 0, 0, 5.0, 9.0, 5.0, 0]
+        # Saturday 2024-01-13 closes the week; Sunday starts a new one
+        assert df['hours_regular'].iloc[7] == 5.0
+        assert (df['hours_double_time'] == 0.0).all()
+    
+    def test_california_daily_rules(self):
+        """Test CA daily overtime and double time are not counted again weekly."""
+        df = make_timecards('EMP000002', [13.0] + [10.0] * 4)
+        OvertimeCalculator().split_in_place(df, self.STATES)
+        
+        assert df.iloc[0][['hours_regular', 'hours_overtime', 'hours_double_time']].tolist() == [
+            8.0, 4.0, 1.0
+        ]
+        assert df['hours_regular'].sum() == 40.0
+        assert df['hours_overtime'].sum() == 12.0
+        assert (df['hours_regular'] + df['hours_overtime'] + df['hours_double_time']
+                == df['hours_worked']).all()
+    
+    def test_configured_rules(self):
+        """Test thresholds and week start come from the config."""
+        config = OvertimeConfig(weekly_threshold=30.0, week_start="MON", daily_rules={})
+        df = make_timecards('EMP000002', [13.0] + [10.0] * 3)
+        OvertimeCalculator(config).split_in_place(df, self.STATES)
+        
+        # Sunday belongs to the previous Monday-start week
+        assert df['hours_overtime'].tolist() == [0.0, 0.0, 0.0, 0.0]
+        df = make_timecards('EMP000002', [10.0] * 4, first_day="2024-01-08")
+        OvertimeCalculator(config).split_in_place(df, self.STATES)
+        assert df['hours_overtime'].tolist() == [0.0, 0.0, 0.0, 10.0]
+    
+    def test_prior_timecards(self):
+        """Test earlier days of the workweek count toward the weekly threshold."""
+        full = make_timecards('EMP000001', [9.0] * 6)
+        OvertimeCalculator().split_in_place(full, self.STATES)
+        
+        prior, today = full.iloc[:5].copy(), full.iloc[5:].copy()
+        OvertimeCalculator().split_in_place(today, self.STATES, prior=prior)
+        pd.testing.assert_frame_equal(today, full.iloc[5:])
+    
+    def test_work_states(self):
+        """Test state codes are parsed from work locations."""
+        locations = pd.Series(['San Francisco, CA', 'Austin, TX', None, 'Remote'])
+        assert work_states(locations).tolist() == ['CA', 'TX', None, None]
+
+
+class TestOrgTreeBuilder:
+    """Test the job-level org tree and its closure table."""
+    
+    def test_layer_sizes(self):
+        """Test layers grow by fan_out and the last layer takes the rest."""
+        assert layer_sizes(100, 3.0, 8).tolist() == [1, 3, 9, 27, 60]
+        assert layer_sizes(100, 3.0, 3).tolist() == [1, 3, 96]
+        assert layer_sizes(1, 3.0, 8).tolist() == [1]
+    
+    def test_managers_follow_job_levels(self):
+        """Test one root, bounded depth and no one reporting to a lower job level."""
+        jobs_df = JobGenerator().generate()
+        employees_df = pd.DataFrame({
+            'employee_number': [f"EMP{i:06d}" for i in range(500)],
+            'job_code': jobs_df['job_code'].sample(500, replace=True, random_state=1).to_numpy(),
+        })
+        OrgTreeBuilder(OrgTreeConfig(max_depth=4, fan_out=5.0), seed=42).assign_managers_in_place(
+            employees_df, jobs_df
+        )
+        
+        roots = employees_df[employees_df['manager_id'].isna()]
+        assert len(roots) == 1
+        levels = jobs_df.set_index('job_code')['job_level']
+        assert levels[roots['job_code'].iloc[0]] == levels.max()
+        managed = employees_df.dropna(subset=['manager_id'])
+        manager_jobs = employees_df.set_index('employee_number').loc[managed['manager_id'], 'job_code']
+        assert (levels[manager_jobs].to_numpy() >= levels[managed['job_code']].to_numpy()).all()
+        
+        closure = closure_table(employees_df)
+        assert closure['distance'].max() == 3
+        assert (closure[closure['distance'] == 0]['ancestor_id'] == employees_df['employee_number']).all()
+        assert (closure.groupby('descendant_id')['distance'].max() == closure.groupby('descendant_id').size() - 1).all()
+    
+    def test_closure_table(self):
+        """Test closure pairs of a small hierarchy and cycle detection."""
+        employees_df = pd.DataFrame({
+            'employee_number': ['EMP000000', 'EMP000001', 'EMP000002', 'EMP000003'],
+            'manager_id': [None, 'EMP000000', 'EMP000001', 'EMP000000'],
+        })
+        closure = closure_table(employees_df)
+        pairs = set(zip(closure['ancestor_id'], closure['descendant_id'], closure['distance']))
+        assert pairs == {
+            ('EMP000000', 'EMP000000', 0), ('EMP000001', 'EMP000001', 0),
+            ('EMP000002', 'EMP000002', 0), ('EMP000003', 'EMP000003', 0),
+            ('EMP000000', 'EMP000001', 1), ('EMP000001', 'EMP000002', 1),
+            ('EMP000000', 'EMP000003', 1), ('EMP000000', 'EMP000002', 2),
+        }
+        assert len(closure_table(employees_df, max_depth=1)) == 7
+        
+        assert org_depths(employees_df).tolist() == [0, 1, 2, 1]
+        assert org_depths(employees_df.iloc[:0]).tolist() == []
+        
+        employees_df.loc[0, 'manager_id'] = 'EMP000002'
+        with pytest.raises(ValueError, match="cycle"):
+            closure_table(employees_df)
+        with pytest.raises(ValueError, match="cycle"):
+            org_depths(employees_df)
+
+
+class TestPayrollDomainGenerator:
+    """Test payroll run aggregation engines."""
+    
+    @pytest.fixture
+    def inputs(self):
+        start, end = datetime(2024, 1, 1), datetime(2024, 2, 15)
+        schedules_df = ScheduleGenerator(Faker(), 42).generate_vectorized(
+            EMPLOYEE_IDS, EMPLOYEE_LOCATIONS, start, end
+        )
+        timecards_df = TimecardGenerator(Faker(), 42).generate_vectorized(schedules_df, start, end)
+        employees_df = pd.DataFrame({
+            'employee_number': EMPLOYEE_IDS,
+            'job_code': ['ENG'] * 19 + ['UNKNOWN'],
+            'termination_date': [None] * 19 + [datetime(2024, 1, 10).date()]
+        })
+        return employees_df, timecards_df, JobGenerator().generate(), start, end
+    
+    def test_vectorized_matches_rowwise_hours(self, inputs):
+        """Test group-by aggregation matches per-employee filtering."""
+        rowwise = PayrollDomainGenerator(Faker(), 42).generate(*inputs)
+        vectorized = PayrollDomainGenerator(Faker(), 42).generate_vectorized(*inputs)
+        
+        assert list(vectorized.columns) == list(rowwise.columns)
+        assert vectorized.dtypes.equals(rowwise.dtypes)
+        key_columns = [
+            'run_id', 'run_date', 'period_start', 'period_end', 'employee_id',
+            'hours_base', 'hours_overtime', 'hours_pto'
+        ]
+        pd.testing.assert_frame_equal(vectorized[key_columns], rowwise[key_columns])
+    
+    def test_vectorized_pay_components(self, inputs):
+        """Test net pay reconciles with gross, taxes and deductions."""
+        df = PayrollDomainGenerator(Faker(), 42).generate_vectorized(*inputs)
+        
+        taxes = df['tax_federal'] + df['tax_state'] + df['tax_fica']
+        deductions = df['deduction_401k'] + df['deduction_health'] + df['deduction_dental']
+        assert (df['gross_pay'] - taxes - deductions - df['net_pay']).abs().max() < 0.05
+        
+        # Terminated employee only appears in the first period
+        terminated = df[df['employee_id'] == EMPLOYEE_IDS[-1]]
+        assert terminated['run_id'].tolist() == [1001]
+        assert terminated['annual_salary'].between(50000, 80000).all()
+    
+    def test_retro_corrections(self, inputs):
+        """Test correction rows reference earlier runs with signed deltas."""
+        timecards_df = inputs[1]
+        payroll_df = PayrollDomainGenerator(Faker(), 42).generate_vectorized(*inputs)
+        df = PayrollDomainGenerator(Faker(), 7).generate_retro(
+            payroll_df, timecards_df, retro_pay_rate=0.2
+        )
+        
+        assert list(df.columns) == list(payroll_df.columns) + ['original_run_id']
+        assert set(df['run_type']) == {'CORRECTION', 'ADJUSTMENT'}
+        assert df['original_run_id'].isin(payroll_df['run_id']).all()
+        assert (df['run_id'] > payroll_df['run_id'].max()).all()
+        assert (df['run_date'] > df['period_end']).all()
+        assert (df['gross_pay'] < 0).any() and (df['gross_pay'] > 0).any()
+        
+        taxes = df['tax_federal'] + df['tax_state'] + df['tax_fica']
+        assert (df['gross_pay'] - taxes - df['deduction_401k'] - df['net_pay']).abs().max() < 0.05
+        
+        # Hours corrections come only from adjusted timecards of the corrected period
+        corrections = df[df['run_type'] == 'CORRECTION']
+        gross = (corrections['hours_base'] + 1.5 * corrections['hours_overtime']) * corrections['hourly_rate']
+        assert (gross - corrections['gross_pay']).abs().max() < 0.05
+        flagged = timecards_df[timecards_df['adjustment_flag']]
+        for _, row in corrections.iterrows():
+            cards = flagged[
+                (flagged['employee_id'] == row['employee_id']) &
+                (flagged['work_date'] >= row['period_start']) &
+                (flagged['work_date'] <= row['period_end'])
+            ]
+            assert len(cards) > 0
+        
+        raises = df[df['run_type'] == 'ADJUSTMENT']
+        assert (raises[['hours_base', 'hours_overtime']] == 0).all().all()
+        assert (raises['gross_pay'] > 0).all()
+
+
+class TestAssignmentHistoryGenerator:
+    """Test effective-dated assignment change history."""
+    
+    @pytest.fixture
+    def employees_df(self):
+        return EmployeeGenerator(Faker(), 42).generate_vectorized(
+            count=200,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 12, 31),
+            job_codes=JobGenerator().generate()['job_code'].tolist(),
+            cost_centers=['CC0001', 'CC0002', 'CC0003']
+        )
+    
+    def _generate(self, employees_df: pd.DataFrame, **kwargs) -> pd.DataFrame:
+        return AssignmentHistoryGenerator(Faker(), 42).generate(
+            employees_df, JobGenerator().generate(), ['CC0001', 'CC0002', 'CC0003'],
+            datetime(2024, 1, 1), datetime(2024, 12, 31), **kwargs
+        )
+    
+    def test_versions_are_contiguous(self, employees_df):
+        """Test each employee's versions start at hire and tile time without gaps."""
+        df = self._generate(employees_df, changes_per_year=4.0)
+        
+        assert (df.groupby('employee_number').size() >= 1).all()
+        hires = df[df['assignment_version'] == 1].set_index('employee_number')
+        assert (hires['change_type'] == 'HIRE').all()
+        assert (hires['effective_start_date'] == employees_df.set_index('employee_number')['hire_date']).all()
+        
+        same_employee = df['employee_number'] == df['employee_number'].shift(-1)
+        next_start = pd.to_datetime(df['effective_start_date'].shift(-1))
+        end = pd.to_datetime(df.loc[same_employee, 'effective_end_date'])
+        assert (end + pd.Timedelta(days=1) == next_start[same_employee]).all()
+        assert (df.loc[~same_employee, 'effective_end_date'] == datetime(9999, 12, 31).date()).all()
+        assert (df['snapshot_date'] >= datetime(2024, 1, 1).date()).all()
+        
+        terminations = df[df['change_type'] == 'TERMINATION']
+        assert len(terminations) == employees_df['termination_date'].notna().sum()
+        assert (terminations['employment_status'] == 'TERMINATED').all()
+    
+    def test_change_events(self, employees_df):
+        """Test each change type changes its columns and churn follows the rate."""
+        df = self._generate(employees_df, changes_per_year=4.0)
+        previous = df.shift(1)
+        
+        events = df[df['change_type'].isin(['PROMOTION', 'TRANSFER', 'MANAGER_CHANGE'])]
+        assert 2.0 < len(events) / len(employees_df) < 4.5
+        
+        promotions = df['change_type'] == 'PROMOTION'
+        assert (df.loc[promotions, 'job_code'] != previous.loc[promotions, 'job_code']).all()
+        assert (df.loc[promotions, 'department'] == previous.loc[promotions, 'department']).all()
+        managers = df['change_type'] == 'MANAGER_CHANGE'
+        assert df.loc[managers, 'manager_id'].isin(employees_df['employee_number']).all()
+        assert (df.loc[managers, 'manager_id'] != df.loc[managers, 'employee_number']).all()
+        assert (df.loc[managers, 'job_code'] == previous.loc[managers, 'job_code']).all()
+        
+        only_transfers = self._generate(employees_df, change_type_weights={'TRANSFER': 1.0})
+        assert set(only_transfers['change_type']) <= {'HIRE', 'TRANSFER', 'TERMINATION'}
+        unchanged = self._generate(employees_df, changes_per_year=0.0)
+        assert set(unchanged['change_type']) <= {'HIRE', 'TERMINATION'}
+    
+    def test_invalid_change_type(self, employees_df):
+        """Test unknown change types are rejected."""
+        with pytest.raises(ValueError, match="Unsupported change types"):
+            self._generate(employees_df, change_type_weights={'DEMOTION': 1.0})
+    
+    def test_manager_changes_keep_org_tree(self, employees_df):
+        """Test new managers come from the org layer above, never a lower job level."""
+        jobs_df = JobGenerator().generate()
+        OrgTreeBuilder(OrgTreeConfig(max_depth=4, fan_out=5.0), seed=42).assign_managers_in_place(
+            employees_df, jobs_df
+        )
+        df = self._generate(
+            employees_df, changes_per_year=6.0, change_type_weights={'MANAGER_CHANGE': 1.0},
+            org_tree=True
+        )
+        
+        depth = pd.Series(org_depths(employees_df), index=employees_df['employee_number'])
+        changes = df[df['change_type'] == 'MANAGER_CHANGE']
+        assert len(changes) > 0
+        assert (depth[changes['manager_id']].to_numpy() == depth[changes['employee_number']].to_numpy() - 1).all()
+        
+        levels = jobs_df.set_index('job_code')['job_level']
+        hire_jobs = employees_df.set_index('employee_number')['job_code']
+        manager_levels = levels[hire_jobs[changes['manager_id']]].to_numpy()
+        assert (manager_levels >= levels[hire_jobs[changes['employee_number']]].to_numpy()).all()
+        
+        # The root keeps no manager; its drawn manager changes become transfers
+        root = depth.index[depth == 0][0]
+        assert df.loc[df['employee_number'] == root, 'manager_id'].isna().all()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
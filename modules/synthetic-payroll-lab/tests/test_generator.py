@@ -1,10 +1,16 @@
 """Tests for PayrollGenerator."""
 
+import json
+import random
 import pytest
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 from synthetic_payroll_lab import PayrollGenerator, ChaosConfig
+from synthetic_payroll_lab.config import AssignmentHistoryConfig, OrgTreeConfig, OutputConfig, RetroConfig
+from synthetic_payroll_lab.generator import DOMAIN_DEPENDENCIES
+from synthetic_payroll_lab.org_tree import org_depths
 
 
 class TestPayrollGenerator:
@@ -33,6 +39,29 @@ class TestPayrollGenerator:
         gen = PayrollGenerator(employees=10, chaos=chaos)
         assert gen.chaos.duplicate_rate == 0.05
     
+    def test_init_invalid_engine(self):
+        """Test unknown engines are rejected."""
+        with pytest.raises(ValueError):
+            PayrollGenerator(employees=10, engine="spark")
+    
+    def test_numpy_engine_time_series(self):
+        """Test schedules and timecards generated with the numpy engine."""
+        gen = PayrollGenerator(
+            employees=10,
+            start_date="2024-01-01",
+            end_date="2024-01-07",
+            seed=42,
+            engine="numpy"
+        )
+        schedules_df = gen.get_domain('schedules')
+        timecards_df = gen.get_domain('timecards')
+        
+        assert len(schedules_df) > 0
+        assert 'schedule_id' in schedules_df.columns
+        assert 'shift_type' in schedules_df.columns
+        assert len(timecards_df) > 0
+        assert timecards_df['timecard_id'].is_unique
+    
     def test_generate_all_domains(self, tmp_path):
         """Test generating all domains."""
         gen = PayrollGenerator(
@@ -60,6 +89,222 @@ class TestPayrollGenerator:
             assert isinstance(df, pd.DataFrame)
             assert len(df) > 0
     
+    def test_generate_all_domains_metrics(self, tmp_path):
+        """Test per-stage spans and the Chrome trace written alongside the output."""
+        gen = PayrollGenerator(
+            employees=5,
+            start_date="2024-01-01",
+            end_date="2024-01-07",
+            seed=42,
+            engine="numpy",
+            trace_memory=True
+        )
+        
+        domains = gen.generate_all_domains(output_path=str(tmp_path), format="csv", trace=True)
+        
+        generate = gen.metrics.durations("generate")
+        assert set(generate) == {f"generate.{name}" for name in domains}
+        assert set(gen.metrics.durations("write")) == {f"write.{name}" for name in domains}
+        chaos = gen.metrics.durations("chaos")
+        assert "chaos.timecards.late_arrivals" in chaos
+        assert "chaos.employees.fk_orphans.manager_id" in chaos
+        spans = {span.name: span for span in gen.metrics.spans}
+        assert spans["generate.timecards"].args["rows"] == len(gen.get_domain("timecards"))
+        assert spans["generate.timecards"].py_peak_mb > 0
+        assert spans["chaos.timecards"].py_peak_mb >= spans["chaos.timecards.nulls"].py_peak_mb
+        
+        with open(tmp_path / "_trace.json") as f:
+            events = json.load(f)["traceEvents"]
+        assert {e["name"] for e in events if e["ph"] == "X"} == set(spans)
+        
+        # Stages run outside an instrumented call are not recorded
+        gen._apply_chaos({"jobs": domains["jobs"]})
+        assert len(gen.metrics.spans) == len(spans)
+    
+    def test_generate_parquet(self, tmp_path):
+        """Test generated domains can be written as Parquet."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        gen = PayrollGenerator(
+            employees=5,
+            start_date="2024-01-01",
+            end_date="2024-01-07",
+            seed=42,
+            engine="numpy"
+        )
+        
+        domains = gen.generate_all_domains(output_path=str(tmp_path), format="parquet")
+        
+        for domain_name, df in domains.items():
+            table = pq.read_table(tmp_path / f"domain={domain_name}" / f"{domain_name}.parquet")
+            assert table.num_rows == len(df)
+    
+    def test_generate_json(self, tmp_path):
+        """Test generated domains can be written as JSON records."""
+        gen = PayrollGenerator(
+            employees=5,
+            start_date="2024-01-01",
+            end_date="2024-01-07",
+            seed=42
+        )
+        
+        domains = gen.generate_all_domains(output_path=str(tmp_path), format="json")
+        
+        for domain_name, df in domains.items():
+            filepath = tmp_path / f"domain={domain_name}" / f"{domain_name}.json"
+            assert len(filepath.read_text().splitlines()) == len(df)
+    
+    def test_generate_partitioned(self, tmp_path):
+        """Test date-partitioned output with a manifest per domain."""
+        gen = PayrollGenerator(
+            employees=5,
+            start_date="2024-01-01",
+            end_date="2024-01-07",
+            seed=42,
+            engine="numpy",
+            output=OutputConfig(partition_by={"timecards": "work_date"})
+        )
+        
+        domains = gen.generate_all_domains(output_path=str(tmp_path), format="csv")
+        
+        timecards_dir = tmp_path / "domain=timecards"
+        with open(timecards_dir / "_manifest.json") as f:
+            manifest = json.load(f)
+        assert manifest["total_rows"] == len(domains["timecards"])
+        for entry in manifest["partitions"]:
+            assert (timecards_dir / entry["path"]).exists()
+        assert (tmp_path / "domain=employees" / "employees.csv").exists()
+    
+    def test_generate_ndjson_schema(self, tmp_path):
+        """Test NDJSON domains get a BigQuery schema matching their files."""
+        gen = PayrollGenerator(
+            employees=5,
+            start_date="2024-01-01",
+            end_date="2024-01-07",
+            seed=42,
+            engine="numpy",
+            output=OutputConfig(partition_by={"timecards": "work_date"})
+        )
+        
+        gen.generate_all_domains(output_path=str(tmp_path), format="ndjson")
+        
+        for domain_name in DOMAIN_DEPENDENCIES:
+            domain_dir = tmp_path / f"domain={domain_name}"
+            with open(domain_dir / "_schema.json") as f:
+                fields = [field["name"] for field in json.load(f)]
+            part = next(domain_dir.rglob("*.ndjson"))
+            with open(part) as f:
+                assert list(json.loads(f.readline())) == fields
+        with open(tmp_path / "domain=employees" / "_schema.json") as f:
+            types = {field["name"]: field["type"] for field in json.load(f)}
+        assert types["hire_date"] == "DATE"
+        assert types["effective_end_date"] == "DATE"
+    
+    def test_generate_streaming(self, tmp_path):
+        """Test chunked streaming generation writes one part per chunk."""
+        gen = PayrollGenerator(
+            employees=7,
+            start_date="2024-01-01",
+            end_date="2024-01-14",
+            seed=42,
+            engine="numpy"
+        )
+        
+        row_counts = gen.generate_streaming(
+            output_path=str(tmp_path),
+            format="csv",
+            chunk_size=3
+        )
+        
+        parts = sorted((tmp_path / "domain=employees").glob("part-*.csv"))
+        assert [p.name for p in parts] == ["part-00000.csv", "part-00001.csv", "part-00002.csv"]
+        
+        timecard_parts = sorted((tmp_path / "domain=timecards").glob("part-*.csv"))
+        timecards = pd.concat(pd.read_csv(p) for p in timecard_parts)
+        assert len(timecards) == row_counts["timecards"]
+        assert timecards["employee_id"].nunique() > 3
+        assert (tmp_path / "domain=jobs" / "jobs.csv").exists()
+    
+    def test_streaming_chunks_are_distinct(self, tmp_path):
+        """Test each chunk draws from its own derived seed."""
+        gen = PayrollGenerator(
+            employees=4,
+            start_date="2024-01-01",
+            end_date="2024-01-03",
+            chaos=ChaosConfig(
+                duplicate_rate=0, null_spike_rate=0, late_arrival_pct=0, fk_orphan_rate=0
+            ),
+            seed=42
+        )
+        gen.generate_streaming(output_path=str(tmp_path), format="csv", chunk_size=2)
+        
+        first = pd.read_csv(tmp_path / "domain=employees" / "part-00000.csv")
+        second = pd.read_csv(tmp_path / "domain=employees" / "part-00001.csv")
+        assert first["employee_number"].tolist() == ["EMP000000", "EMP000001"]
+        assert second["employee_number"].tolist() == ["EMP000002", "EMP000003"]
+        assert first["national_identifier"].tolist() != second["national_identifier"].tolist()
+    
+    def test_sharded_generation_independent_of_workers(self, tmp_path):
+        """Test merged sharded output is byte-identical for any worker count."""
+        outputs = {}
+        for workers in (1, 3):
+            gen = PayrollGenerator(
+                employees=9,
+                start_date="2024-01-01",
+                end_date="2024-01-20",
+                seed=42,
+                engine="numpy",
+                workers=workers,
+                shard_size=2
+            )
+            output_dir = tmp_path / f"workers={workers}"
+            domains = gen.generate_all_domains(output_path=str(output_dir), format="csv")
+            assert gen.get_domain("timecards")["timecard_id"].is_unique
+            assert len(gen.get_domain("employees")) == 9
+            outputs[workers] = {
+                p.relative_to(output_dir): p.read_bytes() for p in output_dir.rglob("*.csv")
+            }
+        
+        assert outputs[1] == outputs[3]
+    
+    def test_incremental_resumes_from_state(self, tmp_path):
+        """Test appending days across runs matches one longer run."""
+        outputs = {}
+        for name, batches in (("split", (10, 6)), ("single", (16,))):
+            output_dir = tmp_path / name
+            for days in batches:
+                gen = PayrollGenerator(
+                    employees=8, start_date="2024-01-01", seed=42, engine="numpy"
+                )
+                gen.generate_incremental(output_path=str(output_dir), format="csv", days=days)
+            outputs[name] = {
+                p.relative_to(output_dir): p.read_bytes() for p in output_dir.rglob("*.csv")
+            }
+        
+        assert outputs["split"] == outputs["single"]
+        
+        output_dir = tmp_path / "split"
+        schedule_days = {p.name for p in (output_dir / "domain=schedules").iterdir() if p.is_dir()}
+        assert "shift_date=2024-01-01" in schedule_days
+        assert "shift_date=2024-01-16" in schedule_days
+        assert "shift_date=2024-01-17" not in schedule_days
+        
+        # Only the period closing on day 15 has been paid
+        manifest = json.loads((output_dir / "domain=payroll_runs" / "_manifest.json").read_text())
+        assert [p["partition_value"] for p in manifest["partitions"]] == ["2024-01-15"]
+        state = json.loads((output_dir / "_state" / "state.json").read_text())
+        assert state["next_date"] == "2024-01-17"
+        assert state["next_run_id"] == 1002
+        
+        # Frames of the earlier snapshot were replaced by the current one's
+        frames = sorted(p.name for p in (output_dir / "_state").glob("*.pkl"))
+        assert frames == sorted(state["frames"].values())
+        assert all(name.endswith("-2024-01-17.pkl") for name in frames)
+    
+    def test_invalid_workers(self):
+        """Test non-positive worker counts are rejected."""
+        with pytest.raises(ValueError):
+            PayrollGenerator(employees=10, workers=0)
+    
     def test_deterministic_generation(self):
         """Test that seed produces deterministic results."""
         gen1 = PayrollGenerator(employees=10, seed=42)
@@ -71,10 +316,151 @@ class TestPayrollGenerator:
         # Should have same number of rows
         assert len(domains1['employees']) == len(domains2['employees'])
         
+    def test_domain_streams_isolated(self, tmp_path):
+        """Test a domain regenerated on its own matches the full run."""
+        gen = PayrollGenerator(
+            employees=20, start_date="2024-01-01", end_date="2024-01-31", seed=42
+        )
+        domains = gen.generate_all_domains(output_path=str(tmp_path), format="csv")
+        
+        standalone = PayrollGenerator(
+            employees=20, start_date="2024-01-01", end_date="2024-01-31", seed=42
+        )
+        timecards_df = gen.get_domain('timecards')
+        pd.testing.assert_frame_equal(standalone.get_domain('timecards'), timecards_df)
+        
+        # Chaos on one domain does not depend on the other domains
+        subset = standalone._apply_chaos({'timecards': timecards_df})
+        pd.testing.assert_frame_equal(subset['timecards'], domains['timecards'])
+    
+    def test_seed_leaves_global_state_alone(self):
+        """Test seeded generation does not reseed the global RNGs."""
+        random.seed(0)
+        np.random.seed(0)
+        PayrollGenerator(employees=5, seed=42).get_domain('employees')
+        
+        assert random.random() == random.Random(0).random()
+        assert np.random.random() == np.random.RandomState(0).random_sample()
+    
+    def test_get_domain_generates_upstream_once(self, monkeypatch):
+        """Test lazy resolution generates each needed upstream domain exactly once."""
+        gen = PayrollGenerator(employees=5, start_date="2024-01-01", end_date="2024-01-07", seed=42)
+        calls = []
+        for domain_name in DOMAIN_DEPENDENCIES:
+            generate = getattr(gen, f"_generate_{domain_name}")
+            def counted(*args, _name=domain_name, _generate=generate, **kwargs):
+                calls.append(_name)
+                return _generate(*args, **kwargs)
+            monkeypatch.setattr(gen, f"_generate_{domain_name}", counted)
+        
+        timecards_df = gen.get_domain('timecards')
+        assert calls == ['jobs', 'cost_centers', 'employees', 'schedules', 'timecards']
+        assert gen.get_domain('timecards') is timecards_df
+        
+        gen.get_domain('payroll_runs')
+        assert calls[-1] == 'payroll_runs' and len(calls) == 6
+        
+        with pytest.raises(ValueError, match="Unknown domain"):
+            gen.get_domain('benefits')
+    
+    def test_compact_matches_default_output(self, tmp_path):
+        """Test compact dtypes shrink domains without changing the written data."""
+        domains, files = {}, {}
+        for compact in (False, True):
+            gen = PayrollGenerator(
+                employees=50, start_date="2024-01-01", end_date="2024-01-31",
+                seed=42, engine="numpy", compact=compact
+            )
+            output_dir = tmp_path / str(compact)
+            gen.generate_all_domains(output_path=str(output_dir), format="csv")
+            domains[compact] = {
+                name: gen.get_domain(name)
+                for name in ('employees', 'schedules', 'timecards', 'payroll_runs')
+            }
+            files[compact] = {
+                path.relative_to(output_dir): path.read_text() for path in output_dir.rglob("*.csv")
+            }
+        
+        assert files[True] == files[False]
+        default, compact = domains[False], domains[True]
+        assert compact['timecards']['employee_id'].dtype == np.int64
+        assert isinstance(compact['schedules']['shift_type'].dtype, pd.CategoricalDtype)
+        assert compact['payroll_runs']['gross_pay'].dtype == np.int64
+        for name in ('employees', 'schedules', 'timecards', 'payroll_runs'):
+            assert (
+                compact[name].memory_usage(deep=True).sum()
+                < default[name].memory_usage(deep=True).sum()
+            )
+    
+    def test_retro_runs_appended(self):
+        """Test correction runs follow the regular runs and reference them."""
+        gen = PayrollGenerator(
+            employees=30, start_date="2024-01-01", end_date="2024-03-31",
+            seed=42, engine="numpy", retro=RetroConfig(retro_pay_rate=0.05)
+        )
+        df = gen.get_domain('payroll_runs')
+        
+        regular = df[df['original_run_id'].isna()]
+        corrections = df[df['original_run_id'].notna()]
+        assert len(regular) > 0 and len(corrections) > 0
+        assert df.index[len(regular):].equals(corrections.index)
+        assert corrections['original_run_id'].isin(regular['run_id']).all()
+        assert corrections['run_id'].min() > regular['run_id'].max()
+    
+    def test_assignment_history_daily_snapshots(self, tmp_path):
+        """Test assignment history is generated only when configured, as daily change files."""
+        kwargs = dict(employees=20, start_date="2024-01-01", end_date="2024-01-31", seed=42)
+        with pytest.raises(ValueError, match="Unknown domain"):
+            PayrollGenerator(**kwargs).get_domain('assignment_history')
+        
+        gen = PayrollGenerator(history=AssignmentHistoryConfig(changes_per_year=12.0), **kwargs)
+        domains = gen.generate_all_domains(output_path=str(tmp_path), format="csv")
+        history = domains['assignment_history']
+        assert len(history) > len(domains['employees'])
+        
+        domain_dir = tmp_path / "domain=assignment_history"
+        parts = sorted(p.parent.name for p in domain_dir.rglob("*.csv"))
+        assert parts[0] == "snapshot_date=2024-01-01"
+        assert parts == sorted(f"snapshot_date={day}" for day in history['snapshot_date'].astype(str).unique())
+    
+    def test_org_tree(self):
+        """Test org settings re-assign managers and add the closure domain."""
+        gen = PayrollGenerator(
+            employees=200, seed=42, engine="numpy", org=OrgTreeConfig(max_depth=3, fan_out=4.0)
+        )
+        employees = gen.get_domain('employees')
+        closure = gen.get_domain('org_closure')
+        
+        assert employees['manager_id'].isna().sum() == 1
+        assert closure['distance'].max() == 2
+        assert len(closure[closure['distance'] == 1]) == employees['manager_id'].notna().sum()
+        with pytest.raises(ValueError, match="Unknown domain"):
+            PayrollGenerator(employees=5).get_domain('org_closure')
+    
+    def test_org_tree_with_history(self):
+        """Test assignment history manager changes stay inside the org tree."""
+        gen = PayrollGenerator(
+            employees=200, seed=42, engine="numpy",
+            org=OrgTreeConfig(max_depth=3, fan_out=4.0),
+            history=AssignmentHistoryConfig(changes_per_year=6.0)
+        )
+        employees = gen.get_domain('employees')
+        history = gen.get_domain('assignment_history')
+        
+        depth = pd.Series(org_depths(employees), index=employees['employee_number'])
+        changes = history[history['change_type'] == 'MANAGER_CHANGE']
+        assert len(changes) > 0
+        assert (depth[changes['manager_id']].to_numpy() == depth[changes['employee_number']].to_numpy() - 1).all()
+    
+    def test_compact_requires_numpy_engine(self):
+        """Test compact dtypes are rejected for the row-wise engine."""
+        with pytest.raises(ValueError, match="numpy engine"):
+            PayrollGenerator(employees=5, compact=True)
+    
     def test_employees_generation(self):
         """Test employee data has required columns."""
         gen = PayrollGenerator(employees=10, seed=42)
-        employees_df = gen._generate_employees()
+        employees_df = gen.get_domain('employees')
         
         required_columns = [
             'employee_number', 'first_name', 'last_name',
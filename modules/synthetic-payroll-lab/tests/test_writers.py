@@ -0,0 +1,302 @@
+"""Tests for output writers."""
+
+import json
+import pytest
+from datetime import date, datetime
+from decimal import Decimal
+import pandas as pd
+
+from synthetic_payroll_lab.chaos import SchemaDriftInjector
+from synthetic_payroll_lab.chaos.schema_drift import SCHEMA_VERSIONS_ATTR
+from synthetic_payroll_lab.compact import compact_frame, expand_compact
+from synthetic_payroll_lab.config import OutputConfig
+from synthetic_payroll_lab.writers import (
+    bigquery_schema,
+    write_bigquery_schema,
+    write_frame,
+    write_partitioned,
+    write_manifest
+)
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+requires_pyarrow = pytest.mark.skipif(pa is None, reason="pyarrow not installed")
+
+try:
+    import fastavro
+except ImportError:
+    fastavro = None
+
+requires_fastavro = pytest.mark.skipif(fastavro is None, reason="fastavro not installed")
+
+
+@pytest.fixture
+def payroll_df() -> pd.DataFrame:
+    return pd.DataFrame({
+        'run_id': [1001, 1001, 1002],
+        'period_start': [date(2024, 1, 1), date(2024, 1, 1), date(2024, 1, 16)],
+        'work_date': pd.to_datetime(['2024-01-02', '2024-01-03', None]),
+        'punch_in': [datetime(2024, 1, 2, 9), datetime(2024, 1, 3, 9), datetime(2024, 1, 16, 9)],
+        'employee_id': ['EMP000001', 'EMP000002', 'EMP000001'],
+        'gross_pay': [1234.57, 99.1, None],
+        'deduction_health': [0, 150, 300],
+    })
+
+
+class TestPartitionedWriter:
+    """Test Hive-partitioned writer."""
+
+    def test_write_partitioned(self, payroll_df, tmp_path):
+        """Test one directory per date with the key dropped from files."""
+        entries = write_partitioned(payroll_df, tmp_path, 'period_start', 'csv')
+
+        assert sorted(entry['path'] for entry in entries) == [
+            'period_start=2024-01-01/part-00000.csv',
+            'period_start=2024-01-16/part-00000.csv',
+        ]
+        part = pd.read_csv(tmp_path / 'period_start=2024-01-01' / 'part-00000.csv')
+        assert len(part) == 2
+        assert 'period_start' not in part.columns
+
+    def test_null_partition(self, payroll_df, tmp_path):
+        """Test null keys go to the Hive default partition."""
+        entries = write_partitioned(payroll_df, tmp_path, 'work_date', 'json', part_name='part-00003')
+
+        paths = {entry['path']: entry['rows'] for entry in entries}
+        assert paths['work_date=__HIVE_DEFAULT_PARTITION__/part-00003.json'] == 1
+        assert paths['work_date=2024-01-02/part-00003.json'] == 1
+
+    def test_manifest(self, payroll_df, tmp_path):
+        """Test manifest lists every partition with row counts."""
+        entries = write_partitioned(payroll_df, tmp_path, 'period_start', 'csv')
+        filepath = write_manifest(tmp_path, 'payroll_runs', 'period_start', 'csv', entries)
+
+        with open(filepath) as f:
+            manifest = json.load(f)
+        assert manifest['total_rows'] == 3
+        assert [p['rows'] for p in manifest['partitions']] == [2, 1]
+
+    def test_schema_versions(self, payroll_df, tmp_path):
+        """Test each partition only gets the drift columns of its version."""
+        SchemaDriftInjector().attach_progressive(
+            payroll_df, 'period_start', drift_interval_days=10, anchor_date=date(2024, 1, 1)
+        )
+        entries = write_partitioned(payroll_df, tmp_path, 'period_start', 'csv')
+        filepath = write_manifest(
+            tmp_path, 'payroll_runs', 'period_start', 'csv', entries,
+            schema=payroll_df.attrs[SCHEMA_VERSIONS_ATTR]
+        )
+
+        first = pd.read_csv(tmp_path / 'period_start=2024-01-01' / 'part-00000.csv')
+        second = pd.read_csv(tmp_path / 'period_start=2024-01-16' / 'part-00000.csv')
+        assert not any(col.startswith('drift_field_') for col in first.columns)
+        assert second['drift_field_1'].eq('Value_1').all()
+
+        with open(filepath) as f:
+            manifest = json.load(f)
+        assert [p['schema_version'] for p in manifest['partitions']] == [0, 1]
+        assert manifest['schema_versions'][1]['effective_from'] == '2024-01-11'
+        assert manifest['schema_versions'][1]['columns'][-1] == 'drift_field_1'
+
+        # Single files get the dense columns
+        filepath = write_frame(payroll_df, tmp_path / 'payroll_runs', 'csv')
+        assert pd.read_csv(filepath)['drift_field_1'].isna().tolist() == [True, True, False]
+
+    def test_missing_partition_column(self, payroll_df, tmp_path):
+        """Test unknown partition columns are rejected."""
+        with pytest.raises(ValueError):
+            write_partitioned(payroll_df, tmp_path, 'shift_date', 'csv')
+
+
+class TestCompactFrames:
+    """Test compact column representations."""
+
+    def test_compact_dtypes(self, payroll_df):
+        """Test IDs, dates and fractional money are stored compactly."""
+        compact = compact_frame(payroll_df)
+
+        assert compact['employee_id'].tolist() == [1, 2, 1]
+        assert compact['period_start'].dtype == 'datetime64[s]'
+        assert compact['gross_pay'].tolist()[:2] == [123457, 9910]
+        assert pd.isna(compact['gross_pay'].iloc[2])
+        # Whole-dollar columns and the input frame are left alone
+        assert compact['deduction_health'].dtype == payroll_df['deduction_health'].dtype
+        assert payroll_df['employee_id'].iloc[0] == 'EMP000001'
+        assert compact_frame(compact) is compact
+
+    def test_expand_roundtrip(self, payroll_df, tmp_path):
+        """Test text output of a compact frame matches the original."""
+        expanded = expand_compact(compact_frame(payroll_df))
+
+        assert expanded.to_csv(index=False) == payroll_df.to_csv(index=False)
+        assert expand_compact(payroll_df) is payroll_df
+
+        original = write_frame(payroll_df, tmp_path / "original", "csv")
+        compact = write_frame(compact_frame(payroll_df), tmp_path / "compact", "csv")
+        assert compact.read_text() == original.read_text()
+
+
+@requires_pyarrow
+class TestArrowWriters:
+    """Test Parquet and Feather writers."""
+
+    def test_parquet_typed_columns(self, payroll_df, tmp_path):
+        """Test dates and money are written with logical types."""
+        filepath = write_frame(payroll_df, tmp_path / "payroll_runs", "parquet")
+        assert filepath.suffix == ".parquet"
+
+        schema = pq.read_schema(filepath)
+        assert schema.field('period_start').type == pa.date32()
+        assert schema.field('work_date').type == pa.date32()
+        assert pa.types.is_timestamp(schema.field('punch_in').type)
+        assert schema.field('gross_pay').type == pa.decimal128(18, 2)
+        assert schema.field('deduction_health').type == pa.decimal128(18, 2)
+
+        table = pq.read_table(filepath)
+        assert table.column('gross_pay').to_pylist() == [Decimal('1234.57'), Decimal('99.10'), None]
+
+    def test_parquet_row_groups_and_compression(self, payroll_df, tmp_path):
+        """Test row group size and codec are configurable."""
+        output = OutputConfig(compression="zstd", row_group_size=2)
+        filepath = write_frame(payroll_df, tmp_path / "payroll_runs", "parquet", output)
+
+        metadata = pq.ParquetFile(filepath).metadata
+        assert metadata.num_row_groups == 2
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    def test_feather_roundtrip(self, payroll_df, tmp_path):
+        """Test Arrow IPC output keeps typed columns."""
+        filepath = write_frame(payroll_df, tmp_path / "payroll_runs", "feather")
+        assert filepath.suffix == ".feather"
+
+        table = feather.read_table(filepath)
+        assert table.num_rows == 3
+        assert table.schema.field('period_start').type == pa.date32()
+
+    def test_feather_rejects_unsupported_codec(self, payroll_df, tmp_path):
+        """Test Feather only accepts its own codecs."""
+        with pytest.raises(ValueError):
+            write_frame(payroll_df, tmp_path / "x", "feather", OutputConfig(compression="snappy"))
+
+    def test_parquet_compact_frame(self, payroll_df, tmp_path):
+        """Test compact IDs and cents are written with the same logical types."""
+        filepath = write_frame(compact_frame(payroll_df), tmp_path / "payroll_runs", "parquet")
+
+        table = pq.read_table(filepath)
+        assert table.schema.field('period_start').type == pa.date32()
+        assert table.schema.field('gross_pay').type == pa.decimal128(18, 2)
+        assert table.column('gross_pay').to_pylist() == [Decimal('1234.57'), Decimal('99.10'), None]
+        assert table.column('employee_id').to_pylist() == ['EMP000001', 'EMP000002', 'EMP000001']
+
+    def test_parquet_schema_versions(self, payroll_df, tmp_path, recwarn):
+        """Test drift columns are written without serializing the schema attrs."""
+        SchemaDriftInjector().attach_progressive(
+            payroll_df, 'period_start', drift_interval_days=10, anchor_date=date(2024, 1, 1)
+        )
+        filepath = write_frame(payroll_df, tmp_path / "payroll_runs", "parquet")
+
+        assert 'drift_field_1' in pq.read_schema(filepath).names
+        assert not [w for w in recwarn if 'attrs' in str(w.message)]
+        assert SCHEMA_VERSIONS_ATTR in payroll_df.attrs
+
+    def test_unsupported_format(self, payroll_df, tmp_path):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            write_frame(payroll_df, tmp_path / "x", "xml")
+
+
+class TestBigQueryWriters:
+    """Test BigQuery load-ready NDJSON and Avro writers."""
+
+    def test_schema(self, payroll_df, tmp_path):
+        """Test columns map to BigQuery types and partition columns can be left out."""
+        types = {field['name']: field['type'] for field in bigquery_schema(payroll_df)}
+        assert types == {
+            'run_id': 'INTEGER',
+            'period_start': 'DATE',
+            'work_date': 'DATE',
+            'punch_in': 'DATETIME',
+            'employee_id': 'STRING',
+            'gross_pay': 'NUMERIC',
+            'deduction_health': 'NUMERIC',
+        }
+        assert bigquery_schema(compact_frame(payroll_df)) == bigquery_schema(payroll_df)
+
+        filepath = write_bigquery_schema(payroll_df, tmp_path, exclude=['work_date'])
+        fields = json.loads(filepath.read_text())
+        assert filepath.name == "_schema.json"
+        assert 'work_date' not in [field['name'] for field in fields]
+        assert all(field['mode'] == 'NULLABLE' for field in fields)
+
+    def test_ndjson_typed_values(self, payroll_df, tmp_path):
+        """Test NDJSON writes dates as ISO strings and chunking leaves output unchanged."""
+        filepath = write_frame(payroll_df, tmp_path / "payroll_runs", "ndjson")
+        assert filepath.suffix == ".ndjson"
+
+        records = [json.loads(line) for line in filepath.read_text().splitlines()]
+        assert records[0]['period_start'] == '2024-01-01'
+        assert records[0]['punch_in'] == '2024-01-02T09:00:00.000000'
+        assert records[0]['gross_pay'] == 1234.57
+        assert records[2]['work_date'] is None and records[2]['gross_pay'] is None
+
+        chunked = write_frame(
+            payroll_df, tmp_path / "chunked", "ndjson", OutputConfig(chunk_rows=2)
+        )
+        assert chunked.read_text() == filepath.read_text()
+
+    def test_ndjson_exact_numbers(self, payroll_df, tmp_path):
+        """Test money has no float noise and nullable integers are not floats."""
+        payroll_df['gross_pay'] = [2143.16, 0.1 + 0.2, None]
+        payroll_df['original_run_id'] = pd.array([1001, None, 1002], dtype='Int64')
+        filepath = write_frame(payroll_df, tmp_path / "payroll_runs", "ndjson")
+
+        lines = filepath.read_text().splitlines()
+        assert '"gross_pay":2143.16,' in lines[0]
+        assert '"gross_pay":0.3,' in lines[1]
+        assert lines[0].endswith('"original_run_id":1001}')
+        assert lines[1].endswith('"original_run_id":null}')
+
+    def test_json_far_future_dates(self, payroll_df, tmp_path):
+        """Test JSON uses the typed encoding, so 9999-12-31 end dates do not overflow."""
+        payroll_df['effective_end_date'] = date(9999, 12, 31)
+        filepath = write_frame(payroll_df, tmp_path / "payroll_runs", "json")
+        assert filepath.suffix == ".json"
+
+        records = [json.loads(line) for line in filepath.read_text().splitlines()]
+        assert records[0]['effective_end_date'] == '9999-12-31'
+        assert records[0]['period_start'] == '2024-01-01'
+
+    @requires_fastavro
+    def test_avro_logical_types(self, payroll_df, tmp_path):
+        """Test Avro output round-trips dates and decimals, compact or not."""
+        output = OutputConfig(chunk_rows=2)
+        filepath = write_frame(payroll_df, tmp_path / "payroll_runs", "avro", output)
+        assert filepath.suffix == ".avro"
+
+        with open(filepath, "rb") as f:
+            reader = fastavro.reader(f)
+            assert reader.codec == "deflate"
+            records = list(reader)
+        assert records[0]['period_start'] == date(2024, 1, 1)
+        assert records[1]['gross_pay'] == Decimal('99.10')
+        assert records[2]['gross_pay'] is None and records[2]['work_date'] is None
+        assert records[2]['deduction_health'] == Decimal('300.00')
+
+        compact = write_frame(compact_frame(payroll_df), tmp_path / "compact", "avro", output)
+        with open(compact, "rb") as f:
+            assert list(fastavro.reader(f)) == records
+
+    @requires_fastavro
+    def test_avro_rejects_unsupported_codec(self, payroll_df, tmp_path):
+        """Test Avro only accepts codecs it can write."""
+        with pytest.raises(ValueError):
+            write_frame(payroll_df, tmp_path / "x", "avro", OutputConfig(compression="brotli"))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])